@@ -0,0 +1,193 @@
+"""Headless benchmark of app.py: cold start, per-page rerun latency and memory.
+
+Drives the app with Streamlit's AppTest through every page of the sidebar
+menu, pressing each page's main button (and sending a chat message), and
+reports latency percentiles and peak traced memory per page::
+
+    python benchmarks/bench_app.py                    # compare with baseline.json
+    python benchmarks/bench_app.py --update-baseline  # record a new baseline
+
+Exits with status 1 if the cold start, any page's p95 latency or peak
+memory regresses past the baseline by more than the tolerance. Baselines
+are machine-specific; record one on the machine that runs the check.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Button (label prefix) pressed on each page after the plain rerun.
+ACTIONS = {
+    "Crop Recommendation": "🌾 Get Recommendations",
+    "Market Forecast": "Show Forecast",
+    "State Insights": "📊 Show Graph",
+    "Weather Insights": "Get 7-Day Forecast",
+    "Disease Detection": "Diagnose Disease",
+    "Loan Calculator": "Calculate",
+    "Fertilizer Calculator": "Calculate",
+    "Water Management": "Calculate",
+    "Chatbot": "Send",
+}
+CHAT_MESSAGE = "How do I control pink bollworm in cotton?"
+
+# Regressions below this many milliseconds are treated as noise.
+NOISE_FLOOR_MS = 5.0
+
+_COLD_START = """
+import sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+assert not at.exception, at.exception
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(runs):
+    """Seconds for a fresh interpreter to import Streamlit and run app.py once."""
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _COLD_START, APP], capture_output=True,
+                             text=True, check=True, cwd=ROOT)
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(times)
+
+
+def _timed_run(at, action=None):
+    start = time.perf_counter()
+    if action is None:
+        at.run()
+    else:
+        action()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception)
+    return elapsed
+
+
+def _action(at, page):
+    label = ACTIONS.get(page)
+    if label is None:
+        return None
+    if page == "Chatbot":
+        def send():
+            at.text_input(key="chat_input").input(CHAT_MESSAGE)
+            next(b for b in at.button if b.label == label).click().run()
+        return send
+
+    def press():
+        next(b for b in at.button if b.label.startswith(label)).click().run()
+    return press
+
+
+def bench_pages(reps, pages=None):
+    """``{name: {"p50_ms", "p95_ms", "max_ms", "peak_kb"}}`` for every page and action."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=120).run()
+    menu = at.sidebar.radio[0].options
+    results = {}
+    for page in pages or menu:
+        at.sidebar.radio[0].set_value(page).run()
+        steps = {page: None}
+        if page in ACTIONS:
+            steps[f"{page} [{ACTIONS[page]}]"] = _action(at, page)
+
+        for name, step in steps.items():
+            _timed_run(at, step)  # warm-up
+            latencies = np.array([_timed_run(at, step) for _ in range(reps)]) * 1000
+            tracemalloc.start()
+            _timed_run(at, step)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[name] = {
+                "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+                "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+                "max_ms": round(float(latencies.max()), 2),
+                "peak_kb": round(peak / 1024, 1),
+            }
+    return results
+
+
+def compare(current, baseline, tolerance):
+    """Return a list of regression messages (empty if none).
+
+    A page or action without a baseline entry is reported too, so new pages
+    cannot silently escape the check.
+    """
+    failures = []
+    limit = 1 + tolerance
+    if current["cold_start_s"] > baseline.get("cold_start_s", float("inf")) * limit:
+        failures.append(f"cold start {current['cold_start_s']:.2f}s > "
+                        f"baseline {baseline['cold_start_s']:.2f}s")
+    for name, stats in current["pages"].items():
+        base = baseline.get("pages", {}).get(name)
+        if base is None:
+            failures.append(f"{name}: no baseline; re-record with --update-baseline")
+            continue
+        if stats["p95_ms"] > max(base["p95_ms"] * limit, base["p95_ms"] + NOISE_FLOOR_MS):
+            failures.append(f"{name}: p95 {stats['p95_ms']:.1f} ms > baseline {base['p95_ms']:.1f} ms")
+        if stats["peak_kb"] > base["peak_kb"] * limit + 256:
+            failures.append(f"{name}: peak {stats['peak_kb']:.0f} KB > "
+                            f"baseline {base['peak_kb']:.0f} KB")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reps", type=int, default=10, help="timed reruns per page (default 10)")
+    parser.add_argument("--cold-runs", type=int, default=3, help="cold starts, best is kept")
+    parser.add_argument("--pages", nargs="+", help="only these pages")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown before failing, as a fraction (default 0.5)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    current = {"cold_start_s": round(cold_start(args.cold_runs), 3),
+               "pages": bench_pages(args.reps, args.pages)}
+
+    print(f"cold start: {current['cold_start_s']:.2f}s")
+    print(f"{'page':<45} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'peak KB':>9}")
+    for name, s in current["pages"].items():
+        print(f"{name:<45} {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['max_ms']:>8.1f} "
+              f"{s['peak_kb']:>9.0f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+
+    if args.update_baseline:
+        if args.pages and os.path.exists(args.baseline):
+            # Keep the recorded entries of the pages that were not benchmarked
+            with open(args.baseline, encoding="utf-8") as f:
+                recorded = json.load(f)
+            current = {**recorded, "cold_start_s": current["cold_start_s"],
+                       "pages": {**recorded.get("pages", {}), **current["pages"]}}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("no baseline; run with --update-baseline to record one")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        failures = compare(current, json.load(f), args.tolerance)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    print("OK" if not failures else f"{len(failures)} regression(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
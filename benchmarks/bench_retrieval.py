@@ -0,0 +1,74 @@
+"""Latency benchmark for the advisory passage index.
+
+Builds indexes over synthetic corpora (Zipf-distributed vocabulary, ~60
+words per passage) and reports build time and query latency percentiles::
+
+    python benchmarks/bench_retrieval.py --sizes 10000 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from smartagri.retrieval import PassageIndex, build_index  # noqa: E402
+
+VOCAB_SIZE = 50_000
+WORDS_PER_PASSAGE = 60
+
+
+def synthetic_corpus(n_passages, seed=0):
+    rng = np.random.default_rng(seed)
+    words = np.array([f"term{i}" for i in range(VOCAB_SIZE)])
+    ranks = np.minimum(rng.zipf(1.2, n_passages * WORDS_PER_PASSAGE), VOCAB_SIZE) - 1
+    for i in range(n_passages):
+        chunk = words[ranks[i * WORDS_PER_PASSAGE:(i + 1) * WORDS_PER_PASSAGE]]
+        yield f"doc{i // 20}.md", " ".join(chunk)
+
+
+def queries(n, seed=1):
+    rng = np.random.default_rng(seed)
+    ranks = np.minimum(rng.zipf(1.2, (n, 4)), VOCAB_SIZE) - 1
+    return [" ".join(f"term{r}" for r in row) for row in ranks]
+
+
+def bench(n_passages, n_queries, k):
+    with tempfile.TemporaryDirectory() as tmp:
+        index_dir = os.path.join(tmp, "index")
+        start = time.perf_counter()
+        build_index(synthetic_corpus(n_passages), index_dir)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = PassageIndex(index_dir)
+        load = time.perf_counter() - start
+
+        latencies = []
+        for query in queries(n_queries):
+            start = time.perf_counter()
+            index.search(query, k)
+            latencies.append(time.perf_counter() - start)
+        latencies = np.array(latencies) * 1000
+        print(f"{n_passages:>9,} passages | build {build:6.2f}s | load {load * 1000:6.1f} ms | "
+              f"query p50 {np.percentile(latencies, 50):6.2f} ms  "
+              f"p95 {np.percentile(latencies, 95):6.2f} ms  "
+              f"max {latencies.max():6.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("-k", type=int, default=3)
+    args = parser.parse_args(argv)
+    for n in args.sizes:
+        bench(n, args.queries, args.k)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
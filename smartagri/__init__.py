@@ -0,0 +1,15 @@
+"""SmartAgri AI core logic, usable without the Streamlit UI.
+
+Submodules are imported explicitly (``from smartagri.loans import compute_emi``)
+so that importing the package itself stays cheap:
+
+- ``crops``: crop-suitability scoring and the crop calendar
+- ``chatbot``: keyword-based assistant responses
+- ``loans``: EMI calculations
+- ``fertilizer``: NPK requirement and fertilizer quantities
+- ``weather``: weather advisories
+- ``disease``: crop disease lookup
+- ``profile``: farmer profile helpers
+- ``lang``: UI strings
+- ``regions``: states and union territories
+"""
@@ -0,0 +1,219 @@
+"""Streaming batch crop recommendations for large farm lists.
+
+Reads a CSV or Parquet file in bounded-size chunks, scores every farm with
+the crop-suitability engine and appends results to the output file as it
+goes, so memory use stays flat regardless of input size::
+
+    python -m smartagri.batch farms.csv recommendations.csv --chunksize 50000
+
+Input columns (case-insensitive): ``soil``, ``rainfall``, ``temperature``
+(or ``temp``), ``humidity``, ``ph``, ``season`` and optionally ``state``.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from smartagri.crops import CROP_NAMES, rank_crops, score_crops
+
+INPUT_COLUMNS = ("soil", "rainfall", "temperature", "humidity", "ph", "season", "state")
+REQUIRED_COLUMNS = INPUT_COLUMNS[:-1]
+NUMERIC_COLUMNS = ("rainfall", "temperature", "humidity", "ph")
+COLUMN_ALIASES = {"temp": "temperature"}
+
+DEFAULT_CHUNKSIZE = 50_000
+
+_CROP_ARRAY = np.array(CROP_NAMES, dtype=object)
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def _resolve_columns(header, keep):
+    """Map canonical input names (and kept columns) to names in the file."""
+    lookup = {name.strip().lower(): name for name in header}
+    for alias, canonical in COLUMN_ALIASES.items():
+        if alias in lookup and canonical not in lookup:
+            lookup[canonical] = lookup[alias]
+    missing = [c for c in REQUIRED_COLUMNS if c not in lookup]
+    if missing:
+        raise ValueError(f"input is missing required columns: {', '.join(missing)}")
+    unknown = [c for c in keep if c not in header]
+    if unknown:
+        raise ValueError(f"--keep columns not in input: {', '.join(unknown)}")
+    return {c: lookup[c] for c in INPUT_COLUMNS if c in lookup}
+
+
+def _read_header(path):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).schema_arrow.names
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def iter_chunks(path, columns, chunksize=DEFAULT_CHUNKSIZE, text_columns=()):
+    """Yield DataFrames of at most ``chunksize`` rows holding ``columns``.
+
+    CSV ``text_columns`` are read as strings, so their type cannot change
+    from one chunk to the next.
+    """
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize,
+                               dtype={c: str for c in text_columns})
+
+
+def output_schema(input_path, keep=(), top_k=5):
+    """Arrow schema of the output: kept columns, then ``crop_i`` / ``score_i``.
+
+    Fixed up front so every chunk is written with the same types, even when
+    a chunk has only invalid rows (all-null crops) or a kept column would
+    infer differently. Kept columns take their type from a Parquet input and
+    are strings for a CSV input.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    source = pq.ParquetFile(input_path).schema_arrow if _is_parquet(input_path) else None
+    fields = [source.field(c) if source is not None else pa.field(c, pa.string()) for c in keep]
+    for rank in range(min(top_k, len(CROP_NAMES))):
+        fields += [pa.field(f"crop_{rank + 1}", pa.string()), pa.field(f"score_{rank + 1}", pa.float32())]
+    return pa.schema(fields)
+
+
+def recommend_frame(frame, columns=None, top_k=5):
+    """Top ``top_k`` crops and scores for every row of ``frame``.
+
+    ``columns`` maps canonical input names to column names in ``frame``
+    (defaults to the canonical names). Rows with missing numeric inputs get
+    empty recommendations.
+    """
+    columns = columns or {c: c for c in INPUT_COLUMNS if c in frame}
+    numeric = {c: pd.to_numeric(frame[columns[c]], errors="coerce").to_numpy(np.float32)
+               for c in NUMERIC_COLUMNS}
+    state = frame[columns["state"]].to_numpy() if "state" in columns else None
+    total, _ = score_crops(numeric["rainfall"], numeric["temperature"], numeric["humidity"],
+                           numeric["ph"], frame[columns["soil"]].to_numpy(),
+                           frame[columns["season"]].to_numpy(), state)
+
+    idx = rank_crops(total, top_k)
+    crops = _CROP_ARRAY[idx]
+    scores = np.take_along_axis(total, idx, axis=1).round(4)
+    invalid = np.isnan(np.column_stack(list(numeric.values()))).any(axis=1)
+    crops[invalid] = None
+    scores[invalid] = np.nan
+
+    out = {}
+    for rank in range(idx.shape[1]):
+        out[f"crop_{rank + 1}"] = crops[:, rank]
+        out[f"score_{rank + 1}"] = scores[:, rank]
+    return pd.DataFrame(out, index=frame.index)
+
+
+class _Writer:
+    """Incremental CSV/Parquet writer."""
+
+    def __init__(self, path, schema=None):
+        self.path = path
+        self.schema = schema
+        self._parquet = _is_parquet(path)
+        self._handle = None
+
+    def write(self, frame):
+        if self._parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+            if self._handle is None:
+                self._handle = pq.ParquetWriter(self.path, table.schema)
+            self._handle.write_table(table)
+        else:
+            if self._handle is None:
+                self._handle = open(self.path, "w", newline="", encoding="utf-8")
+                frame.to_csv(self._handle, index=False)
+            else:
+                frame.to_csv(self._handle, index=False, header=False)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+
+
+def run(input_path, output_path, chunksize=DEFAULT_CHUNKSIZE, top_k=5, keep=(), progress=None):
+    """Score ``input_path`` chunk by chunk into ``output_path``.
+
+    ``progress`` is called as ``progress(rows_done, elapsed_seconds)`` after
+    every chunk. Returns ``(rows, elapsed_seconds)``.
+    """
+    columns = _resolve_columns(_read_header(input_path), keep)
+    usecols = list(dict.fromkeys(list(keep) + list(columns.values())))
+
+    writer = _Writer(output_path, output_schema(input_path, keep, top_k)
+                     if _is_parquet(output_path) else None)
+    rows = 0
+    start = time.perf_counter()
+    try:
+        for chunk in iter_chunks(input_path, usecols, chunksize, keep):
+            result = recommend_frame(chunk, columns, top_k)
+            if keep:
+                result = pd.concat([chunk[list(keep)], result], axis=1)
+            writer.write(result)
+            rows += len(chunk)
+            if progress:
+                progress(rows, time.perf_counter() - start)
+    finally:
+        writer.close()
+    return rows, time.perf_counter() - start
+
+
+def _report(rows, elapsed):
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"\r{rows:,} rows  {rate:,.0f} rows/sec", end="", file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m smartagri.batch",
+        description="Crop recommendations for every farm in a CSV or Parquet file.")
+    parser.add_argument("input", help="farm list (.csv or .parquet)")
+    parser.add_argument("output", help="where to write recommendations (.csv or .parquet)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNKSIZE:,})")
+    parser.add_argument("--top-k", type=int, default=5, help="crops per farm (default 5)")
+    parser.add_argument("--keep", default="",
+                        help="comma-separated input columns to copy to the output, e.g. farm_id")
+    parser.add_argument("--quiet", action="store_true", help="do not report progress")
+    args = parser.parse_args(argv)
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+
+    keep = tuple(c for c in args.keep.split(",") if c)
+    try:
+        rows, elapsed = run(args.input, args.output, args.chunksize, args.top_k, keep,
+                            progress=None if args.quiet else _report)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    except ImportError:
+        print("error: Parquet files need pyarrow (pip install pyarrow)", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"Scored {rows:,} farms in {elapsed:.1f}s ({rate:,.0f} rows/sec) -> {args.output}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""Plotly figures for the app pages, cached and sized for the browser.
+
+Each chart builder is memoized on a hash of its inputs (arrays are hashed
+by content), so a rerun with unchanged inputs reuses the finished figure
+instead of rebuilding and re-validating it. Streamlit serializes a cached
+figure without validating it again.
+
+Long series are decimated before plotting with Largest-Triangle-Three-
+Buckets (LTTB), which keeps the visual shape (peaks and troughs) of a line
+with about one point per pixel column, so the JSON sent to the browser
+stays small however long the price history grows. Series that still have
+more than ``WEBGL_THRESHOLD`` points are drawn with ``Scattergl``.
+"""
+import functools
+import hashlib
+
+import numpy as np
+
+from smartagri.memo import LRUCache
+
+# Points kept per line after decimation (about the width of a chart in pixels).
+MAX_POINTS = 1500
+
+# Lines with more points than this are drawn with WebGL.
+WEBGL_THRESHOLD = 1000
+
+FIGURE_CACHE_SIZE = 64
+
+_figures = LRUCache(FIGURE_CACHE_SIZE)
+
+
+# ----------------------------
+# DECIMATION
+# ----------------------------
+def _numeric(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[s]").astype(np.float64)
+    if not np.issubdtype(x.dtype, np.number):
+        return np.arange(len(x), dtype=np.float64)
+    return x.astype(np.float64)
+
+
+def lttb(x, y, n_out=MAX_POINTS):
+    """Indices of the ``n_out`` points of ``(x, y)`` picked by LTTB.
+
+    The first and last points are always kept. The points in between are
+    split into ``n_out - 2`` equal buckets and each bucket keeps the point
+    forming the largest triangle with the point kept from the previous
+    bucket and the mean of the next one. Returns all indices when the
+    series is already short enough.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _numeric(x)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of every bucket, with the last point as the "next bucket" of the final one
+    sums_x = np.add.reduceat(x[:-1], edges[:-1])
+    sums_y = np.add.reduceat(y[:-1], edges[:-1])
+    counts = np.diff(edges)
+    next_x = np.append(sums_x[1:] / counts[1:], x[-1])
+    next_y = np.append(sums_y[1:] / counts[1:], y[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def decimate(x, y, n_out=MAX_POINTS):
+    """``(x, y)`` reduced to at most ``n_out`` points with LTTB."""
+    x, y = np.asarray(x), np.asarray(y)
+    if len(y) <= n_out:
+        return x, y
+    keep = lttb(x, y, n_out)
+    return x[keep], y[keep]
+
+
+def line_trace(x, y, **kwargs):
+    """A decimated ``Scatter`` line, or ``Scattergl`` when it is still long."""
+    import plotly.graph_objects as go
+
+    x, y = decimate(x, y)
+    trace = go.Scattergl if len(y) > WEBGL_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, mode=kwargs.pop("mode", "lines"), **kwargs)
+
+
+# ----------------------------
+# FIGURE CACHE
+# ----------------------------
+def _hash_part(digest, part):
+    if isinstance(part, np.ndarray):
+        digest.update(f"{part.dtype}{part.shape}".encode())
+        if part.dtype == object:
+            # The buffer of an object array holds pointers; hash the values themselves
+            _hash_part(digest, part.tolist())
+        else:
+            digest.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(part, (list, tuple)):
+        digest.update(f"{type(part).__name__}[{len(part)}]".encode())
+        for item in part:
+            _hash_part(digest, item)
+    else:
+        digest.update(f"{type(part).__name__}:{part!r}".encode())
+    digest.update(b"\0")
+
+
+def input_hash(*parts):
+    """Content hash of chart inputs; arrays are hashed by dtype, shape and bytes
+    (object arrays by their values).
+
+    Other values are hashed exactly as given, with their type: titles or trace
+    names that differ only in case or spacing get different figures.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _hash_part(digest, part)
+    return digest.hexdigest()
+
+
+def cached_figure(build):
+    """Memoize a figure builder on the hash of its arguments.
+
+    Cached figures are shared by every session, so callers must not modify
+    them.
+    """
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs):
+        key = (build.__name__, input_hash(*args, *sorted(kwargs.items())))
+        found, fig = _figures.get(key)
+        if not found:
+            fig = build(*args, **kwargs)
+            _figures.set(key, fig)
+        return fig
+
+    return wrapper
+
+
+def clear_cache():
+    _figures.clear()
+
+
+# ----------------------------
+# CHARTS
+# ----------------------------
+@cached_figure
+def crop_comparison_chart(crops, yield_index, profit_potential, risk, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name="Yield Index", x=crops, y=yield_index, marker_color="#4B8B3B"))
+    fig.add_trace(go.Bar(name="Profit Potential", x=crops, y=profit_potential,
+                         marker_color="#FFD700"))
+    fig.add_trace(go.Bar(name="Risk Factor", x=crops, y=risk, marker_color="#FF6B6B"))
+    fig.update_layout(title="Comprehensive Crop Comparison", barmode="group", template=template,
+                      xaxis_title="Crops", yaxis_title="Score")
+    return fig
+
+
+@cached_figure
+def price_forecast_chart(crop, hist_dates, hist_prices, dates, prices, lower, upper, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(line_trace(hist_dates, hist_prices, name="History",
+                             line=dict(color="#4B8B3B")))
+    fig.add_trace(go.Scatter(x=np.concatenate([dates, dates[::-1]]),
+                             y=np.concatenate([upper, lower[::-1]]),
+                             fill="toself", fillcolor="rgba(255,215,0,0.25)",
+                             line=dict(width=0), name="80% range", hoverinfo="skip"))
+    fig.add_trace(line_trace(dates, prices, name="Forecast",
+                             line=dict(color="#FFD700", dash="dash")))
+    fig.update_layout(title=f"{len(dates)}-Day Price Forecast: {crop}", xaxis_title="Date",
+                      yaxis_title="Price (₹/quintal)", template=template)
+    return fig
+
+
+@cached_figure
+def loan_breakdown_chart(principal, interest, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(labels=["Principal", "Interest"], values=[principal, interest],
+                                 hole=.3, marker_colors=["#4B8B3B", "#FFD700"])])
+    fig.update_layout(title="Loan Payment Distribution", template=template)
+    return fig
+
+
+@cached_figure
+def portfolio_chart(months, principal, interest, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=months, y=principal, name="Principal", marker_color="#4B8B3B"))
+    fig.add_trace(go.Bar(x=months, y=interest, name="Interest", marker_color="#FFD700"))
+    fig.update_layout(barmode="stack", title="Portfolio Repayments by Month",
+                      xaxis_title="Month", yaxis_title="₹", template=template)
+    return fig
+
+
+@cached_figure
+def state_crops_chart(crops, production, title, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(x=crops, y=production, marker_color="#4B8B3B"))
+    fig.update_layout(title=title, xaxis_title="Crop", yaxis_title="Production (tonnes)",
+                      template=template)
+    return fig
+
+
+@cached_figure
+def crop_trend_chart(years, area, yields, title, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=years, y=area, name="Area (ha)", marker_color="#4B8B3B"))
+    fig.add_trace(go.Scatter(x=years, y=yields, name="Yield (t/ha)", yaxis="y2",
+                             mode="lines+markers", line=dict(color="#FFD700")))
+    fig.update_layout(title=title, xaxis_title="Year", yaxis_title="Area (ha)",
+                      yaxis2=dict(title="Yield (t/ha)", overlaying="y", side="right"),
+                      template=template)
+    return fig
+
+
+@cached_figure
+def water_balance_chart(dates, etc, rain, irrigation, depletion, raw, title, template):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=dates, y=rain, name="Rain (mm)", marker_color="#1E90FF"))
+    fig.add_trace(go.Bar(x=dates, y=irrigation, name="Irrigation (mm)", marker_color="#4B8B3B"))
+    fig.add_trace(go.Scatter(x=dates, y=etc, name="Crop ET (mm)", mode="lines",
+                             line=dict(color="#FFD700")))
+    fig.add_trace(go.Scatter(x=dates, y=depletion, name="Root-zone depletion (mm)", yaxis="y2",
+                             mode="lines", line=dict(color="#8B4513")))
+    fig.add_hline(y=raw, yref="y2", line_dash="dot", line_color="#8B4513",
+                  annotation_text="Irrigate above")
+    fig.update_layout(title=title, xaxis_title="Date", yaxis_title="mm/day",
+                      yaxis2=dict(title="Depletion (mm)", overlaying="y", side="right",
+                                  autorange="reversed"),
+                      template=template)
+    return fig
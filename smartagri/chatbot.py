@@ -0,0 +1,86 @@
+"""Keyword-based farming assistant."""
+import functools
+
+from smartagri.matcher import KeywordMatcher
+
+KNOWLEDGE = {
+    "rice": "Rice cultivation: Best in clayey soil, needs 1500-2000mm rainfall, 25-35°C. Kharif crop, 4-6 months. Varieties: Basmati, IR-64.",
+    "wheat": "Wheat: Loamy soil, 600-800mm rainfall, 15-25°C. Rabi crop, 4-5 months. Varieties: HD-2967, PBW-343.",
+    "cotton": "Cotton: Black soil, 600-1200mm rainfall, 21-27°C. Kharif crop, 5-6 months. Requires pest management.",
+    "pm kisan": "PM-KISAN: ₹6,000/year to farmers. ₹2,000 every 4 months. Register at pmkisan.gov.in",
+    "loan": "Agricultural loans: KCC provides up to ₹3 lakhs at 7% interest (4% after subsidy).",
+    "soil test": "Soil testing: Test every 2-3 years for NPK. Cost: ₹50-200. Visit nearest KVK.",
+    "irrigation": "Drip irrigation saves 40-60% water. Sprinkler saves 20-30%. Government subsidies available."
+}
+
+# Extra keywords (synonyms, Hindi and Tamil) for each KNOWLEDGE entry.
+KEYWORD_ALIASES = {
+    "rice": ["paddy", "धान", "चावल", "நெல்", "அரிசி"],
+    "wheat": ["गेहूं", "गेहूँ", "கோதுமை"],
+    "cotton": ["कपास", "பருத்தி"],
+    "pm kisan": ["pm-kisan", "pmkisan", "पीएम किसान", "पीएम-किसान", "பிஎம் கிசான்"],
+    "loan": ["kcc", "kisan credit card", "ऋण", "लोन", "கடன்"],
+    "soil test": ["soil testing", "मिट्टी जांच", "मृदा परीक्षण", "மண் பரிசோதனை"],
+    "irrigation": ["drip", "sprinkler", "सिंचाई", "பாசனம்"],
+}
+
+GREETINGS = ["hello", "hi", "namaste", "नमस्ते", "வணக்கம்"]
+HELP_KEYWORDS = ["help", "मदद", "உதவி"]
+
+GREETING_RESPONSE = "🙏 Namaste! I'm SmartAgri AI. Ask me about crops, loans, schemes, or farming practices!"
+HELP_RESPONSE = "I can help with: 🌾 Crops, 💰 Loans, 🏛️ Schemes, 💧 Irrigation, 🦗 Pests, 📈 Markets. Ask anything!"
+DEFAULT_RESPONSE = "I can help with farming questions. Try asking about crops, PM-KISAN, loans, or soil testing!"
+
+# Minimum BM25 score for a retrieved advisory passage to be used as an answer.
+MIN_PASSAGE_SCORE = 2.0
+
+
+def build_matcher(knowledge=KNOWLEDGE, aliases=KEYWORD_ALIASES):
+    """Compile knowledge, greeting and help keywords into one matcher.
+
+    Values are ``(tier, response)``: knowledge answers (tier 0) outrank
+    greetings (1), which outrank help (2).
+    """
+    entries = []
+    for keyword, response in knowledge.items():
+        for kw in [keyword] + list(aliases.get(keyword, [])):
+            entries.append((kw, (0, response)))
+    entries += [(kw, (1, GREETING_RESPONSE)) for kw in GREETINGS]
+    entries += [(kw, (2, HELP_RESPONSE)) for kw in HELP_KEYWORDS]
+    return KeywordMatcher(entries)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_matcher():
+    return build_matcher()
+
+
+def _ranked(user_input, matcher=None):
+    return sorted((matcher or _default_matcher()).match(user_input), key=lambda m: m[0])
+
+
+def match_responses(user_input, matcher=None):
+    """All responses whose keywords appear in ``user_input``, best first."""
+    return [response for _, response in _ranked(user_input, matcher)]
+
+
+def search_passages(user_input, k=3):
+    """Top ``k`` ``(score, passage, source)`` hits from the advisory index."""
+    from smartagri.retrieval import search
+
+    return [hit for hit in search(user_input, k) if hit[0] >= MIN_PASSAGE_SCORE]
+
+
+def get_chatbot_response(user_input):
+    # Curated knowledge answers first, then the advisory corpus, then
+    # greetings/help.
+    matches = _ranked(user_input)
+    if matches and matches[0][0] == 0:
+        return matches[0][1]
+
+    passages = search_passages(user_input, k=1)
+    if passages:
+        _, passage, source = passages[0]
+        return f"📚 {passage} (Source: {source})"
+
+    return matches[0][1] if matches else DEFAULT_RESPONSE
@@ -0,0 +1,116 @@
+"""Bounded chat history for long-lived sessions.
+
+``ChatLog`` keeps the most recent messages in a fixed-size ring buffer of
+slotted records. Older messages are appended to a per-session JSON Lines
+file on disk instead of staying in memory, and the message count is kept
+as a running total, so a session's memory use stops growing with the
+length of the conversation.
+
+Spilled logs hold farmers' conversations, so they live under the app's
+``data/chat_logs`` folder, readable only by the user running the app.
+"""
+import glob
+import json
+import os
+import time
+import uuid
+from collections import deque
+
+DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "data", "chat_logs")
+
+# Messages kept in memory per session.
+DEFAULT_WINDOW = 20
+
+# Spilled logs older than this are deleted.
+LOG_RETENTION = 7 * 24 * 3600
+
+# Old logs are pruned on a spill at most this often.
+PRUNE_INTERVAL = 3600
+
+# log_dir -> time of the last prune
+_last_prune = {}
+
+
+class ChatMessage:
+    __slots__ = ("role", "content", "time")
+
+    def __init__(self, role, content, time=None):
+        self.role = role
+        self.content = content
+        self.time = time
+
+
+class ChatLog:
+    """Chat messages of one session: recent ones in memory, the rest on disk."""
+
+    def __init__(self, window=DEFAULT_WINDOW, log_dir=DEFAULT_LOG_DIR):
+        self.log_dir = log_dir
+        self.session_id = uuid.uuid4().hex
+        self._recent = deque(maxlen=window)
+        self._count = 0
+        self._spilled = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def path(self):
+        return os.path.join(self.log_dir, f"{self.session_id}.jsonl")
+
+    def append(self, role, content):
+        if len(self._recent) == self._recent.maxlen:
+            self._spill(self._recent[0])
+        self._recent.append(ChatMessage(role, content, time.time()))
+        self._count += 1
+
+    def _spill(self, message):
+        _prune_due(self.log_dir)
+        os.makedirs(self.log_dir, mode=0o700, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        with open(fd, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"role": message.role, "content": message.content,
+                                "time": message.time}, ensure_ascii=False) + "\n")
+        self._spilled += 1
+
+    def recent(self, n):
+        """The last ``n`` messages (at most the in-memory window), oldest first."""
+        if n <= 0:
+            return []
+        return list(self._recent)[-n:]
+
+    def __iter__(self):
+        """Every message, oldest first, reading spilled ones back from disk."""
+        if self._spilled:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    yield ChatMessage(**json.loads(line))
+        yield from list(self._recent)
+
+    def clear(self):
+        self._recent.clear()
+        self._count = 0
+        if self._spilled:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self._spilled = 0
+
+
+def prune_logs(log_dir=DEFAULT_LOG_DIR, max_age=LOG_RETENTION):
+    """Delete spilled session logs not written to for ``max_age`` seconds."""
+    cutoff = time.time() - max_age
+    for path in glob.glob(os.path.join(log_dir, "*.jsonl")):
+        try:
+            if os.stat(path).st_mtime < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def _prune_due(log_dir):
+    now = time.time()
+    if now - _last_prune.get(log_dir, 0) >= PRUNE_INTERVAL:
+        _last_prune[log_dir] = now
+        prune_logs(log_dir)
@@ -0,0 +1,230 @@
+"""Vectorized crop-suitability scoring.
+
+Every crop's tolerance ranges are kept as NumPy matrices so that all crops can
+be scored against one or many farm profiles in a single pass.
+"""
+import zlib
+
+import numpy as np
+
+from smartagri.regions import ALL_INDIAN_STATES
+
+SOILS = ("Loamy", "Clayey", "Sandy", "Black", "Alluvial", "Red", "Laterite")
+SEASONS = ("Kharif", "Rabi", "Zaid")
+RANGE_FACTORS = ("rainfall", "temperature", "humidity", "ph")
+FACTORS = RANGE_FACTORS + ("soil", "season", "state")
+
+# Relative weight of each factor in the total score (same order as FACTORS).
+WEIGHTS = np.array([0.15, 0.20, 0.10, 0.10, 0.25, 0.15, 0.05], dtype=np.float32)
+
+# Distance outside a range at which a factor score reaches zero is half the
+# range width, but never less than these floors (mm, °C, %, pH).
+TOLERANCE_FLOOR = np.array([100.0, 3.0, 10.0, 0.5], dtype=np.float32)
+
+# Score given to a crop outside its major producing states.
+OFF_REGION_SCORE = 0.6
+
+ALL_SEASONS = SEASONS
+SEASON_LABELS = ["Kharif (Monsoon)", "Rabi (Winter)", "Zaid (Summer)"]
+
+# Sowing and harvest windows for each season.
+CROP_CALENDAR = {
+    "Kharif": {"sowing": "June-July", "harvest": "October-November"},
+    "Rabi": {"sowing": "October-November", "harvest": "March-April"},
+    "Zaid": {"sowing": "March-April", "harvest": "June-July"}
+}
+
+# ----------------------------
+# CROP TOLERANCE TABLE
+# ----------------------------
+# rainfall (mm), temperature (°C), humidity (%), pH, soils, seasons, major states
+# An empty state tuple means the crop is grown everywhere.
+CROPS = {
+    "Rice": ((1000, 2500), (22, 35), (60, 90), (5.0, 7.5), ("Loamy", "Alluvial"), ("Kharif",),
+             ("West Bengal", "Uttar Pradesh", "Punjab", "Andhra Pradesh", "Odisha", "Tamil Nadu",
+              "Telangana", "Bihar", "Chhattisgarh", "Assam")),
+    "Paddy": ((1000, 2500), (22, 35), (60, 90), (5.0, 7.5), ("Clayey",), ("Kharif",),
+              ("West Bengal", "Uttar Pradesh", "Punjab", "Andhra Pradesh", "Odisha", "Tamil Nadu",
+               "Telangana", "Bihar", "Chhattisgarh", "Assam")),
+    "Wheat": ((450, 1000), (12, 25), (40, 70), (6.0, 7.5), ("Loamy", "Clayey", "Alluvial"), ("Rabi",),
+              ("Uttar Pradesh", "Punjab", "Haryana", "Madhya Pradesh", "Rajasthan", "Bihar",
+               "Gujarat")),
+    "Sugarcane": ((750, 1500), (21, 35), (60, 85), (6.0, 8.0), ("Loamy", "Alluvial"), ("Kharif", "Zaid"),
+                  ("Uttar Pradesh", "Maharashtra", "Karnataka", "Tamil Nadu", "Bihar", "Gujarat")),
+    "Cotton": ((600, 1200), (21, 37), (50, 80), (5.8, 8.0), ("Loamy", "Black", "Red"), ("Kharif",),
+               ("Gujarat", "Maharashtra", "Telangana", "Rajasthan", "Haryana", "Punjab",
+                "Karnataka", "Madhya Pradesh", "Andhra Pradesh")),
+    "Vegetables": ((500, 1500), (15, 30), (50, 85), (6.0, 7.5), ("Loamy",), ALL_SEASONS, ()),
+    "Fruits": ((600, 1800), (18, 32), (50, 85), (5.5, 7.5), ("Loamy",), ALL_SEASONS, ()),
+    "Soybean": ((600, 1000), (20, 30), (55, 80), (6.0, 7.5), ("Clayey", "Black"), ("Kharif",),
+                ("Madhya Pradesh", "Maharashtra", "Rajasthan", "Karnataka", "Telangana")),
+    "Linseed": ((450, 750), (10, 25), (40, 70), (5.5, 7.5), ("Clayey",), ("Rabi",),
+                ("Madhya Pradesh", "Chhattisgarh", "Uttar Pradesh", "Jharkhand", "Bihar", "Odisha")),
+    "Pulses": ((400, 900), (20, 32), (40, 75), (6.0, 7.5), ("Clayey", "Red"), ALL_SEASONS,
+               ("Madhya Pradesh", "Rajasthan", "Maharashtra", "Uttar Pradesh", "Karnataka",
+                "Andhra Pradesh")),
+    "Millets": ((300, 800), (25, 40), (30, 70), (5.5, 8.0), ("Sandy", "Red"), ("Kharif", "Zaid"),
+                ("Rajasthan", "Maharashtra", "Karnataka", "Uttar Pradesh", "Gujarat", "Tamil Nadu",
+                 "Haryana")),
+    "Groundnut": ((500, 1250), (22, 38), (50, 75), (6.0, 7.5), ("Sandy", "Red"), ("Kharif", "Zaid"),
+                  ("Gujarat", "Rajasthan", "Tamil Nadu", "Andhra Pradesh", "Karnataka", "Maharashtra")),
+    "Watermelon": ((300, 700), (24, 35), (40, 70), (6.0, 7.0), ("Sandy",), ("Zaid",),
+                   ("Uttar Pradesh", "Karnataka", "Andhra Pradesh", "Odisha", "West Bengal", "Tamil Nadu")),
+    "Coconut": ((1000, 2500), (20, 32), (60, 90), (5.2, 8.0), ("Sandy", "Laterite"), ALL_SEASONS,
+                ("Kerala", "Tamil Nadu", "Karnataka", "Andhra Pradesh", "Goa", "West Bengal", "Odisha",
+                 "Puducherry")),
+    "Cashew": ((1000, 2000), (20, 35), (60, 85), (4.5, 6.5), ("Sandy", "Laterite"), ALL_SEASONS,
+               ("Maharashtra", "Andhra Pradesh", "Odisha", "Kerala", "Karnataka", "Tamil Nadu", "Goa")),
+    "Sorghum": ((400, 1000), (25, 40), (40, 70), (6.0, 8.5), ("Black",), ("Kharif", "Rabi"),
+                ("Maharashtra", "Karnataka", "Rajasthan", "Madhya Pradesh", "Telangana")),
+    "Sunflower": ((500, 750), (20, 38), (40, 70), (6.5, 8.0), ("Black",), ALL_SEASONS,
+                  ("Karnataka", "Maharashtra", "Andhra Pradesh", "Telangana", "Odisha")),
+    "Chickpea": ((400, 700), (10, 28), (40, 65), (6.0, 8.0), ("Black",), ("Rabi",),
+                 ("Madhya Pradesh", "Maharashtra", "Rajasthan", "Uttar Pradesh", "Karnataka",
+                  "Andhra Pradesh")),
+    "Maize": ((500, 1000), (18, 32), (50, 80), (5.5, 7.5), ("Alluvial",), ALL_SEASONS,
+              ("Karnataka", "Madhya Pradesh", "Maharashtra", "Rajasthan", "Uttar Pradesh", "Bihar",
+               "Andhra Pradesh", "Telangana")),
+    "Mustard": ((300, 700), (10, 25), (40, 70), (6.0, 8.0), ("Alluvial",), ("Rabi",),
+                ("Rajasthan", "Haryana", "Madhya Pradesh", "Uttar Pradesh", "West Bengal", "Gujarat",
+                 "Assam")),
+    "Barley": ((300, 800), (12, 25), (40, 70), (6.5, 8.5), ("Alluvial",), ("Rabi",),
+               ("Rajasthan", "Uttar Pradesh", "Madhya Pradesh", "Punjab", "Haryana", "Himachal Pradesh",
+                "Uttarakhand")),
+    "Jute": ((1500, 2500), (24, 37), (70, 95), (6.0, 7.5), ("Alluvial",), ("Kharif",),
+             ("West Bengal", "Bihar", "Assam", "Odisha", "Meghalaya", "Tripura")),
+    "Oilseeds": ((500, 1000), (20, 32), (40, 75), (6.0, 7.5), ("Red",), ("Kharif", "Rabi"),
+                 ("Rajasthan", "Madhya Pradesh", "Gujarat", "Maharashtra", "Karnataka")),
+    "Tapioca": ((1000, 2000), (25, 35), (60, 90), (4.5, 7.0), ("Laterite",), ALL_SEASONS,
+                ("Kerala", "Tamil Nadu", "Andhra Pradesh", "Assam", "Meghalaya", "Nagaland")),
+    "Coffee": ((1500, 2500), (15, 28), (70, 90), (5.0, 6.5), ("Laterite",), ALL_SEASONS,
+               ("Karnataka", "Kerala", "Tamil Nadu")),
+    "Tea": ((1500, 3000), (18, 30), (70, 95), (4.5, 5.5), ("Laterite",), ALL_SEASONS,
+            ("Assam", "West Bengal", "Tamil Nadu", "Kerala", "Himachal Pradesh", "Uttarakhand",
+             "Tripura", "Arunachal Pradesh", "Sikkim", "Manipur", "Meghalaya", "Mizoram", "Nagaland")),
+    "Spices": ((1500, 3000), (18, 32), (60, 95), (5.0, 7.0), ("Laterite",), ALL_SEASONS,
+               ("Kerala", "Karnataka", "Tamil Nadu", "Sikkim", "Meghalaya", "Arunachal Pradesh", "Assam",
+                "Goa")),
+    "Potato": ((500, 800), (15, 25), (50, 80), (5.2, 6.5), ("Loamy", "Alluvial"), ("Rabi",),
+               ("Uttar Pradesh", "West Bengal", "Bihar", "Gujarat", "Punjab", "Madhya Pradesh", "Assam")),
+}
+
+CROP_NAMES = tuple(CROPS)
+
+
+def _membership(allowed, vocabulary, miss, unknown):
+    # One row per crop, one column per vocabulary entry, plus a trailing
+    # column that code -1 (unknown input) indexes into.
+    matrix = np.full((len(allowed), len(vocabulary) + 1), miss, dtype=np.float32)
+    for row, names in enumerate(allowed):
+        for name in (names or vocabulary):
+            matrix[row, vocabulary.index(name)] = 1.0
+    matrix[:, -1] = unknown
+    return matrix
+
+
+# (n_crops, 4, 2): lower/upper bound of each range factor
+RANGES = np.array([spec[:4] for spec in CROPS.values()], dtype=np.float32)
+TOLERANCE = np.maximum((RANGES[:, :, 1] - RANGES[:, :, 0]) / 2, TOLERANCE_FLOOR)
+
+SOIL_SCORES = _membership([spec[4] for spec in CROPS.values()], SOILS, miss=0.0, unknown=0.0)
+SEASON_SCORES = _membership([spec[5] for spec in CROPS.values()], SEASONS, miss=0.0, unknown=1.0)
+STATE_SCORES = _membership([spec[6] for spec in CROPS.values()], ALL_INDIAN_STATES,
+                           miss=OFF_REGION_SCORE, unknown=1.0)
+
+
+def _season_key(value):
+    # "Kharif (Monsoon)" -> "Kharif"
+    parts = value.split()
+    return parts[0].capitalize() if parts else ""
+
+
+def _encode(values, vocabulary, normalize=str.strip):
+    """Map category labels to vocabulary indices; unknown labels become -1."""
+    values = np.asarray(values, dtype=object).reshape(-1)
+    uniq, inverse = np.unique(values.astype(str), return_inverse=True)
+    lookup = {name: i for i, name in enumerate(vocabulary)}
+    codes = np.array([lookup.get(normalize(u), -1) for u in uniq], dtype=np.intp)
+    return codes[inverse]
+
+
+def score_crops(rainfall, temperature, humidity, ph, soil, season, state=None):
+    """Score every crop against one or many farm profiles.
+
+    Each argument is a scalar or a 1-D array; scalars are broadcast across
+    profiles. Returns ``(total, factors)`` where ``total`` has shape
+    ``(n_profiles, n_crops)`` and ``factors`` has shape
+    ``(n_profiles, n_crops, len(FACTORS))`` with every score in ``[0, 1]``.
+    """
+    numeric = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=np.float32))
+                                    for v in (rainfall, temperature, humidity, ph)))
+    x = np.stack(numeric, axis=-1)[:, None, :]
+    n_profiles = x.shape[0]
+
+    lower, upper = RANGES[:, :, 0], RANGES[:, :, 1]
+    distance = np.maximum(lower - x, 0) + np.maximum(x - upper, 0)
+
+    factors = np.empty((n_profiles, len(CROP_NAMES), len(FACTORS)), dtype=np.float32)
+    np.clip(1 - distance / TOLERANCE, 0, 1, out=factors[:, :, :4])
+
+    categorical = (
+        (soil, SOILS, SOIL_SCORES, str.strip),
+        (season, SEASONS, SEASON_SCORES, _season_key),
+        (state, ALL_INDIAN_STATES, STATE_SCORES, str.strip),
+    )
+    for column, (values, vocabulary, scores, normalize) in enumerate(categorical, start=4):
+        codes = np.broadcast_to(_encode(values, vocabulary, normalize), (n_profiles,))
+        factors[:, :, column] = scores[:, codes].T
+
+    return factors @ WEIGHTS, factors
+
+
+def rank_crops(total, top_k=5):
+    """Indices of the ``top_k`` best crops per profile, best first."""
+    order = np.argsort(-total, axis=-1, kind="stable")
+    return order[..., :top_k]
+
+
+def recommend_crops(rainfall, temperature, humidity, ph, soil, season, state=None, top_k=5):
+    """Ranked recommendations for a single farm profile.
+
+    Returns a list of dicts with ``crop``, the total ``score`` and one entry
+    per factor in ``FACTORS``.
+    """
+    total, factors = score_crops(rainfall, temperature, humidity, ph, soil, season, state)
+    results = []
+    for idx in rank_crops(total[0], top_k):
+        row = {"crop": CROP_NAMES[idx], "score": float(total[0, idx])}
+        row.update(zip(FACTORS, factors[0, idx].tolist()))
+        results.append(row)
+    return results
+
+
+# ----------------------------
+# CROP INSIGHTS
+# ----------------------------
+WATER_LEVELS = ("Low", "Medium", "High")
+
+
+def crop_insights(crops, rainfall, temperature, humidity, ph, soil, season, state=None):
+    """Indicative yield, profit, duration and comparison indices per crop.
+
+    The figures are illustrative placeholders until yield and cost data are
+    wired in. They come from a generator seeded by the inputs, so the same
+    farm profile always gets the same numbers. Returns ``{crop: dict}``.
+    """
+    key = repr((list(crops), float(rainfall), float(temperature), float(humidity),
+                round(float(ph), 2), soil, season, state))
+    rng = np.random.default_rng(zlib.crc32(key.encode()))
+    n = len(crops)
+    columns = {
+        "expected_yield": rng.integers(60, 95, n),
+        "profit": rng.integers(50000, 150000, n),
+        "duration": rng.integers(90, 180, n),
+        "water": rng.choice(WATER_LEVELS, n),
+        "yield_index": rng.integers(60, 95, n),
+        "profit_potential": rng.integers(50, 95, n),
+        "risk": rng.integers(20, 60, n),
+    }
+    return {crop: {name: values[i].item() for name, values in columns.items()}
+            for i, crop in enumerate(crops)}
@@ -0,0 +1,191 @@
+"""Crop disease lookup and leaf-photo classification.
+
+``classify_async`` runs a compact leaf-disease model on CPU in a small
+thread pool. The model is read once per process from
+``data/models/leaf_disease.npz`` (NumPy MLP weights) or an ``.onnx`` file
+when onnxruntime is installed. Photos are decoded by
+:mod:`smartagri.imaging`, and results are cached by the SHA-256 of the
+image bytes, so re-uploads and Streamlit reruns reuse the first inference.
+Without a model file the page falls back to the per-crop lookup.
+"""
+import concurrent.futures
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from smartagri.imaging import DecodedImage, decode_image
+
+DEFAULT_MODEL_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "data", "models", "leaf_disease.npz")
+
+DISEASES = {
+    "Rice": "Bacterial Leaf Blight",
+    "Wheat": "Rust Disease",
+    "Cotton": "Bollworm",
+    "Tomato": "Late Blight",
+    "Potato": "Early Blight"
+}
+
+TREATMENT = "Spray recommended fungicide. Remove affected parts."
+PREVENTION = "Use resistant varieties. Maintain field hygiene."
+
+INFERENCE_WORKERS = 2
+RESULT_CACHE_SIZE = 256
+
+
+def diagnose(crop):
+    return DISEASES.get(crop, "Unknown Disease")
+
+
+def parse_label(label):
+    """Split a ``Crop___Disease_name`` class label into ``(crop, disease)``."""
+    crop, _, disease = label.partition("___")
+    if not disease:
+        return None, crop.replace("_", " ")
+    return crop.replace("_", " "), disease.replace("_", " ").capitalize()
+
+
+# ----------------------------
+# MODEL
+# ----------------------------
+class LeafDiseaseModel:
+    """Dense ReLU network stored as NumPy arrays.
+
+    The ``.npz`` file holds ``labels``, ``input_size``, optional per-channel
+    ``mean``/``std`` and the layer weights ``W0, b0, W1, b1, ...``; the
+    input is the normalized ``input_size x input_size`` RGB image, flattened.
+    """
+
+    def __init__(self, path):
+        with np.load(path, allow_pickle=False) as data:
+            self.labels = [str(label) for label in data["labels"]]
+            self.input_size = int(data["input_size"])
+            self.mean = data["mean"].astype(np.float32) if "mean" in data else np.float32(0)
+            self.std = data["std"].astype(np.float32) if "std" in data else np.float32(1)
+            self.layers = []
+            while f"W{len(self.layers)}" in data:
+                i = len(self.layers)
+                self.layers.append((data[f"W{i}"].astype(np.float32),
+                                    data[f"b{i}"].astype(np.float32)))
+
+    def predict(self, images):
+        """Class probabilities for a batch of ``(n, size, size, 3)`` images in [0, 1]."""
+        x = ((images - self.mean) / self.std).reshape(len(images), -1)
+        for i, (weights, bias) in enumerate(self.layers):
+            x = x @ weights + bias
+            if i < len(self.layers) - 1:
+                np.maximum(x, 0, out=x)
+        x -= x.max(axis=1, keepdims=True)
+        np.exp(x, out=x)
+        return x / x.sum(axis=1, keepdims=True)
+
+
+class OnnxLeafDiseaseModel:
+    """ONNX variant: NCHW float32 input, labels in ``<model>.labels.txt``."""
+
+    def __init__(self, path):
+        import onnxruntime
+
+        self.session = onnxruntime.InferenceSession(path, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+        self.input_size = int(self.session.get_inputs()[0].shape[-1])
+        self.mean = np.float32(0)
+        self.std = np.float32(1)
+        with open(os.path.splitext(path)[0] + ".labels.txt", encoding="utf-8") as f:
+            self.labels = [line.strip() for line in f if line.strip()]
+
+    def predict(self, images):
+        logits = self.session.run(None, {self.input_name: images.transpose(0, 3, 1, 2)})[0]
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+
+@functools.lru_cache(maxsize=2)
+def _load(path, version):
+    if path.endswith(".onnx"):
+        return OnnxLeafDiseaseModel(path)
+    return LeafDiseaseModel(path)
+
+
+def load_model(path=DEFAULT_MODEL_FILE):
+    """Process-wide shared model, or ``None`` if no model file is installed."""
+    try:
+        version = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _load(path, version)
+
+
+# ----------------------------
+# INFERENCE POOL AND RESULT CACHE
+# ----------------------------
+_executor = None
+_results = OrderedDict()
+_lock = threading.Lock()
+
+
+def _pool():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                INFERENCE_WORKERS, thread_name_prefix="disease-inference")
+        return _executor
+
+
+def _tensor(model, image):
+    if not isinstance(image, DecodedImage):
+        image = decode_image(image, model.input_size)
+    if image.tensor is None or image.tensor.shape[0] != model.input_size:
+        raise ValueError("image was not decoded at the model's input size")
+    return image.tensor.astype(np.float32) / 255
+
+
+def _classify(model, image, top_k):
+    probs = model.predict(_tensor(model, image)[None])[0]
+    top = np.argsort(-probs, kind="stable")[:top_k]
+    return tuple((model.labels[i], float(probs[i])) for i in top)
+
+
+def classify_async(image, top_k=3, model=None):
+    """Start classifying an image; returns a ``Future`` of ``((label, p), ...)``.
+
+    ``image`` is raw image bytes or a ``DecodedImage`` whose tensor matches
+    ``model.input_size``. Returns ``None`` if no model is installed.
+    Identical images share one future, so a photo is only ever classified
+    once per process.
+    """
+    model = model or load_model()
+    if model is None:
+        return None
+    digest = image.digest if isinstance(image, DecodedImage) else hashlib.sha256(image).hexdigest()
+    key = (digest, id(model), top_k)
+    pool = _pool()
+    with _lock:
+        future = _results.get(key)
+        if future is not None:
+            _results.move_to_end(key)
+            return future
+        future = _results[key] = pool.submit(_classify, model, image, top_k)
+        while len(_results) > RESULT_CACHE_SIZE:
+            _results.popitem(last=False)
+
+    def forget_failure(done):
+        if done.exception() is not None:
+            with _lock:
+                if _results.get(key) is done:
+                    del _results[key]
+
+    future.add_done_callback(forget_failure)
+    return future
+
+
+def classify(image, top_k=3, model=None, timeout=None):
+    """Blocking ``classify_async``; ``None`` if no model is installed."""
+    future = classify_async(image, top_k, model)
+    return None if future is None else future.result(timeout)
@@ -0,0 +1,187 @@
+"""NPK requirement and fertilizer quantity calculations.
+
+Besides the straight Urea/DAP/MOP conversion, ``least_cost_mix`` picks the
+cheapest combination of the products in ``data/fertilizers.csv`` that meets
+the N, P and K targets. It solves the linear program
+
+    minimise price · x   subject to   content · x >= need,  x >= 0
+
+by enumerating every basis once per catalog: an optimum has at most three
+non-zero variables (products or surplus), so the inverse of each 3x3 basis
+is precomputed and all plots are solved together with one ``einsum``.
+"""
+import csv
+import functools
+import itertools
+import os
+
+import numpy as np
+
+DEFAULT_CATALOG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "data", "fertilizers.csv")
+
+NUTRIENTS = ("N", "P", "K")
+
+# Nutrient uptake in kg per quintal of target yield.
+NUTRIENT_REQUIREMENTS = {
+    "Rice": {"N": 2.5, "P": 0.6, "K": 2.5},
+    "Wheat": {"N": 3.0, "P": 0.6, "K": 2.0},
+    "Cotton": {"N": 4.0, "P": 1.4, "K": 3.6},
+    "Maize": {"N": 2.8, "P": 1.0, "K": 2.2},
+}
+DEFAULT_REQUIREMENT = {"N": 2.5, "P": 0.6, "K": 2.0}
+
+FERTILIZER_CROPS = ["Rice", "Wheat", "Cotton", "Maize"]
+
+# Nutrient fraction of the straight fertilizer used to supply each nutrient.
+FERTILIZER_GRADES = {"N": ("Urea", 0.46), "P": ("DAP", 0.46), "K": ("MOP", 0.60)}
+
+PLOT_COLUMNS = ("crop", "area", "yield_target", "soil_n", "soil_p", "soil_k")
+
+# Bytes allowed for the plots x bases x 3 float64 working array of one block;
+# the number of plots per block follows from the catalog size.
+_BLOCK_BYTES = 64 * 1024 * 1024
+_TOLERANCE = 1e-9
+
+
+def nutrient_needs(crop, area, yield_target, soil_n, soil_p, soil_k):
+    """Return the N, P and K deficit in kg for the whole area."""
+    r = NUTRIENT_REQUIREMENTS.get(crop, DEFAULT_REQUIREMENT)
+    soil = {"N": soil_n, "P": soil_p, "K": soil_k}
+    return {nutrient: max(yield_target * r[nutrient] * area - soil[nutrient] * area, 0)
+            for nutrient in NUTRIENTS}
+
+
+def fertilizer_quantities(needs):
+    """Map each nutrient deficit to ``(product, kg)`` of its straight fertilizer."""
+    return {nutrient: (FERTILIZER_GRADES[nutrient][0], kg / FERTILIZER_GRADES[nutrient][1])
+            for nutrient, kg in needs.items()}
+
+
+# ----------------------------
+# LEAST-COST MIX
+# ----------------------------
+class FertilizerCatalog:
+    """Products with their nutrient content and price, plus the precomputed
+    LP bases used by ``least_cost_mix``."""
+
+    __slots__ = ("products", "content", "price", "_inverses", "_columns", "_costs")
+
+    def __init__(self, products, content, price):
+        self.products = list(products)
+        self.content = np.asarray(content, dtype=np.float64).reshape(len(NUTRIENTS), -1)
+        self.price = np.asarray(price, dtype=np.float64)
+
+        # Columns: one per product, then one surplus column per nutrient.
+        matrix = np.hstack([self.content, -np.eye(len(NUTRIENTS))])
+        costs = np.concatenate([self.price, np.zeros(len(NUTRIENTS))])
+        bases = np.array(list(itertools.combinations(range(matrix.shape[1]), len(NUTRIENTS))))
+        blocks = matrix[:, bases].transpose(1, 0, 2)
+        usable = np.abs(np.linalg.det(blocks)) > 1e-12
+        self._columns = bases[usable]
+        self._inverses = np.linalg.inv(blocks[usable])
+        self._costs = costs[self._columns]
+
+    def __len__(self):
+        return len(self.products)
+
+
+def read_catalog(path=DEFAULT_CATALOG_FILE):
+    """Load a catalog CSV with ``product``, ``n``, ``p``, ``k`` (% content) and
+    ``price`` (₹/kg) columns."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    content = [[float(row[n.lower()]) / 100 for row in rows] for n in NUTRIENTS]
+    return FertilizerCatalog([row["product"] for row in rows], content,
+                             [float(row["price"]) for row in rows])
+
+
+@functools.lru_cache(maxsize=4)
+def _catalog(path, version):
+    return read_catalog(path)
+
+
+def load_catalog(path=DEFAULT_CATALOG_FILE):
+    """Process-wide shared catalog; reloaded when the file changes."""
+    return _catalog(path, os.stat(path).st_mtime_ns)
+
+
+def least_cost_mix(needs, catalog=None):
+    """Cheapest product quantities meeting each row of ``needs``.
+
+    ``needs`` is an array of shape ``(plots, 3)`` with the N, P and K kg to
+    supply. Returns ``(kg, cost)``: ``kg`` has shape ``(plots, products)``
+    and ``cost`` shape ``(plots,)``. Rows that the catalog cannot satisfy
+    are NaN.
+    """
+    catalog = catalog or load_catalog()
+    needs = np.atleast_2d(np.asarray(needs, dtype=np.float64))
+    n_products = len(catalog)
+    kg = np.full((len(needs), n_products), np.nan)
+    cost = np.full(len(needs), np.nan)
+
+    n_bases = len(catalog._costs)
+    block_size = max(1, _BLOCK_BYTES // (n_bases * len(NUTRIENTS) * 8))
+    for lo in range(0, len(needs), block_size):
+        block = needs[lo:lo + block_size]
+        x = np.einsum("bij,pj->pbi", catalog._inverses, block)
+        total = np.einsum("pbi,bi->pb", x, catalog._costs)
+        total[(x < -_TOLERANCE).any(axis=2)] = np.inf
+        best = np.argmin(total, axis=1)
+        rows = np.arange(len(block))
+        solved = np.isfinite(total[rows, best])
+
+        values = np.zeros((len(block), n_products + len(NUTRIENTS)))
+        np.put_along_axis(values, catalog._columns[best], np.maximum(x[rows, best], 0), axis=1)
+        kg[lo:lo + block_size][solved] = values[solved, :n_products]
+        cost[lo:lo + block_size][solved] = total[rows, best][solved]
+    return kg, cost
+
+
+def fertilizer_plan(needs, catalog=None):
+    """Least-cost mix for one ``{nutrient: kg}`` deficit.
+
+    Returns ``([(product, kg, cost), ...], total_cost)`` listing the products
+    to buy, or ``None`` if the catalog cannot meet the targets.
+    """
+    catalog = catalog or load_catalog()
+    kg, cost = least_cost_mix([[needs[n] for n in NUTRIENTS]], catalog)
+    if np.isnan(cost[0]):
+        return None
+    items = [(product, float(q), float(q * price))
+             for product, q, price in zip(catalog.products, kg[0], catalog.price) if q > 1e-6]
+    return items, float(cost[0])
+
+
+def plan_plots(frame, catalog=None):
+    """Least-cost mix for every plot (row) of a DataFrame.
+
+    ``frame`` needs the ``PLOT_COLUMNS`` columns (soil values in kg/acre,
+    area in acres, yield target in q/acre). Returns the N/P/K needs, the kg
+    of every catalog product and the cost per plot.
+    """
+    import pandas as pd
+
+    catalog = catalog or load_catalog()
+    missing = [c for c in PLOT_COLUMNS if c not in frame]
+    if missing:
+        raise ValueError(f"plots are missing columns: {', '.join(missing)}")
+    numeric = {c: pd.to_numeric(frame[c], errors="coerce").to_numpy(np.float64)
+               for c in PLOT_COLUMNS[1:]}
+    if any(np.isnan(v).any() for v in numeric.values()):
+        raise ValueError("area, yield_target and soil values must be numbers")
+
+    rates = np.array([[NUTRIENT_REQUIREMENTS.get(crop, DEFAULT_REQUIREMENT)[n] for n in NUTRIENTS]
+                      for crop in frame["crop"]]).reshape(-1, len(NUTRIENTS))
+    soil = np.column_stack([numeric["soil_n"], numeric["soil_p"], numeric["soil_k"]])
+    area = numeric["area"][:, None]
+    needs = np.maximum(numeric["yield_target"][:, None] * rates * area - soil * area, 0)
+
+    kg, cost = least_cost_mix(needs, catalog)
+    out = frame.copy()
+    for i, nutrient in enumerate(NUTRIENTS):
+        out[f"need_{nutrient.lower()}"] = needs[:, i]
+    for j, product in enumerate(catalog.products):
+        out[product] = kg[:, j]
+    out["cost"] = cost
+    return out
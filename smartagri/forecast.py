@@ -0,0 +1,177 @@
+"""Market price forecasting from local historical mandi prices.
+
+Historical prices come from the memory-mapped price store
+(:mod:`smartagri.pricestore`), which is rebuilt from the CSV/Parquet files in
+``data/prices`` whenever they change. Each crop's daily all-market average
+is decomposed into a weekly seasonal profile and a damped Holt trend; the
+smoothing parameters are picked by a grid search that runs for every crop
+and every grid point in one vectorized pass over time.
+
+Fitted models are cached per store version, and forecasts per
+``(crop, horizon)``, so repeated requests do not refit.
+"""
+import functools
+
+import numpy as np
+
+from smartagri.pricestore import DEFAULT_PRICE_DIR, DEFAULT_STORE_DIR, get_store
+
+SEASON_PERIOD = 7
+
+# Smoothing parameter grid searched for every crop.
+ALPHAS = np.linspace(0.05, 0.95, 19)
+BETAS = np.array([0.01, 0.03, 0.05, 0.1, 0.2])
+PHIS = np.array([0.9, 0.95, 0.98])
+
+
+class PriceModel:
+    """Fitted seasonal + damped-trend model for one crop."""
+
+    __slots__ = ("crop", "last_date", "last_price", "level", "trend", "phi", "seasonal",
+                 "phase", "sigma", "alpha", "beta")
+
+    def __init__(self, crop, last_date, last_price, level, trend, phi, seasonal, phase,
+                 sigma, alpha, beta):
+        self.crop = crop
+        self.last_date = last_date
+        self.last_price = last_price
+        self.level = level
+        self.trend = trend
+        self.phi = phi
+        self.seasonal = seasonal
+        self.phase = phase
+        self.sigma = sigma
+        self.alpha = alpha
+        self.beta = beta
+
+    def predict(self, horizon):
+        """Return ``(dates, mean, lower, upper)`` for the next ``horizon`` days.
+
+        ``lower``/``upper`` bound an approximate 80% prediction interval.
+        """
+        h = np.arange(1, horizon + 1)
+        damped = np.cumsum(self.phi ** h)
+        phases = (self.phase + h) % len(self.seasonal)
+        mean = self.level + damped * self.trend + self.seasonal[phases]
+        spread = 1.28 * self.sigma * np.sqrt(h)
+        dates = self.last_date + h.astype("timedelta64[D]")
+        return dates, mean, mean - spread, mean + spread
+
+
+def _moving_average(y, window):
+    # Centered moving average along the last axis; edges are left as NaN.
+    csum = np.cumsum(np.pad(y, [(0, 0), (1, 0)]), axis=-1)
+    ma = np.full_like(y, np.nan)
+    half = window // 2
+    ma[:, half:y.shape[1] - half] = (csum[:, window:] - csum[:, :-window]) / window
+    return ma
+
+
+def fit_models(crops, dates, y, period=SEASON_PERIOD):
+    """Fit one model per row of ``y`` (crops x days) in a single vectorized pass.
+
+    With fewer than two days there is no trend to fit, so every crop gets a
+    flat model at its last price.
+    """
+    n_crops, n_days = y.shape
+    if n_days < 2:
+        return _flat_models(crops, dates, y, period)
+    phase = np.arange(n_days) % period
+
+    # Seasonal decomposition: detrend with a centered moving average and
+    # average the residual by phase.
+    detrended = y - _moving_average(y, period)
+    valid = ~np.isnan(detrended)
+    seasonal = np.stack([
+        np.bincount(phase[valid[i]], detrended[i, valid[i]], minlength=period)
+        / np.maximum(np.bincount(phase[valid[i]], minlength=period), 1)
+        for i in range(n_crops)
+    ])
+    seasonal -= seasonal.mean(axis=1, keepdims=True)
+    adjusted = y - seasonal[:, phase]
+
+    # Damped Holt smoothing for every (crop, alpha, beta, phi) at once.
+    alpha, beta, phi = (g.ravel() for g in np.meshgrid(ALPHAS, BETAS, PHIS, indexing="ij"))
+    level = np.repeat(adjusted[:, :1], alpha.size, axis=1)
+    trend = np.repeat(adjusted[:, 1:2] - adjusted[:, :1], alpha.size, axis=1)
+    sse = np.zeros_like(level)
+    for t in range(1, n_days):
+        x = adjusted[:, t:t + 1]
+        prediction = level + phi * trend
+        error = x - prediction
+        sse += error * error
+        new_level = prediction + alpha * error
+        trend = phi * trend + beta * (new_level - level - phi * trend)
+        level = new_level
+
+    best = np.argmin(sse, axis=1)
+    rows = np.arange(n_crops)
+    sigma = np.sqrt(sse[rows, best] / max(n_days - 1, 1))
+    last_date = np.datetime64(dates[-1], "D")
+    return {
+        crop: PriceModel(crop, last_date, float(y[i, -1]), float(level[i, best[i]]),
+                         float(trend[i, best[i]]), float(phi[best[i]]), seasonal[i],
+                         int(phase[-1]), float(sigma[i]), float(alpha[best[i]]),
+                         float(beta[best[i]]))
+        for i, crop in enumerate(crops)
+    }
+
+
+def _flat_models(crops, dates, y, period):
+    # Level = last price (alpha 1), no trend or seasonality, no spread
+    if not y.shape[1]:
+        return {}
+    last_date = np.datetime64(dates[-1], "D")
+    return {
+        crop: PriceModel(crop, last_date, float(y[i, -1]), float(y[i, -1]), 0.0, 1.0,
+                         np.zeros(period), 0, 0.0, 1.0, 0.0)
+        for i, crop in enumerate(crops)
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _models(store):
+    crops, dates, y = store.daily_matrix()
+    if not crops:
+        return {}
+    return fit_models(crops, dates, y)
+
+
+def available_crops(price_dir=DEFAULT_PRICE_DIR, store_dir=DEFAULT_STORE_DIR):
+    store = get_store(price_dir, store_dir)
+    return sorted(_models(store)) if store else []
+
+
+@functools.lru_cache(maxsize=512)
+def _forecast(store, crop, horizon):
+    model = _models(store).get(crop)
+    if model is None:
+        return None
+    dates, mean, lower, upper = model.predict(horizon)
+    for arr in (dates, mean, lower, upper):
+        arr.flags.writeable = False
+    return model, dates, mean, lower, upper
+
+
+def forecast(crop, horizon, price_dir=DEFAULT_PRICE_DIR, store_dir=DEFAULT_STORE_DIR):
+    """Forecast ``crop`` prices for ``horizon`` days.
+
+    Returns ``(model, dates, mean, lower, upper)`` or ``None`` if there is no
+    history for ``crop``. The returned arrays are read-only and shared
+    between callers.
+    """
+    store = get_store(price_dir, store_dir)
+    return _forecast(store, crop, horizon) if store else None
+
+
+def history(crop, days=None, price_dir=DEFAULT_PRICE_DIR, store_dir=DEFAULT_STORE_DIR):
+    """Return ``(dates, prices)`` of the daily all-market average for ``crop``."""
+    store = get_store(price_dir, store_dir)
+    if store is None:
+        return np.array([], dtype="datetime64[D]"), np.array([])
+    start = None
+    if days:
+        lo, hi = store.crop_rows(crop)
+        if hi > lo:
+            start = store.date[lo:hi].max() - np.timedelta64(days - 1, "D")
+    return store.daily_average(crop, start)
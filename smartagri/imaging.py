@@ -0,0 +1,134 @@
+"""Bounded-memory decoding of uploaded photos.
+
+Phone photos (12-48 MP) are decoded once into a small JPEG thumbnail for
+display and a model-sized RGB tensor; the full-resolution pixels are never
+kept. JPEGs are decoded with ``Image.draft``, which lets the decoder scale
+by 1/2-1/8 while reading, so a 48 MP photo decodes to about 1.5 MP. The
+pixel count is checked from the header before any decoding, and a
+process-wide semaphore bounds how many decodes run at once.
+
+Each session keeps its decoded images in an ``ImageCache`` with a byte
+budget, so concurrent uploads cannot grow memory without limit.
+"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+THUMBNAIL_SIZE = 320
+THUMBNAIL_QUALITY = 85
+
+# Largest photo accepted. Formats without draft mode (PNG) are decoded at
+# full size, so they get a lower limit.
+MAX_PIXELS = 64_000_000
+MAX_FULL_DECODE_PIXELS = 16_000_000
+
+# Simultaneous decodes per process; each needs at most ~3 bytes per pixel decoded.
+DECODE_CONCURRENCY = 2
+
+# Decoded images kept per session.
+SESSION_IMAGE_BYTES = 2 * 1024 * 1024
+
+_decode_slots = threading.BoundedSemaphore(DECODE_CONCURRENCY)
+
+
+class ImageTooLarge(ValueError):
+    """The photo has more pixels than the decoder accepts."""
+
+
+class DecodedImage:
+    """Derived buffers of one upload: ``thumbnail`` (JPEG bytes) and ``tensor``
+    (``(size, size, 3)`` uint8 RGB center crop, or ``None``)."""
+
+    __slots__ = ("digest", "width", "height", "thumbnail", "tensor")
+
+    def __init__(self, digest, width, height, thumbnail, tensor):
+        self.digest = digest
+        self.width = width
+        self.height = height
+        self.thumbnail = thumbnail
+        self.tensor = tensor
+
+    @property
+    def nbytes(self):
+        return len(self.thumbnail) + (self.tensor.nbytes if self.tensor is not None else 0)
+
+
+def _open(data):
+    from PIL import Image
+
+    try:
+        return Image.open(io.BytesIO(data))
+    except Image.DecompressionBombError:
+        # PIL refuses very large images in the header already; report them like ours
+        raise ImageTooLarge(f"photo is over {2 * Image.MAX_IMAGE_PIXELS / 1e6:.0f} MP") from None
+
+
+def decode_image(data, tensor_size=None, thumbnail_size=THUMBNAIL_SIZE):
+    """Decode image bytes into a ``DecodedImage``.
+
+    Raises ``ImageTooLarge`` for photos over the pixel limit, and PIL's
+    errors for files that are not images.
+    """
+    from PIL import Image
+
+    digest = hashlib.sha256(data).hexdigest()
+    with _decode_slots, _open(data) as image:
+        width, height = image.size
+        draftable = image.format == "JPEG"
+        limit = MAX_PIXELS if draftable else MAX_FULL_DECODE_PIXELS
+        if width * height > limit:
+            raise ImageTooLarge(f"photo is {width * height / 1e6:.0f} MP; "
+                                f"the limit is {limit / 1e6:.0f} MP")
+
+        target = max(thumbnail_size, tensor_size or 0)
+        if draftable:
+            image.draft("RGB", (target, target))
+        image = image.convert("RGB")
+
+        tensor = None
+        if tensor_size:
+            # Resize the centered square crop, so non-square photos are not distorted
+            side = min(image.size)
+            left, top = (image.width - side) // 2, (image.height - side) // 2
+            square = image.resize((tensor_size, tensor_size), Image.BILINEAR,
+                                  box=(left, top, left + side, top + side), reducing_gap=2.0)
+            tensor = np.asarray(square, dtype=np.uint8)
+            tensor.flags.writeable = False
+        image.thumbnail((thumbnail_size, thumbnail_size), Image.BILINEAR)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=THUMBNAIL_QUALITY)
+    return DecodedImage(digest, width, height, buffer.getvalue(), tensor)
+
+
+class ImageCache:
+    """Per-session LRU of ``DecodedImage`` holding at most ``max_bytes``."""
+
+    def __init__(self, max_bytes=SESSION_IMAGE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        image = self._items.get(key)
+        if image is not None:
+            self._items.move_to_end(key)
+        return image
+
+    def put(self, key, image):
+        if key in self._items:
+            self.nbytes -= self._items.pop(key).nbytes
+        self._items[key] = image
+        self.nbytes += image.nbytes
+        # Always keep the newest image, even if it alone exceeds the budget.
+        while self.nbytes > self.max_bytes and len(self._items) > 1:
+            self.nbytes -= self._items.popitem(last=False)[1].nbytes
+
+    def clear(self):
+        self._items.clear()
+        self.nbytes = 0
@@ -0,0 +1,126 @@
+"""State and district crop statistics from ``data/crop_production.csv``.
+
+The district-level table is aggregated once per file version into dense
+float arrays indexed ``[district, crop, year]`` and ``[state, crop, year]``
+for area and production. Page views (top crops, trends, district
+drill-downs) then slice the arrays instead of grouping the table again on
+every rerun. Districts are stored sorted by state, so a state's districts
+are one contiguous slice.
+"""
+import csv
+import functools
+import os
+
+import numpy as np
+
+from smartagri.regions import ALL_INDIAN_STATES
+
+DEFAULT_PRODUCTION_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                       "data", "crop_production.csv")
+
+PRODUCTION_COLUMNS = ("state", "district", "crop", "year", "area", "production")
+
+
+def _yield(production, area):
+    """Tonnes per hectare, NaN where nothing was grown."""
+    return np.divide(production, area, out=np.full(np.shape(area), np.nan), where=area > 0)
+
+
+class ProductionCube:
+    """Area (ha) and production (t) by state or district, crop and year."""
+
+    __slots__ = ("states", "crops", "years", "districts", "district_state", "area", "production",
+                 "state_area", "state_production", "_state_index", "_crop_index", "_offsets")
+
+    def __init__(self, states, crops, years, districts, district_state, area, production):
+        self.states = states
+        self.crops = crops
+        self.years = years
+        self.districts = districts
+        self.district_state = district_state
+        self.area = area
+        self.production = production
+        self.state_area = np.zeros((len(states),) + area.shape[1:])
+        self.state_production = np.zeros_like(self.state_area)
+        np.add.at(self.state_area, district_state, area)
+        np.add.at(self.state_production, district_state, production)
+        self._state_index = {s: i for i, s in enumerate(states)}
+        self._crop_index = {c: i for i, c in enumerate(crops)}
+        self._offsets = np.searchsorted(district_state, np.arange(len(states) + 1))
+
+    def __contains__(self, state):
+        return state in self._state_index
+
+    def _year(self, year):
+        return len(self.years) - 1 if year is None else int(np.searchsorted(self.years, year))
+
+    def state_crops(self, state, year=None):
+        """Crops grown in ``state`` in ``year`` (default: latest) as rows of
+        ``(crop, area, production, yield)``, largest production first."""
+        s, y = self._state_index[state], self._year(year)
+        area, production = self.state_area[s, :, y], self.state_production[s, :, y]
+        grown = np.flatnonzero(area > 0)
+        order = grown[np.argsort(-production[grown], kind="stable")]
+        yields = _yield(production, area)
+        return [(self.crops[c], float(area[c]), float(production[c]), float(yields[c]))
+                for c in order]
+
+    def state_totals(self, state, year=None):
+        """``(area, production)`` over all crops of ``state`` in ``year``."""
+        s, y = self._state_index[state], self._year(year)
+        return float(self.state_area[s, :, y].sum()), float(self.state_production[s, :, y].sum())
+
+    def trend(self, state, crop):
+        """``(years, area, production, yield)`` arrays of one crop in one state."""
+        s, c = self._state_index[state], self._crop_index[crop]
+        area, production = self.state_area[s, c], self.state_production[s, c]
+        return self.years, area, production, _yield(production, area)
+
+    def district_breakdown(self, state, crop, year=None):
+        """Districts of ``state`` growing ``crop`` in ``year`` as rows of
+        ``(district, area, production, yield)``, largest production first."""
+        lo, hi = self._offsets[self._state_index[state]:self._state_index[state] + 2]
+        c, y = self._crop_index[crop], self._year(year)
+        area, production = self.area[lo:hi, c, y], self.production[lo:hi, c, y]
+        yields = _yield(production, area)
+        return [(self.districts[lo + d], float(area[d]), float(production[d]), float(yields[d]))
+                for d in np.argsort(-production, kind="stable") if area[d] > 0]
+
+
+def read_production(path=DEFAULT_PRODUCTION_FILE):
+    """Build a ``ProductionCube`` from a CSV with ``PRODUCTION_COLUMNS``.
+    Repeated rows for the same district, crop and year are summed."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    # States in menu order (unknown ones after), districts grouped by state
+    rank = {s: i for i, s in enumerate(ALL_INDIAN_STATES)}
+    states = sorted({r["state"] for r in rows}, key=lambda s: (rank.get(s, len(rank)), s))
+    state_index = {s: i for i, s in enumerate(states)}
+    pairs = sorted({(state_index[r["state"]], r["district"]) for r in rows})
+    district_index = {pair: i for i, pair in enumerate(pairs)}
+    crops = sorted({r["crop"] for r in rows})
+    crop_index = {c: i for i, c in enumerate(crops)}
+    years = np.array(sorted({int(r["year"]) for r in rows}), dtype=np.int16)
+
+    d = np.array([district_index[state_index[r["state"]], r["district"]] for r in rows], dtype=np.intp)
+    c = np.array([crop_index[r["crop"]] for r in rows], dtype=np.intp)
+    y = np.searchsorted(years, np.array([int(r["year"]) for r in rows]))
+    shape = (len(pairs), len(crops), len(years))
+    area = np.zeros(shape)
+    production = np.zeros(shape)
+    np.add.at(area, (d, c, y), np.array([float(r["area"] or 0) for r in rows]))
+    np.add.at(production, (d, c, y), np.array([float(r["production"] or 0) for r in rows]))
+    return ProductionCube(states, crops, years, [name for _, name in pairs],
+                          np.array([s for s, _ in pairs], dtype=np.intp), area, production)
+
+
+@functools.lru_cache(maxsize=4)
+def _cube(path, version):
+    return read_production(path)
+
+
+def load_production(path=DEFAULT_PRODUCTION_FILE):
+    """Process-wide shared cube, or ``None`` without a data file; reloaded when the file changes."""
+    if not os.path.exists(path):
+        return None
+    return _cube(path, os.stat(path).st_mtime_ns)
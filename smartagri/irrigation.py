@@ -0,0 +1,269 @@
+"""Crop water demand and irrigation scheduling (FAO-56).
+
+``reference_et`` computes FAO-56 Penman-Monteith reference evapotranspiration
+from daily weather. Crop demand is ``ETc = Kc * ET0`` with the crop
+coefficient following the FAO four-stage curve (initial, development,
+mid-season, late). ``water_balance`` then tracks root-zone depletion day by
+day and irrigates back to field capacity whenever depletion passes the
+readily available water.
+
+Everything works on numpy arrays of shape ``(plots, days)``: one call
+schedules a whole season for thousands of plots, looping only over days.
+Seasonal weather comes from the state climate normals
+(``data/weather/normals.csv``), so schedules are plans for an average year.
+"""
+import functools
+import os
+
+import numpy as np
+
+from smartagri.regions import STATE_LOCATIONS
+from smartagri.weather import DEFAULT_NORMALS_FILE, NORMAL_FIELDS, daily_normals, load_normals
+
+# Crop: (Kc ini, Kc mid, Kc end, stage lengths in days (ini, dev, mid, late),
+#        max root depth in m, depletion fraction p).  FAO-56 tables 11, 12 and 22.
+CROP_WATER = {
+    "Rice": (1.05, 1.20, 0.90, (30, 30, 60, 30), 0.5, 0.20),
+    "Wheat": (0.30, 1.15, 0.25, (20, 25, 60, 30), 1.2, 0.55),
+    "Maize": (0.30, 1.20, 0.35, (20, 35, 40, 30), 1.2, 0.55),
+    "Cotton": (0.35, 1.18, 0.60, (30, 50, 60, 55), 1.3, 0.65),
+    "Sugarcane": (0.40, 1.25, 0.75, (35, 60, 190, 120), 1.5, 0.65),
+    "Groundnut": (0.40, 1.15, 0.60, (25, 35, 45, 25), 0.75, 0.50),
+    "Soybean": (0.40, 1.15, 0.50, (20, 30, 60, 25), 0.9, 0.50),
+    "Potato": (0.50, 1.15, 0.75, (25, 30, 45, 30), 0.5, 0.35),
+    "Tomato": (0.60, 1.15, 0.80, (30, 40, 40, 25), 1.0, 0.40),
+    "Pulses": (0.40, 1.00, 0.35, (20, 25, 35, 25), 0.8, 0.50),
+}
+WATER_CROPS = list(CROP_WATER)
+
+STAGES = ("Initial", "Development", "Mid-season", "Late")
+
+# Available water between field capacity and wilting point, mm per m of soil.
+SOIL_WATER_HOLDING = {"Loamy": 140, "Clayey": 170, "Sandy": 80, "Black": 180, "Alluvial": 150,
+                      "Red": 110, "Laterite": 100}
+
+# Share of applied water that reaches the root zone.
+APPLICATION_EFFICIENCY = {"Flood": 0.60, "Furrow": 0.70, "Sprinkler": 0.75, "Drip": 0.90}
+
+PLOT_COLUMNS = ("state", "crop", "soil", "method", "sowing_date", "area")
+
+SOLAR_CONSTANT = 0.0820  # MJ m-2 min-1
+STEFAN_BOLTZMANN = 4.903e-9  # MJ K-4 m-2 day-1
+ALBEDO = 0.23
+ANGSTROM_A, ANGSTROM_B = 0.25, 0.50
+
+
+# ----------------------------
+# REFERENCE EVAPOTRANSPIRATION
+# ----------------------------
+def saturation_vapour_pressure(t):
+    """kPa at air temperature ``t`` (°C)."""
+    return 0.6108 * np.exp(17.27 * t / (t + 237.3))
+
+
+def extraterrestrial_radiation(latitude, doy):
+    """``(Ra in MJ m-2 day-1, daylight hours)`` for latitude (degrees) and day of year."""
+    phi = np.radians(latitude)
+    angle = 2 * np.pi * np.asarray(doy) / 365
+    dr = 1 + 0.033 * np.cos(angle)
+    declination = 0.409 * np.sin(angle - 1.39)
+    ws = np.arccos(np.clip(-np.tan(phi) * np.tan(declination), -1, 1))
+    ra = (24 * 60 / np.pi * SOLAR_CONSTANT * dr
+          * (ws * np.sin(phi) * np.sin(declination) + np.cos(phi) * np.cos(declination) * np.sin(ws)))
+    return ra, 24 / np.pi * ws
+
+
+def reference_et(temp_max, temp_min, humidity, wind_speed, sunshine_hours, latitude, elevation, doy):
+    """FAO-56 Penman-Monteith ET0 in mm/day.
+
+    Temperatures in °C, mean relative humidity in %, wind speed at 2 m in m/s,
+    bright sunshine in hours, latitude in degrees, elevation in m. All
+    arguments broadcast together; soil heat flux is taken as zero for daily
+    steps.
+    """
+    t_mean = (temp_max + temp_min) / 2
+    pressure = 101.3 * ((293 - 0.0065 * elevation) / 293) ** 5.26
+    gamma = 0.665e-3 * pressure
+    es = (saturation_vapour_pressure(temp_max) + saturation_vapour_pressure(temp_min)) / 2
+    ea = es * humidity / 100
+    delta = 4098 * saturation_vapour_pressure(t_mean) / (t_mean + 237.3) ** 2
+
+    ra, daylight = extraterrestrial_radiation(latitude, doy)
+    rs = (ANGSTROM_A + ANGSTROM_B * np.minimum(sunshine_hours / daylight, 1)) * ra
+    rso = (0.75 + 2e-5 * elevation) * ra
+    rnl = (STEFAN_BOLTZMANN * ((temp_max + 273.16) ** 4 + (temp_min + 273.16) ** 4) / 2
+           * (0.34 - 0.14 * np.sqrt(ea))
+           * (1.35 * np.minimum(rs / np.maximum(rso, 1e-9), 1) - 0.35))
+    rn = (1 - ALBEDO) * rs - rnl
+
+    et0 = ((0.408 * delta * rn + gamma * 900 / (t_mean + 273) * wind_speed * (es - ea))
+           / (delta + gamma * (1 + 0.34 * wind_speed)))
+    return np.maximum(et0, 0)
+
+
+# ----------------------------
+# CROP DEMAND
+# ----------------------------
+def season_length(crop):
+    return sum(CROP_WATER[crop][3])
+
+
+def _lookup(table, keys, column=None):
+    """Per-key values of ``table`` as a float column vector, looked up once per distinct key."""
+    names, inverse = np.unique(np.asarray(keys, dtype=object).astype(str), return_inverse=True)
+    values = np.array([table[name] if column is None else table[name][column] for name in names],
+                      dtype=np.float64)
+    return values[inverse.reshape(-1)][:, None]
+
+
+def _crop_table(crops, column):
+    return _lookup(CROP_WATER, crops, column)
+
+
+def crop_coefficients(crops, days):
+    """Kc of each crop (rows) on each day after sowing (columns); 0 after harvest."""
+    d = np.asarray(days, dtype=np.float64)[None, :]
+    kc_ini, kc_mid, kc_end = (_crop_table(crops, i) for i in range(3))
+    e1, e2, e3, e4 = (_lookup({crop: sum(value[3][:i + 1]) for crop, value in CROP_WATER.items()}, crops)
+                      for i in range(4))
+    return np.select(
+        [d < e1, d < e2, d < e3, d < e4],
+        [kc_ini + 0 * d,
+         kc_ini + (kc_mid - kc_ini) * (d - e1) / (e2 - e1),
+         kc_mid + 0 * d,
+         kc_mid + (kc_end - kc_mid) * (d - e3) / (e4 - e3)],
+        0.0)
+
+
+def crop_stage(crop, day):
+    """Name of the growth stage ``day`` days after sowing."""
+    ends = np.cumsum(CROP_WATER[crop][3])
+    return STAGES[min(int(np.searchsorted(ends, day, side="right")), len(STAGES) - 1)]
+
+
+# ----------------------------
+# WATER BALANCE
+# ----------------------------
+def effective_rain(rain):
+    """Share of expected daily rain (mm) that stays in the root zone (USDA-SCS,
+    applied to the 30-day equivalent)."""
+    monthly = np.asarray(rain) * 30.4
+    return np.where(monthly < 250, monthly * (125 - 0.2 * monthly) / 125, 125 + 0.1 * monthly) / 30.4
+
+
+def water_balance(et0, rain, crops, soils, efficiency=1.0, irrigated=True):
+    """Daily root-zone water balance with irrigation back to field capacity.
+
+    ``et0`` and ``rain`` are ``(plots, days)`` (or ``(days,)`` for all plots)
+    from the sowing day on; ``crops`` and ``soils`` name each plot's crop and
+    soil type; ``efficiency`` and ``irrigated`` are scalars or one value per
+    plot. Depletion starts at zero (field capacity at sowing). Crop water use
+    is reduced by the FAO stress factor when the root zone dries past the
+    readily available water. Returns ``(plots, days)`` float32 arrays
+    ``etc`` (actual crop ET), ``irrigation`` (net mm applied), ``depletion``
+    (mm below field capacity after the day) and ``raw`` per plot (mm).
+    """
+    n_plots = len(crops)
+    et0 = np.broadcast_to(np.asarray(et0, dtype=np.float64), (n_plots, np.shape(et0)[-1]))
+    days = et0.shape[1]
+    peff = np.broadcast_to(effective_rain(rain), et0.shape)
+    etc_potential = crop_coefficients(crops, np.arange(days)) * et0
+
+    taw = (_lookup(SOIL_WATER_HOLDING, soils) * _crop_table(crops, 4))[:, 0]
+    raw = _crop_table(crops, 5)[:, 0] * taw
+    irrigated = np.broadcast_to(np.asarray(irrigated, dtype=bool), (n_plots,))
+
+    # Day-major copies so each step reads and writes contiguous rows
+    etc_potential = np.ascontiguousarray(etc_potential.T)
+    peff = np.ascontiguousarray(peff.T)
+    etc = np.empty((days, n_plots), dtype=np.float32)
+    irrigation = np.empty((days, n_plots), dtype=np.float32)
+    depletion = np.empty((days, n_plots), dtype=np.float32)
+    dr = np.zeros(n_plots)
+    for t in range(days):
+        ks = np.clip((taw - dr) / (taw - raw), 0, 1)
+        et = ks * etc_potential[t]
+        dr = np.clip(dr - peff[t] + et, 0, taw)
+        refill = np.where(irrigated & (dr > raw) & (etc_potential[t] > 0), dr, 0.0)
+        dr -= refill
+        etc[t] = et
+        irrigation[t] = refill
+        depletion[t] = dr
+    etc, irrigation, depletion = etc.T, irrigation.T, depletion.T
+    gross = irrigation / np.broadcast_to(np.asarray(efficiency, dtype=np.float32), (n_plots,))[:, None]
+    return {"etc": etc, "irrigation": irrigation, "gross": gross, "depletion": depletion, "raw": raw}
+
+
+# ----------------------------
+# SEASONAL WEATHER
+# ----------------------------
+@functools.lru_cache(maxsize=4)
+def _normals(path, version):
+    return load_normals(path)
+
+
+def season_weather(state, sowing_date, days, path=DEFAULT_NORMALS_FILE):
+    """``(dates, et0, rain)`` for ``days`` days from ``sowing_date`` in an average year."""
+    table = _normals(path, os.stat(path).st_mtime_ns)[state]
+    dates = np.datetime64(sowing_date, "D") + np.arange(days).astype("timedelta64[D]")
+    daily = dict(zip(NORMAL_FIELDS, daily_normals(table, dates).T))
+    latitude, elevation = STATE_LOCATIONS[state]
+    doy = (dates - dates.astype("datetime64[Y]")).astype(int) + 1
+    et0 = reference_et(daily["temp_max"], daily["temp_min"], daily["humidity"],
+                       daily["wind_speed"], daily["sunshine_hours"], latitude, elevation, doy)
+    return dates, et0, daily["rainfall_mm"] / 30.4
+
+
+def schedule_field(state, crop, soil, method, sowing_date, path=DEFAULT_NORMALS_FILE):
+    """Season plan for one field: ``(dates, balance)`` with ``balance`` as
+    returned by ``water_balance`` for a single plot, plus ``et0`` and ``rain``."""
+    dates, et0, rain = season_weather(state, sowing_date, season_length(crop), path)
+    balance = water_balance(et0, rain, [crop], [soil], APPLICATION_EFFICIENCY[method])
+    balance["et0"], balance["rain"] = et0, rain
+    return dates, balance
+
+
+def schedule_plots(frame, path=DEFAULT_NORMALS_FILE):
+    """Season totals per plot for a DataFrame with ``PLOT_COLUMNS`` (area in acres).
+
+    Weather is computed once per state over the span of its sowing dates;
+    each plot's season is then a slice of that, and all plots share one
+    vectorized water balance. Adds ``season_days``,
+    ``etc_mm``, ``net_mm``, ``gross_mm``, ``irrigations`` and ``water_m3``
+    (gross, over the plot area). Raises ``ValueError`` for missing columns or
+    unknown states, crops, soils or methods.
+    """
+    missing = [c for c in PLOT_COLUMNS if c not in frame.columns]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    for column, known in (("state", STATE_LOCATIONS), ("crop", CROP_WATER),
+                          ("soil", SOIL_WATER_HOLDING), ("method", APPLICATION_EFFICIENCY)):
+        unknown = sorted(set(frame[column]) - set(known))
+        if unknown:
+            raise ValueError(f"unknown {column}: {', '.join(map(str, unknown[:5]))}")
+    frame = frame.reset_index(drop=True)
+    sowing = frame["sowing_date"].astype("datetime64[ns]").to_numpy().astype("datetime64[D]")
+    days = max(season_length(crop) for crop in set(frame["crop"]))
+
+    et0 = np.empty((len(frame), days))
+    rain = np.empty((len(frame), days))
+    window = np.arange(days)
+    for state, rows in frame.groupby("state").indices.items():
+        first = sowing[rows].min()
+        span = int((sowing[rows].max() - first).astype(int)) + days
+        _, state_et0, state_rain = season_weather(state, first, span, path)
+        offsets = (sowing[rows] - first).astype(int)[:, None] + window
+        et0[rows] = state_et0[offsets]
+        rain[rows] = state_rain[offsets]
+
+    balance = water_balance(et0, rain, frame["crop"].to_numpy(), frame["soil"].to_numpy(),
+                            frame["method"].map(APPLICATION_EFFICIENCY).to_numpy())
+    out = frame.copy()
+    out["season_days"] = frame["crop"].map({crop: season_length(crop) for crop in CROP_WATER})
+    out["etc_mm"] = balance["etc"].sum(axis=1)
+    out["net_mm"] = balance["irrigation"].sum(axis=1)
+    out["gross_mm"] = balance["gross"].sum(axis=1)
+    out["irrigations"] = (balance["irrigation"] > 0).sum(axis=1)
+    # 1 mm over 1 acre is 4.047 m3
+    out["water_m3"] = out["gross_mm"] * frame["area"].astype(float) * 4.047
+    return out
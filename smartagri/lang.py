@@ -0,0 +1,75 @@
+"""UI strings for the supported languages.
+
+Translations live in ``data/locales/<code>.json`` as flat ``{key: text}``
+catalogs. They are read once per process and compiled into one read-only
+table per language that already contains every key: missing translations
+are filled from the fallback chain (ending in English), and keys and texts
+are interned. ``LANG`` is shared by all sessions, so looking up a string is
+a plain dict access. Unknown languages resolve to English and unknown keys
+to the key itself, so a lookup never raises.
+"""
+import json
+import os
+import sys
+from types import MappingProxyType
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "data", "locales")
+
+DEFAULT_LANGUAGE = "English"
+
+# Language -> catalog file code, in menu order
+LOCALES = {"English": "en", "Hindi": "hi", "Tamil": "ta"}
+
+# Languages tried, in order, for strings a catalog does not translate
+FALLBACKS = {}
+
+LANGUAGES = list(LOCALES)
+
+
+class _Table(dict):
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return key
+
+
+class _Languages(dict):
+    __slots__ = ()
+
+    def __missing__(self, language):
+        return self[DEFAULT_LANGUAGE]
+
+
+def read_catalog(code, locale_dir=LOCALE_DIR):
+    """The raw ``{key: text}`` catalog for ``code``, or ``{}`` if it has no file."""
+    path = os.path.join(locale_dir, f"{code}.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def fallback_chain(language):
+    """``language`` followed by its fallbacks, always ending in the default language."""
+    chain = [language] + [lang for lang in FALLBACKS.get(language, []) if lang != language]
+    if DEFAULT_LANGUAGE not in chain:
+        chain.append(DEFAULT_LANGUAGE)
+    return chain
+
+
+def compile_catalogs(locale_dir=LOCALE_DIR):
+    """``{language: table}`` with every table holding every known key."""
+    raw = {language: read_catalog(code, locale_dir) for language, code in LOCALES.items()}
+    tables = {}
+    for language in LOCALES:
+        table = {}
+        # Lowest priority first, so the language's own strings win
+        for source in reversed(fallback_chain(language)):
+            table.update(raw.get(source, {}))
+        tables[language] = MappingProxyType(_Table(
+            (sys.intern(key), sys.intern(text)) for key, text in table.items()))
+    return MappingProxyType(_Languages(tables))
+
+
+LANG = compile_catalogs()
@@ -0,0 +1,144 @@
+"""Agricultural loan EMI calculations.
+
+Every calculation works on NumPy arrays, so a whole loan portfolio is
+priced in one vectorized pass; the scalar helpers used by the Loan
+Calculator page are thin wrappers around the same code.
+"""
+import numpy as np
+
+LOAN_TYPES = ["Kisan Credit Card", "Crop Loan", "Tractor Loan"]
+
+# Percentage points taken off the interest rate by the interest subvention scheme.
+SUBSIDY_RATE = 3
+
+# Interest subvention only applies to the first ₹3 lakh of a loan.
+SUBSIDY_LIMIT = 300_000
+
+PORTFOLIO_COLUMNS = ("amount", "rate", "tenure")
+
+
+def effective_rates(amounts, rates, subsidy=0.0, limit=SUBSIDY_LIMIT):
+    """Annual rates (%) after a subvention of ``subsidy`` percentage points.
+
+    The subvention is earned on the first ``limit`` rupees only, so larger
+    loans get a proportionally smaller reduction.
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)
+    share = np.minimum(amounts, limit) / np.where(amounts > 0, amounts, 1)
+    return np.maximum(rates - np.asarray(subsidy, dtype=np.float64) * share, 0)
+
+
+def apply_subsidy(rate, subsidy=False, amount=None):
+    """Annual interest rate (%) after the optional interest subsidy.
+
+    When ``amount`` is given the subsidy is capped at ``SUBSIDY_LIMIT``.
+    """
+    if not subsidy:
+        return rate
+    if amount is None:
+        return max(rate - SUBSIDY_RATE, 0)
+    return round(float(effective_rates(amount, rate, SUBSIDY_RATE)), 2)
+
+
+def emi(amounts, annual_rates, tenures):
+    """Monthly instalment of reducing-balance loans (arrays broadcast).
+
+    ``annual_rates`` are in percent and ``tenures`` in months.
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    r = np.asarray(annual_rates, dtype=np.float64) / 1200
+    n = np.asarray(tenures, dtype=np.float64)
+    # (1+r)^n - 1 via expm1/log1p stays accurate for tiny rates.
+    growth = np.expm1(n * np.log1p(r))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r > 0, amounts * r * (growth + 1) / np.where(r > 0, growth, 1),
+                        amounts / n)
+
+
+def compute_emi(amount, annual_rate, tenure):
+    """Return ``(emi, total_payment, total_interest)`` for a reducing-balance loan.
+
+    ``annual_rate`` is in percent and ``tenure`` in months.
+    """
+    payment = float(emi(amount, annual_rate, tenure))
+    total = payment * tenure
+    return payment, total, total - amount
+
+
+def portfolio_cashflows(amounts, annual_rates, tenures):
+    """Month-by-month schedule summed over all loans.
+
+    Returns a dict of arrays ``month``, ``payment``, ``principal``,
+    ``interest`` and ``balance`` (outstanding after the payment). The loop
+    runs over months only; each step updates every loan at once.
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    r = np.asarray(annual_rates, dtype=np.float64) / 1200
+    tenures = np.asarray(tenures, dtype=np.int64)
+    payments = emi(amounts, annual_rates, tenures)
+    horizon = int(tenures.max()) if tenures.size else 0
+
+    balance = amounts.copy()
+    principal = np.zeros(horizon)
+    interest = np.zeros(horizon)
+    outstanding = np.zeros(horizon)
+    for k in range(horizon):
+        due = balance * r
+        # The last instalment clears whatever rounding left on the balance.
+        repaid = np.where(tenures == k + 1, balance, np.minimum(payments - due, balance))
+        balance -= repaid
+        principal[k] = repaid.sum()
+        interest[k] = due.sum()
+        outstanding[k] = balance.sum()
+
+    return {
+        "month": np.arange(1, horizon + 1),
+        "payment": principal + interest,
+        "principal": principal,
+        "interest": interest,
+        "balance": outstanding,
+    }
+
+
+def amortization_schedule(amount, annual_rate, tenure):
+    """Month-by-month schedule of one loan (see ``portfolio_cashflows``)."""
+    return portfolio_cashflows([amount], [annual_rate], [tenure])
+
+
+def portfolio_summary(amounts, annual_rates, tenures):
+    """Per-loan ``emi``, ``total_payment`` and ``total_interest`` arrays."""
+    amounts = np.asarray(amounts, dtype=np.float64)
+    tenures = np.asarray(tenures, dtype=np.int64)
+    payments = emi(amounts, annual_rates, tenures)
+    total = payments * tenures
+    return {"emi": payments, "total_payment": total, "total_interest": total - amounts}
+
+
+def price_portfolio(frame):
+    """Add ``effective_rate``, ``emi``, ``total_payment`` and ``total_interest``
+    columns to a loan DataFrame.
+
+    ``frame`` needs ``amount``, ``rate`` (% per year) and ``tenure`` (months)
+    columns, and may have ``subsidy`` (percentage points of subvention, 0 or
+    blank for none).
+    """
+    import pandas as pd
+
+    missing = [c for c in PORTFOLIO_COLUMNS if c not in frame]
+    if missing:
+        raise ValueError(f"portfolio is missing columns: {', '.join(missing)}")
+    amounts = pd.to_numeric(frame["amount"], errors="coerce").to_numpy(np.float64)
+    rates = pd.to_numeric(frame["rate"], errors="coerce").to_numpy(np.float64)
+    tenures = pd.to_numeric(frame["tenure"], errors="coerce").to_numpy(np.float64)
+    if np.isnan(amounts).any() or np.isnan(rates).any() or np.isnan(tenures).any() \
+            or (tenures < 1).any():
+        raise ValueError("amount, rate and tenure must be numbers and tenure at least 1 month")
+    subsidy = (pd.to_numeric(frame["subsidy"], errors="coerce").fillna(0).to_numpy(np.float64)
+               if "subsidy" in frame else 0.0)
+
+    out = frame.copy()
+    out["effective_rate"] = effective_rates(amounts, rates, subsidy)
+    for name, values in portfolio_summary(amounts, out["effective_rate"], tenures).items():
+        out[name] = values
+    return out
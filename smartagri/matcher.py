@@ -0,0 +1,118 @@
+"""Multi-pattern keyword matching (Aho–Corasick).
+
+All keywords are compiled once into a single automaton, so finding every
+keyword in a message is one pass over the message regardless of how many
+keywords there are.
+"""
+import unicodedata
+from collections import deque
+
+
+def normalize(text):
+    """Case- and Unicode-normalize text so "PM-Kisan" and "pm-kisan" match."""
+    return unicodedata.normalize("NFC", text).casefold()
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+# Keywords at least this long also match with a plural ending ("loan" in "loans")
+PLURAL_MIN_LENGTH = 4
+PLURAL_ENDINGS = ("s", "es")
+
+
+def _word_ends(text, end, plural):
+    """Whether a word ends at ``end``, optionally after a plural ending."""
+    if end == len(text) or not _is_word_char(text[end]):
+        return True
+    return plural and any(text.startswith(suffix, end) and _word_ends(text, end + len(suffix), False)
+                          for suffix in PLURAL_ENDINGS)
+
+
+class KeywordMatcher:
+    """Aho–Corasick automaton over ``(keyword, value)`` pairs.
+
+    ASCII keywords only match at whole words ("hi" does not match inside
+    "which"). Keywords of four or more letters may end with a plural "s" or
+    "es" ("loans", "soil tests"). Keywords in other scripts match anywhere.
+    """
+
+    def __init__(self, entries):
+        self.keywords = []
+        self.values = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for keyword, value in entries:
+            self._add(normalize(keyword), value)
+        self._build_failure_links()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _add(self, keyword, value):
+        if not keyword:
+            return
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] += (len(self.keywords),)
+        self.keywords.append(keyword)
+        self.values.append(value)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] += self._out[self._fail[child]]
+        self._boundary = [kw.isascii() for kw in self.keywords]
+        self._plural = [len(kw) >= PLURAL_MIN_LENGTH for kw in self.keywords]
+
+    def find_all(self, text):
+        """Yield ``(start, end, keyword_index)`` for every keyword occurrence."""
+        text = normalize(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        keywords, boundary, plural = self.keywords, self._boundary, self._plural
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for k in out[state]:
+                start = i + 1 - len(keywords[k])
+                if boundary[k] and ((start > 0 and _is_word_char(text[start - 1]))
+                                    or not _word_ends(text, i + 1, plural[k])):
+                    continue
+                yield start, i + 1, k
+
+    def match(self, text):
+        """Return matched values ranked best first.
+
+        Each value scores the total length of the distinct keywords that
+        matched it; longer, more specific keywords win. Ties go to the value
+        whose first keyword was added first, so the order is deterministic.
+        """
+        scores = {}
+        seen = set()
+        for _, _, k in self.find_all(text):
+            if k in seen:
+                continue
+            seen.add(k)
+            value = self.values[k]
+            score, first = scores.get(value, (0, k))
+            scores[value] = (score + len(self.keywords[k]), min(first, k))
+        return sorted(scores, key=lambda v: (-scores[v][0], scores[v][1]))
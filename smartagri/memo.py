@@ -0,0 +1,130 @@
+"""Memoization of page results keyed on their exact inputs.
+
+Streamlit reruns the whole script on every widget interaction. Wrapping a
+page computation with ``memoize`` makes repeated views with the same inputs
+return the cached result instead of recomputing it. Keys hold the exact
+values together with their type (sequences become tuples, NumPy scalars
+their Python equivalents), so ``"Loamy"`` and ``"loamy"`` or ``True`` and
+``1`` get separate entries. Entries are evicted least-recently-used beyond
+``maxsize`` and after ``ttl`` seconds.
+
+Caches are shared by every session by default. Pass ``scope`` (a callable
+returning a mutable mapping such as ``st.session_state``) to keep a
+separate cache per session. Shared caches are registered by function
+name, so re-running ``memoize`` in a Streamlit rerun reuses the same cache.
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+_shared = {}
+_registry_lock = threading.Lock()
+
+
+def normalize(value):
+    """Hashable form of a function argument that keeps its exact value and type."""
+    if isinstance(value, str):
+        return ("str", value)
+    if isinstance(value, (bool, np.bool_)):
+        return ("bool", bool(value))
+    if isinstance(value, (int, np.integer)):
+        return ("int", int(value))
+    if isinstance(value, (float, np.floating)):
+        return ("float", float(value))
+    if isinstance(value, dict):
+        return tuple(sorted((normalize(k), normalize(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(normalize(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return (value.shape, str(value.dtype), value.tobytes())
+    return value
+
+
+def make_key(args, kwargs):
+    return normalize(args), normalize(kwargs)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """Return ``(found, value)``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+def memoize(maxsize=128, ttl=None, scope=None):
+    """Decorator caching results by their exact arguments (see ``normalize``).
+
+    ``scope`` is ``None`` for one cache shared by all callers, or a callable
+    returning the mapping (e.g. ``lambda: st.session_state``) that holds a
+    per-session cache. Cached results are shared, so callers must not
+    mutate them.
+    """
+    def decorate(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def cache():
+            if scope is not None:
+                store = scope()
+                key = f"_memo:{name}"
+                if key not in store:
+                    store[key] = LRUCache(maxsize, ttl)
+                return store[key]
+            with _registry_lock:
+                if name not in _shared:
+                    _shared[name] = LRUCache(maxsize, ttl)
+                return _shared[name]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            store = cache()
+            key = make_key(args, kwargs)
+            found, value = store.get(key)
+            if not found:
+                value = func(*args, **kwargs)
+                store.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = lambda: cache().clear()
+        return wrapper
+
+    return decorate
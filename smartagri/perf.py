@@ -0,0 +1,159 @@
+"""Lightweight wall-time instrumentation.
+
+``timed(name)`` is a context manager and a decorator that records how long
+a block takes into a process-wide histogram (call count, total, min, max
+and log2-spaced buckets from 1 µs up). Set ``SMARTAGRI_PERF=0`` to turn it
+off: ``timed`` then returns a shared no-op object and decorators return the
+function unchanged, so disabled instrumentation costs one function call.
+
+``snapshot()`` summarizes every metric with bucket-estimated percentiles,
+and ``export_json()`` serializes the raw histograms for monitoring.
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("SMARTAGRI_PERF", "1").lower() not in ("0", "false", "off", "no")
+
+# Bucket i holds durations in [2**(i-1), 2**i) microseconds; the last is open-ended.
+N_BUCKETS = 28
+
+_metrics = {}
+_lock = threading.Lock()
+
+
+class Histogram:
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * N_BUCKETS
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.buckets[min(max(math.frexp(seconds * 1e6)[1], 0), N_BUCKETS - 1)] += 1
+
+    def percentile(self, q):
+        """Upper bound (seconds) of the bucket holding the ``q``-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(2.0 ** i / 1e6, self.max)
+        return self.max
+
+
+def record(name, seconds):
+    with _lock:
+        histogram = _metrics.get(name)
+        if histogram is None:
+            histogram = _metrics[name] = Histogram()
+        histogram.add(seconds)
+
+
+class _Timer:
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self._start)
+
+    start = __enter__
+
+    def stop(self):
+        self.__exit__(None, None, None)
+
+    def __call__(self, func):
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+
+        return wrapper
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+    def __call__(self, func):
+        return func
+
+
+_NULL = _NullTimer()
+
+
+def timed(name):
+    """Time a block (``with timed("x"):``), a function (``@timed("x")``) or an
+    explicit span (``t = timed("x").start(); ...; t.stop()``)."""
+    return _Timer(name) if ENABLED else _NULL
+
+
+def reset():
+    with _lock:
+        _metrics.clear()
+
+
+def snapshot():
+    """One summary dict per metric (times in milliseconds), slowest total first."""
+    with _lock:
+        items = [(name, h, h.percentile(50), h.percentile(95)) for name, h in _metrics.items()]
+    rows = [{
+        "name": name,
+        "calls": h.count,
+        "total_ms": h.total * 1e3,
+        "mean_ms": h.total / h.count * 1e3,
+        "p50_ms": p50 * 1e3,
+        "p95_ms": p95 * 1e3,
+        "max_ms": h.max * 1e3,
+    } for name, h, p50, p95 in items]
+    return sorted(rows, key=lambda row: -row["total_ms"])
+
+
+def export_json():
+    """All histograms as JSON: per metric count, sums and ``[le_seconds, count]`` buckets."""
+    with _lock:
+        metrics = {name: {
+            "count": h.count,
+            "total_s": h.total,
+            "min_s": h.min,
+            "max_s": h.max,
+            "buckets": [[2.0 ** i / 1e6 if i < N_BUCKETS - 1 else None, n]
+                        for i, n in enumerate(h.buckets) if n],
+        } for name, h in _metrics.items()}
+    return json.dumps({"enabled": ENABLED, "pid": os.getpid(), "timestamp": time.time(),
+                       "metrics": metrics}, indent=2)
@@ -0,0 +1,273 @@
+"""Memory-mapped columnar store for historical mandi prices.
+
+Rows are sorted by (crop, market, date) and every column is saved as its own
+``.npy`` file. Columns are opened with ``mmap_mode="r"``, so range queries
+return zero-copy slices and all processes serving the app share the same
+pages through the OS page cache instead of each holding a copy.
+
+Each build goes into its own version folder inside the store folder and is
+published by atomically replacing the ``CURRENT`` pointer file (see
+``smartagri.versioned``), so there is always a complete store to read while a
+new one is written.
+
+Build or refresh the store from the CSV/Parquet files in ``data/prices``::
+
+    python -m smartagri.pricestore build
+"""
+import argparse
+import functools
+import glob
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+
+from smartagri import versioned
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DEFAULT_PRICE_DIR = os.path.join(_DATA_DIR, "prices")
+DEFAULT_STORE_DIR = os.path.join(_DATA_DIR, "price_store")
+
+COLUMNS = {"crop": np.int16, "market": np.int32, "date": "datetime64[D]", "price": np.float32}
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+# Serializes rebuilds between the sessions (threads) of one process
+_build_lock = threading.Lock()
+
+
+def price_files(price_dir=DEFAULT_PRICE_DIR):
+    return sorted(glob.glob(os.path.join(price_dir, "*.csv"))
+                  + glob.glob(os.path.join(price_dir, "*.parquet")))
+
+
+def source_version(price_dir=DEFAULT_PRICE_DIR):
+    """Names, sizes and mtimes of the source files, used to detect changes."""
+    return [[os.path.basename(path), os.stat(path).st_size, os.stat(path).st_mtime_ns]
+            for path in price_files(price_dir)]
+
+
+def read_price_files(price_dir=DEFAULT_PRICE_DIR):
+    import pandas as pd
+
+    frames = [pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+              for path in price_files(price_dir)]
+    if not frames:
+        return pd.DataFrame(columns=["date", "crop", "market", "modal_price"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_store(prices, store_dir=DEFAULT_STORE_DIR, source=()):
+    """Write ``prices`` (date, crop, market, modal_price) as a columnar store.
+
+    The store is written to a new version folder and published by
+    replacing the ``CURRENT`` pointer, so readers never see a half-written
+    or missing store.
+    """
+    import pandas as pd
+
+    crop_codes, crops = pd.factorize(prices["crop"].astype(str), sort=True)
+    market_codes, markets = pd.factorize(prices["market"].astype(str), sort=True)
+    dates = pd.to_datetime(prices["date"]).to_numpy().astype("datetime64[D]")
+    price = prices["modal_price"].to_numpy(np.float32)
+
+    order = np.lexsort((dates, market_codes, crop_codes))
+    columns = {
+        "crop": crop_codes[order].astype(COLUMNS["crop"]),
+        "market": market_codes[order].astype(COLUMNS["market"]),
+        "date": dates[order],
+        "price": price[order],
+    }
+
+    # One index row per (crop, market) group: crop, market, start, stop
+    keys = columns["crop"].astype(np.int64) * len(markets) + columns["market"]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], int)
+    stops = np.r_[starts[1:], len(keys)]
+    index = np.column_stack([columns["crop"][starts], columns["market"][starts], starts, stops])
+
+    version_dir = versioned.new_version(store_dir)
+    for name, values in columns.items():
+        np.save(os.path.join(version_dir, f"{name}.npy"), values)
+    np.save(os.path.join(version_dir, "index.npy"), index.astype(np.int64))
+    with open(os.path.join(version_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"format": FORMAT_VERSION, "rows": len(keys), "crops": list(crops),
+                   "markets": list(markets), "source": list(source)}, f)
+
+    versioned.publish(store_dir, version_dir, META_FILE)
+
+
+def _read_meta(store_dir):
+    version_dir = versioned.current(store_dir, META_FILE)
+    if version_dir is None:
+        return None
+    try:
+        with open(os.path.join(version_dir, META_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_store(price_dir=DEFAULT_PRICE_DIR, store_dir=DEFAULT_STORE_DIR):
+    """(Re)build the store if the source files changed since it was built."""
+    source = source_version(price_dir)
+
+    def stale(meta):
+        return bool(source) and (meta is None or meta.get("source") != source
+                                 or meta.get("format") != FORMAT_VERSION)
+
+    if stale(_read_meta(store_dir)):
+        with _build_lock:
+            # Another session may have rebuilt it while this one waited
+            meta = _read_meta(store_dir)
+            if stale(meta):
+                try:
+                    build_store(read_price_files(price_dir), store_dir, source)
+                except OSError:
+                    # Read-only deployment: keep serving the existing store if any.
+                    if meta is None:
+                        raise
+    return store_dir
+
+
+class PriceStore:
+    """Read-only view of a price store; column arrays are memory-mapped."""
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR, version_dir=None):
+        version_dir = version_dir or versioned.current(store_dir, META_FILE)
+        try:
+            with open(os.path.join(version_dir or store_dir, META_FILE), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            raise FileNotFoundError(f"no price store in {store_dir}") from None
+        self.store_dir = store_dir
+        self.version_dir = version_dir
+        self.crops = meta["crops"]
+        self.markets = meta["markets"]
+        for name in COLUMNS:
+            setattr(self, name, np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode="r"))
+
+        self._groups = {}
+        self._crop_rows = {}
+        for crop, market, start, stop in np.load(os.path.join(version_dir, "index.npy")).tolist():
+            crop_name, market_name = self.crops[crop], self.markets[market]
+            self._groups[crop_name, market_name] = (start, stop)
+            first, last = self._crop_rows.get(crop_name, (start, stop))
+            self._crop_rows[crop_name] = (min(first, start), max(last, stop))
+
+    def __len__(self):
+        return len(self.price)
+
+    def markets_for(self, crop):
+        return [market for (c, market) in self._groups if c == crop]
+
+    def crop_rows(self, crop):
+        """``(start, stop)`` row range of ``crop`` (all markets)."""
+        return self._crop_rows.get(crop, (0, 0))
+
+    def series(self, crop, market, start=None, end=None):
+        """Return ``(dates, prices)`` for one market, ``start <= date <= end``.
+
+        Both arrays are zero-copy slices of the memory-mapped columns.
+        """
+        lo, hi = self._groups.get((crop, market), (0, 0))
+        dates = self.date[lo:hi]
+        i = 0 if start is None else np.searchsorted(dates, np.datetime64(start, "D"), "left")
+        j = len(dates) if end is None else np.searchsorted(dates, np.datetime64(end, "D"), "right")
+        return dates[i:j], self.price[lo + i:lo + j]
+
+    def daily_average(self, crop, start=None, end=None):
+        """Return ``(dates, prices)`` of the all-market daily average for ``crop``.
+
+        Days without any quote are filled by linear interpolation.
+        """
+        lo, hi = self.crop_rows(crop)
+        dates, prices = self.date[lo:hi], self.price[lo:hi]
+        if start is not None or end is not None:
+            keep = np.ones(len(dates), dtype=bool)
+            if start is not None:
+                keep &= dates >= np.datetime64(start, "D")
+            if end is not None:
+                keep &= dates <= np.datetime64(end, "D")
+            dates, prices = dates[keep], prices[keep]
+        if not len(dates):
+            return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+
+        first = dates.min()
+        offset = (dates - first).astype(np.int64)
+        n_days = int(offset.max()) + 1
+        total = np.bincount(offset, prices, minlength=n_days)
+        count = np.bincount(offset, minlength=n_days)
+        day = np.arange(n_days)
+        have = count > 0
+        mean = np.interp(day, day[have], total[have] / count[have])
+        return first + day.astype("timedelta64[D]"), mean
+
+    def daily_matrix(self):
+        """Crops x days matrix of all-market averages over the common date range."""
+        series = {crop: self.daily_average(crop) for crop in self._crop_rows}
+        series = {crop: s for crop, s in series.items() if len(s[0])}
+        if not series:
+            return [], np.array([], dtype="datetime64[D]"), np.empty((0, 0))
+        first = min(d[0] for d, _ in series.values())
+        last = max(d[-1] for d, _ in series.values())
+        dates = np.arange(first, last + 1)
+        day = (dates - first).astype(np.int64)
+        matrix = np.stack([
+            np.interp(day, (d - first).astype(np.int64), p) for d, p in series.values()
+        ])
+        return list(series), dates, matrix
+
+
+@functools.lru_cache(maxsize=4)
+def _open(store_dir, version_dir):
+    return PriceStore(store_dir, version_dir)
+
+
+def open_store(store_dir=DEFAULT_STORE_DIR):
+    """Process-wide shared ``PriceStore`` for ``store_dir``; reopened after a rebuild."""
+    return _open(store_dir, versioned.current(store_dir, META_FILE))
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve(price_dir, store_dir, source):
+    ensure_store(price_dir, store_dir)
+    if versioned.current(store_dir, META_FILE) is None:
+        return None
+    return open_store(store_dir)
+
+
+def get_store(price_dir=DEFAULT_PRICE_DIR, store_dir=DEFAULT_STORE_DIR):
+    """Refresh the store from ``price_dir`` if needed and return the shared instance.
+
+    Only the source files are checked on each call; the store is rebuilt and
+    reopened when they change. Returns ``None`` when there is neither a store
+    nor any source files.
+    """
+    source = tuple(tuple(entry) for entry in source_version(price_dir))
+    store = _resolve(price_dir, store_dir, source)
+    if store is None:
+        # Nothing to serve yet; try again on the next call
+        _resolve.cache_clear()
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m smartagri.pricestore",
+                                     description="Build the memory-mapped price store.")
+    parser.add_argument("command", choices=["build", "info"])
+    parser.add_argument("--source", default=DEFAULT_PRICE_DIR, help="folder of price CSV/Parquet files")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR, help="store folder to write/read")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_store(read_price_files(args.source), args.store, source_version(args.source))
+    store = open_store(args.store)
+    print(f"{args.store}: {len(store):,} rows, {len(store.crops)} crops, "
+          f"{len(store.markets)} markets, {len(store._groups)} series")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,19 @@
+"""Farmer profile helpers."""
+
+FARMING_TYPES = ["Traditional", "Organic", "Mixed"]
+IRRIGATION_METHODS = ["Rainfed", "Well", "Borewell", "Canal", "Drip", "Sprinkler"]
+PROFILE_CROPS = ["Rice", "Wheat", "Cotton", "Sugarcane", "Maize", "Soybean",
+                 "Groundnut", "Vegetables", "Fruits", "Pulses", "Other"]
+FARMING_GOALS = ["Maximize Profit", "Sustainability", "Food Security",
+                 "Export Quality", "Diversification"]
+
+
+def farmer_badge(experience):
+    """Return ``(level, label)`` for years of farming experience."""
+    if experience >= 20:
+        return "success", "🏆 **Expert Farmer**"
+    elif experience >= 10:
+        return "info", "🥈 **Experienced Farmer**"
+    elif experience >= 5:
+        return "info", "🥉 **Intermediate Farmer**"
+    return "info", "🌱 **New Farmer**"
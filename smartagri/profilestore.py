@@ -0,0 +1,323 @@
+"""Persistent farmer profiles in a local SQLite database.
+
+Connections come from a small pool shared by every session in the process.
+The database runs in WAL mode, so readers never block the writer. Phone
+numbers are unique and indexed, and there are indexes for state and
+district lookups. Writes go through ``upsert_many``, which sends a whole
+batch in one transaction with ``executemany``.
+
+Every profile also gets a random access token when it is first stored.
+Phone numbers are easy to guess, so the app links to a profile only by its
+token (``get_by_token``, the ``?farmer=<token>`` link) and never by phone
+number.
+
+Bulk-load or query profiles from the command line, and list the access
+tokens of imported profiles to send farmers their links::
+
+    python -m smartagri.profilestore import farmers.csv
+    python -m smartagri.profilestore district "Tamil Nadu" Madurai
+    python -m smartagri.profilestore tokens --output tokens.csv
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import queue
+import re
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+
+DEFAULT_DB_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "data", "profiles.db")
+
+POOL_SIZE = 4
+
+# Profile fields stored as columns; list fields are stored as JSON text.
+FIELDS = ("phone", "name", "age", "state", "district", "land", "soil", "irrigation", "crops",
+          "experience", "farming_type", "goals", "created_date")
+LIST_FIELDS = ("irrigation", "crops", "goals")
+
+# Values for fields an imported profile left empty, as the My Profile form starts
+DEFAULTS = {"name": "", "age": 35, "district": "", "land": 2.0, "soil": "Loamy",
+            "experience": 5, "farming_type": "Traditional"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS farmers (
+    id INTEGER PRIMARY KEY,
+    phone TEXT NOT NULL,
+    name TEXT,
+    age INTEGER,
+    state TEXT,
+    district TEXT,
+    land REAL,
+    soil TEXT,
+    irrigation TEXT,
+    crops TEXT,
+    experience INTEGER,
+    farming_type TEXT,
+    goals TEXT,
+    created_date TEXT,
+    updated_at REAL,
+    token TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_farmers_phone ON farmers (phone);
+CREATE INDEX IF NOT EXISTS idx_farmers_state_district ON farmers (state, district);
+CREATE INDEX IF NOT EXISTS idx_farmers_district ON farmers (district);
+"""
+
+_UPSERT = f"""
+INSERT INTO farmers ({", ".join(FIELDS)}, updated_at, token)
+VALUES ({", ".join("?" for _ in FIELDS)}, ?, ?)
+ON CONFLICT (phone) DO UPDATE SET
+    {", ".join(f"{f} = excluded.{f}" for f in FIELDS if f not in ("phone", "created_date"))},
+    created_date = COALESCE(farmers.created_date, excluded.created_date),
+    updated_at = excluded.updated_at,
+    token = COALESCE(farmers.token, excluded.token)
+"""
+
+_UPDATE_BY_TOKEN = f"""
+UPDATE farmers SET {", ".join(f"{f} = ?" for f in FIELDS if f != "created_date")}, updated_at = ?
+WHERE token = ?
+"""
+
+
+def new_token():
+    """Unguessable profile access token."""
+    return secrets.token_urlsafe(16)
+
+
+def normalize_phone(phone):
+    """Last 10 digits of an Indian mobile number ("+91 98765 43210" -> "9876543210")."""
+    digits = re.sub(r"\D", "", str(phone or ""))
+    return digits[-10:]
+
+
+def _to_row(profile, now):
+    # Empty CSV cells are missing values, not empty strings
+    row = [None if profile.get(f) == "" else profile.get(f) for f in FIELDS]
+    row[0] = normalize_phone(profile.get("phone"))
+    row[-1] = row[-1] or time.strftime("%Y-%m-%d", time.localtime(now))
+    for f in LIST_FIELDS:
+        i = FIELDS.index(f)
+        row[i] = json.dumps(list(row[i] or []), ensure_ascii=False)
+    # The token is only used for new rows; existing profiles keep theirs
+    return row + [now, new_token()]
+
+
+def _to_profile(row):
+    profile = {f: row[f] for f in FIELDS}
+    for f in LIST_FIELDS:
+        profile[f] = json.loads(profile[f]) if profile[f] else []
+    for f, default in DEFAULTS.items():
+        if profile[f] is None:
+            profile[f] = default
+    if profile["created_date"] is None:
+        profile["created_date"] = time.strftime("%Y-%m-%d", time.localtime(row["updated_at"] or 0))
+    return profile
+
+
+class ProfileStore:
+    """Repository of farmer profiles backed by one SQLite file."""
+
+    def __init__(self, path=DEFAULT_DB_FILE, pool_size=POOL_SIZE):
+        self.path = path
+        self._pool = queue.LifoQueue()
+        self._size = pool_size
+        self._opened = 0
+        self._lock = threading.Lock()
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+            self._migrate(conn)
+
+    @staticmethod
+    def _migrate(conn):
+        # Databases from before access tokens: add the column and give every profile a token
+        if "token" not in {row[1] for row in conn.execute("PRAGMA table_info(farmers)")}:
+            conn.execute("ALTER TABLE farmers ADD COLUMN token TEXT")
+        missing = [row[0] for row in conn.execute("SELECT id FROM farmers WHERE token IS NULL")]
+        conn.executemany("UPDATE farmers SET token = ? WHERE id = ?",
+                         [(new_token(), rid) for rid in missing])
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_farmers_token ON farmers (token)")
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a pooled connection; commits on success, rolls back on error."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = self._opened < self._size
+                self._opened += grow
+            conn = self._connect() if grow else self._pool.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        self._opened = 0
+
+    def upsert_many(self, profiles):
+        """Insert or update profiles (matched by phone) in one transaction.
+
+        Profiles without a phone number are skipped. Returns the number written.
+        """
+        now = time.time()
+        rows = [row for row in (_to_row(p, now) for p in profiles) if row[0]]
+        with self.connection() as conn:
+            conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def upsert(self, profile):
+        return self.upsert_many([profile])
+
+    def update_by_token(self, token, profile):
+        """Overwrite the profile with access token ``token``, phone number included.
+
+        Returns whether a profile was updated. Raises ``sqlite3.IntegrityError``
+        if the new phone number belongs to another profile.
+        """
+        row = _to_row(profile, time.time())
+        values = [v for f, v in zip(FIELDS, row) if f != "created_date"]
+        with self.connection() as conn:
+            return conn.execute(_UPDATE_BY_TOKEN, values + [row[len(FIELDS)], token]).rowcount > 0
+
+    def get(self, phone):
+        """The profile for ``phone``, or ``None``."""
+        with self.connection() as conn:
+            row = conn.execute("SELECT * FROM farmers WHERE phone = ?",
+                               (normalize_phone(phone),)).fetchone()
+        return _to_profile(row) if row else None
+
+    def get_by_token(self, token):
+        """The profile with access token ``token``, or ``None``."""
+        if not token:
+            return None
+        with self.connection() as conn:
+            row = conn.execute("SELECT * FROM farmers WHERE token = ?", (token,)).fetchone()
+        return _to_profile(row) if row else None
+
+    def token_for(self, phone):
+        """Access token of the profile for ``phone``, or ``None`` if there is none."""
+        with self.connection() as conn:
+            row = conn.execute("SELECT token FROM farmers WHERE phone = ?",
+                               (normalize_phone(phone),)).fetchone()
+        return row[0] if row else None
+
+    def delete(self, phone):
+        with self.connection() as conn:
+            conn.execute("DELETE FROM farmers WHERE phone = ?", (normalize_phone(phone),))
+
+    def delete_by_token(self, token):
+        """Delete the profile with access token ``token``; returns whether one was deleted."""
+        with self.connection() as conn:
+            return conn.execute("DELETE FROM farmers WHERE token = ?", (token,)).rowcount > 0
+
+    def tokens(self):
+        """``(phone, name, token)`` of every profile, by phone."""
+        with self.connection() as conn:
+            return conn.execute("SELECT phone, name, token FROM farmers ORDER BY phone").fetchall()
+
+    def by_district(self, district, state=None, limit=None):
+        """All profiles in ``district`` (optionally only in ``state``), by name."""
+        sql = "SELECT * FROM farmers WHERE district = ?"
+        params = [district]
+        if state is not None:
+            sql += " AND state = ?"
+            params.append(state)
+        sql += " ORDER BY name"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.connection() as conn:
+            return [_to_profile(row) for row in conn.execute(sql, params)]
+
+    def district_counts(self, state):
+        """``{district: farmers}`` for one state."""
+        with self.connection() as conn:
+            return dict(conn.execute(
+                "SELECT district, COUNT(*) FROM farmers WHERE state = ? GROUP BY district",
+                (state,)).fetchall())
+
+    def __len__(self):
+        with self.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM farmers").fetchone()[0]
+
+
+def _read_profiles(path):
+    if path.endswith((".jsonl", ".json")):
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".json"):
+                yield from json.load(f)
+            else:
+                yield from (json.loads(line) for line in f if line.strip())
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for field in LIST_FIELDS:
+                row[field] = [v.strip() for v in (row.get(field) or "").split(";") if v.strip()]
+            yield row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m smartagri.profilestore",
+                                     description="Import or query farmer profiles.")
+    parser.add_argument("--db", default=DEFAULT_DB_FILE, help="SQLite database file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    load = sub.add_parser("import", help="upsert profiles from CSV, JSON or JSON Lines")
+    load.add_argument("file")
+    load.add_argument("--batch", type=int, default=10_000, help="profiles per transaction")
+    district = sub.add_parser("district", help="list the farmers in a district")
+    district.add_argument("state")
+    district.add_argument("district")
+    tokens = sub.add_parser("tokens", help="access tokens for the ?farmer=<token> profile links")
+    tokens.add_argument("--output", help="write phone,name,token CSV here instead of stdout")
+    sub.add_parser("info", help="number of stored profiles")
+    args = parser.parse_args(argv)
+
+    store = ProfileStore(args.db)
+    if args.command == "import":
+        start = time.perf_counter()
+        total, batch = 0, []
+        for profile in _read_profiles(args.file):
+            batch.append(profile)
+            if len(batch) >= args.batch:
+                total += store.upsert_many(batch)
+                batch = []
+        total += store.upsert_many(batch)
+        print(f"Upserted {total:,} profiles in {time.perf_counter() - start:.1f}s -> {args.db}")
+        print("Profiles open only by token; list the links with: python -m smartagri.profilestore tokens")
+    elif args.command == "tokens":
+        with open(args.output, "w", newline="", encoding="utf-8") if args.output \
+                else contextlib.nullcontext(sys.stdout) as f:
+            writer = csv.writer(f)
+            writer.writerow(["phone", "name", "token"])
+            writer.writerows(tuple(row) for row in store.tokens())
+    elif args.command == "district":
+        for profile in store.by_district(args.district, args.state):
+            print(f"{profile['phone']}  {profile['name']}  {profile['land']} acres")
+    else:
+        print(f"{args.db}: {len(store):,} profiles")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""States and union territories covered by SmartAgri AI."""
+
+ALL_INDIAN_STATES = [
+    'Andhra Pradesh','Arunachal Pradesh','Assam','Bihar','Chhattisgarh','Goa','Gujarat',
+    'Haryana','Himachal Pradesh','Jharkhand','Karnataka','Kerala','Madhya Pradesh',
+    'Maharashtra','Manipur','Meghalaya','Mizoram','Nagaland','Odisha','Punjab','Rajasthan',
+    'Sikkim','Tamil Nadu','Telangana','Tripura','Uttar Pradesh','Uttarakhand','West Bengal',
+    'Delhi','Jammu & Kashmir','Puducherry'
+]
+
+# Latitude (degrees north) and elevation (m) of a representative farming area
+# in each state, used for solar radiation and air pressure in ET0.
+STATE_LOCATIONS = {
+    'Andhra Pradesh': (16.5, 25), 'Arunachal Pradesh': (27.1, 320), 'Assam': (26.2, 55),
+    'Bihar': (25.6, 53), 'Chhattisgarh': (21.3, 298), 'Goa': (15.5, 10), 'Gujarat': (22.7, 80),
+    'Haryana': (29.1, 220), 'Himachal Pradesh': (31.9, 900), 'Jharkhand': (23.4, 650),
+    'Karnataka': (15.3, 600), 'Kerala': (10.5, 30), 'Madhya Pradesh': (23.2, 500),
+    'Maharashtra': (19.7, 550), 'Manipur': (24.8, 780), 'Meghalaya': (25.5, 900),
+    'Mizoram': (23.7, 900), 'Nagaland': (26.0, 600), 'Odisha': (20.5, 40), 'Punjab': (30.9, 245),
+    'Rajasthan': (26.9, 400), 'Sikkim': (27.3, 1500), 'Tamil Nadu': (11.1, 150),
+    'Telangana': (17.4, 500), 'Tripura': (23.8, 20), 'Uttar Pradesh': (26.8, 120),
+    'Uttarakhand': (29.9, 300), 'West Bengal': (23.2, 40), 'Delhi': (28.6, 215),
+    'Jammu & Kashmir': (33.3, 1000), 'Puducherry': (11.9, 5)
+}
@@ -0,0 +1,313 @@
+"""BM25 passage retrieval over a local agronomy corpus.
+
+An offline step splits the ``.txt``/``.md`` documents of a corpus folder into
+passages and saves a term-major sparse matrix of precomputed BM25 weights::
+
+    python -m smartagri.retrieval build data/advisories
+
+At query time the postings of the query terms are concatenated and summed
+per passage with one ``np.bincount``, so scoring is vectorized across the
+whole corpus. The index is loaded (memory-mapped) once per process and
+shared by every session. ``search`` builds the index on first use and
+rebuilds it when the corpus files change, so a fresh checkout needs no
+build step. Rebuilds are published atomically (see ``smartagri.versioned``),
+so a running app never finds the index missing.
+"""
+import argparse
+import functools
+import glob
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+import numpy as np
+
+from smartagri import versioned
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DEFAULT_CORPUS_DIR = os.path.join(_DATA_DIR, "advisories")
+DEFAULT_INDEX_DIR = os.path.join(_DATA_DIR, "advisory_index")
+
+K1 = 1.2
+B = 0.75
+MAX_PASSAGE_WORDS = 120
+META_FILE = "vocab.json"
+FORMAT_VERSION = 1
+
+# Serializes rebuilds between the sessions (threads) of one process
+_build_lock = threading.Lock()
+
+# Word characters plus the Devanagari and Tamil blocks, so vowel signs stay in the word.
+_TOKEN = re.compile(r"[\w\u0900-\u097F\u0B80-\u0BFF]+")
+STOPWORDS = frozenset("""
+a an and are as at be by can do for from how i in is it me my of on or should the to
+what when which with you your this that these those will
+""".split())
+
+
+def _stem(token):
+    # Light suffix stripping so "sowing"/"sow" and "pests"/"pest" share a term.
+    for suffix in ("ing", "ed", "es", "s"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith("ss"):
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text):
+    return [_stem(t) for t in _TOKEN.findall(text.casefold()) if t not in STOPWORDS]
+
+
+def split_passages(text, max_words=MAX_PASSAGE_WORDS):
+    """Split a document into paragraph passages of at most ``max_words`` words."""
+    passages = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        words = paragraph.split()
+        for i in range(0, len(words), max_words):
+            chunk = " ".join(words[i:i + max_words])
+            if chunk.strip("#*- "):
+                passages.append(chunk)
+    return passages
+
+
+def corpus_files(corpus_dir=DEFAULT_CORPUS_DIR):
+    return sorted(glob.glob(os.path.join(corpus_dir, "**", "*.txt"), recursive=True)
+                  + glob.glob(os.path.join(corpus_dir, "**", "*.md"), recursive=True))
+
+
+def source_version(corpus_dir=DEFAULT_CORPUS_DIR):
+    """Names, sizes and mtimes of the corpus files, used to detect changes."""
+    return [[os.path.relpath(path, corpus_dir), os.stat(path).st_size, os.stat(path).st_mtime_ns]
+            for path in corpus_files(corpus_dir)]
+
+
+def read_corpus(corpus_dir=DEFAULT_CORPUS_DIR):
+    """Yield ``(source, passage)`` for every passage of every document."""
+    for path in corpus_files(corpus_dir):
+        with open(path, encoding="utf-8") as f:
+            source = os.path.relpath(path, corpus_dir)
+            for passage in split_passages(f.read()):
+                yield source, passage
+
+
+def build_index(passages, index_dir=DEFAULT_INDEX_DIR, source=()):
+    """Index ``(source, passage)`` pairs into ``index_dir``. Returns the passage count.
+
+    ``source`` is the ``source_version`` of the corpus, recorded so that
+    ``ensure_index`` can tell when the index is out of date.
+    """
+    vocab = {}
+    doc_ids, term_ids, counts = [], [], []
+    doc_len = []
+    sources, source_ids = {}, []
+    blob = bytearray()
+    offsets = [0]
+
+    for doc, (source, text) in enumerate(passages):
+        tokens = tokenize(text)
+        doc_len.append(len(tokens))
+        tf = {}
+        for token in tokens:
+            tid = vocab.setdefault(token, len(vocab))
+            tf[tid] = tf.get(tid, 0) + 1
+        doc_ids.extend([doc] * len(tf))
+        term_ids.extend(tf)
+        counts.extend(tf.values())
+        source_ids.append(sources.setdefault(source, len(sources)))
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+
+    n_docs = len(doc_len)
+    doc_ids = np.asarray(doc_ids, dtype=np.int32)
+    term_ids = np.asarray(term_ids, dtype=np.int32)
+    tf = np.asarray(counts, dtype=np.float32)
+    doc_len = np.asarray(doc_len, dtype=np.float32)
+
+    # Term-major (CSC) layout: postings of term t are indptr[t]:indptr[t+1].
+    order = np.lexsort((doc_ids, term_ids))
+    doc_ids, term_ids, tf = doc_ids[order], term_ids[order], tf[order]
+    df = np.bincount(term_ids, minlength=len(vocab))
+    indptr = np.concatenate([[0], np.cumsum(df)]).astype(np.int64)
+
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+    avgdl = doc_len.mean() if n_docs else 1.0
+    norm = K1 * (1 - B + B * doc_len[doc_ids] / avgdl)
+    weights = (idf[term_ids] * tf * (K1 + 1) / (tf + norm)).astype(np.float32)
+
+    tmp_dir = versioned.new_version(index_dir)
+    np.save(os.path.join(tmp_dir, "indptr.npy"), indptr)
+    np.save(os.path.join(tmp_dir, "doc_ids.npy"), doc_ids)
+    np.save(os.path.join(tmp_dir, "weights.npy"), weights)
+    np.save(os.path.join(tmp_dir, "offsets.npy"), np.asarray(offsets, dtype=np.int64))
+    np.save(os.path.join(tmp_dir, "source_ids.npy"), np.asarray(source_ids, dtype=np.int32))
+    with open(os.path.join(tmp_dir, "passages.bin"), "wb") as f:
+        f.write(blob)
+    with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"format": FORMAT_VERSION, "terms": list(vocab), "sources": list(sources),
+                   "passages": n_docs, "source": list(source)}, f, ensure_ascii=False)
+
+    versioned.publish(index_dir, tmp_dir, META_FILE)
+    return n_docs
+
+
+def _read_meta(index_dir):
+    version_dir = versioned.current(index_dir, META_FILE)
+    if version_dir is None:
+        return None
+    try:
+        with open(os.path.join(version_dir, META_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_index(corpus_dir=DEFAULT_CORPUS_DIR, index_dir=DEFAULT_INDEX_DIR):
+    """(Re)build the index if the corpus files changed since it was built."""
+    source = source_version(corpus_dir)
+
+    def stale(meta):
+        return bool(source) and (meta is None or meta.get("source") != source
+                                 or meta.get("format") != FORMAT_VERSION)
+
+    if stale(_read_meta(index_dir)):
+        with _build_lock:
+            # Another session may have rebuilt it while this one waited
+            meta = _read_meta(index_dir)
+            if stale(meta):
+                try:
+                    build_index(read_corpus(corpus_dir), index_dir, source)
+                except OSError:
+                    # Read-only deployment: keep serving the existing index if any.
+                    if meta is None:
+                        raise
+    return index_dir
+
+
+class PassageIndex:
+    """Read-only BM25 index; arrays are memory-mapped."""
+
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR, version_dir=None):
+        version_dir = version_dir or versioned.current(index_dir, META_FILE)
+        if version_dir is None:
+            raise FileNotFoundError(f"no index in {index_dir}")
+        with open(os.path.join(version_dir, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.index_dir = index_dir
+        self.version_dir = version_dir
+        self.vocab = {term: i for i, term in enumerate(meta["terms"])}
+        self.sources = meta["sources"]
+        self.n_passages = meta["passages"]
+
+        def load(name):
+            return np.load(os.path.join(version_dir, f"{name}.npy"), mmap_mode="r")
+
+        self.indptr = load("indptr")
+        self.doc_ids = load("doc_ids")
+        self.weights = load("weights")
+        self.offsets = load("offsets")
+        self.source_ids = load("source_ids")
+        self._blob = np.memmap(os.path.join(version_dir, "passages.bin"), dtype=np.uint8, mode="r") \
+            if self.offsets[-1] else np.zeros(0, dtype=np.uint8)
+
+    def __len__(self):
+        return self.n_passages
+
+    def passage(self, i):
+        return bytes(self._blob[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+    def scores(self, query):
+        """BM25 score of every passage for ``query`` (zeros if no term is known)."""
+        terms = [self.vocab[t] for t in set(tokenize(query)) if t in self.vocab]
+        if not terms:
+            return np.zeros(self.n_passages, dtype=np.float64)
+        spans = [slice(self.indptr[t], self.indptr[t + 1]) for t in terms]
+        docs = np.concatenate([self.doc_ids[s] for s in spans])
+        weights = np.concatenate([self.weights[s] for s in spans])
+        return np.bincount(docs, weights, minlength=self.n_passages)
+
+    def search(self, query, k=3):
+        """Return up to ``k`` ``(score, passage, source)`` tuples, best first."""
+        scores = self.scores(query)
+        k = min(k, int(np.count_nonzero(scores)))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(float(scores[i]), self.passage(i), self.sources[self.source_ids[i]]) for i in top]
+
+
+@functools.lru_cache(maxsize=2)
+def _load(index_dir, version_dir, mtime):
+    return PassageIndex(index_dir, version_dir)
+
+
+def load_index(index_dir=DEFAULT_INDEX_DIR):
+    """Process-wide shared index, or ``None`` if it has not been built."""
+    version_dir = versioned.current(index_dir, META_FILE)
+    if version_dir is None:
+        return None
+    try:
+        mtime = os.stat(os.path.join(version_dir, META_FILE)).st_mtime_ns
+    except OSError:
+        return None
+    return _load(index_dir, version_dir, mtime)
+
+
+@functools.lru_cache(maxsize=4)
+def _refresh(corpus_dir, index_dir, source):
+    ensure_index(corpus_dir, index_dir)
+
+
+def get_index(corpus_dir=DEFAULT_CORPUS_DIR, index_dir=DEFAULT_INDEX_DIR):
+    """Refresh the index from ``corpus_dir`` if needed and return the shared instance.
+
+    Only the corpus files are checked on each call; the index is rebuilt when
+    they change. Returns ``None`` when there is neither an index nor a corpus.
+    """
+    _refresh(corpus_dir, index_dir, tuple(tuple(entry) for entry in source_version(corpus_dir)))
+    return load_index(index_dir)
+
+
+def search(query, k=3, index_dir=DEFAULT_INDEX_DIR, corpus_dir=DEFAULT_CORPUS_DIR):
+    """Top ``k`` passages for ``query``; empty if there is no index.
+
+    The index is kept up to date with ``corpus_dir``; pass ``None`` to
+    search ``index_dir`` as it is.
+    """
+    index = get_index(corpus_dir, index_dir) if corpus_dir else load_index(index_dir)
+    return index.search(query, k) if index else []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m smartagri.retrieval",
+                                     description="Build or query the advisory passage index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="index a folder of .txt/.md documents")
+    build.add_argument("corpus", nargs="?", default=DEFAULT_CORPUS_DIR)
+    build.add_argument("--index", default=DEFAULT_INDEX_DIR)
+    query = sub.add_parser("query", help="search the index")
+    query.add_argument("text")
+    query.add_argument("-k", type=int, default=3)
+    query.add_argument("--index", default=DEFAULT_INDEX_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+        n = build_index(read_corpus(args.corpus), args.index, source_version(args.corpus))
+        print(f"Indexed {n:,} passages from {args.corpus} in {time.perf_counter() - start:.1f}s "
+              f"-> {args.index}")
+        return 0
+
+    index = load_index(args.index)
+    if index is None:
+        print(f"error: no index in {args.index}; run the build command first", file=sys.stderr)
+        return 1
+    for score, passage, source in index.search(args.text, args.k):
+        print(f"[{score:.2f}] {source}: {passage}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
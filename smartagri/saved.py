@@ -0,0 +1,193 @@
+"""Saved page results in an append-only JSON Lines file.
+
+Each saved result is one line ``{"id", "kind", "farmer", "saved_at",
+"inputs", "result"}``. The id is a hash of the kind, farmer and inputs, so
+saving the same inputs again finds the existing record instead of adding a
+duplicate. Records are never rewritten: the store only appends, and keeps
+the set of ids in memory, reading just the lines other writers appended
+since it last looked.
+
+Export everything (or one kind) as one flat table for analysis::
+
+    python -m smartagri.saved export saved.parquet
+    python -m smartagri.saved export loans.csv --kind loan
+    python -m smartagri.saved info
+"""
+import argparse
+import collections
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_SAVED_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "data", "saved.jsonl")
+
+# Pages that can save results
+KINDS = ("crop", "market", "fertilizer", "loan")
+
+
+def _canonical(value):
+    # NumPy scalars and arrays become Python values, and whole floats ints (7.0 -> 7)
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def record_id(kind, inputs, farmer=None):
+    """Stable hash of what was asked.
+
+    Key order does not matter, and equal numbers hash the same whether they
+    are ints, floats or NumPy scalars (``7``, ``7.0`` and ``np.int64(7)``).
+    Other values that JSON cannot hold are hashed as their ``str``.
+    """
+    key = json.dumps([kind, farmer or "", _canonical(inputs)], sort_keys=True,
+                     separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+
+
+def flatten(record, prefix=""):
+    """One flat row: nested dicts become ``inputs.x`` / ``result.y`` columns,
+    lists become JSON text."""
+    row = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            row.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (list, tuple)):
+            row[prefix + key] = json.dumps(list(value), ensure_ascii=False)
+        else:
+            row[prefix + key] = value
+    return row
+
+
+class SavedStore:
+    """Append-only, deduplicated store of saved results in one JSON Lines file."""
+
+    def __init__(self, path=DEFAULT_SAVED_FILE):
+        self.path = path
+        self._ids = set()
+        self._offset = 0
+        self._lock = threading.Lock()
+        with self._lock:
+            self._catch_up()
+
+    def _catch_up(self):
+        # Index the complete lines appended since the last read
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._ids.add(json.loads(line)["id"])
+        self._offset += end
+
+    def save(self, kind, inputs, result, farmer=None):
+        """Append a record unless the same inputs are already saved.
+
+        Returns ``(id, created)``; ``created`` is False for a duplicate.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"unknown kind: {kind}")
+        rid = record_id(kind, inputs, farmer)
+        with self._lock:
+            self._catch_up()
+            if rid in self._ids:
+                return rid, False
+            record = {"id": rid, "kind": kind, "farmer": farmer or "",
+                      "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                      "inputs": inputs, "result": result}
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # One write on an O_APPEND descriptor, so concurrent writers never interleave lines
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line.encode("utf-8"))
+            finally:
+                os.close(fd)
+            self._catch_up()
+        return rid, True
+
+    def __contains__(self, rid):
+        with self._lock:
+            self._catch_up()
+            return rid in self._ids
+
+    def __len__(self):
+        with self._lock:
+            self._catch_up()
+            return len(self._ids)
+
+    def records(self, kind=None, ids=None):
+        """Saved records in the order they were saved, optionally only one kind or some ids."""
+        if not os.path.exists(self.path):
+            return
+        ids = set(ids) if ids is not None else None
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n") or not line.strip():
+                    continue
+                record = json.loads(line)
+                if (kind is None or record["kind"] == kind) and (ids is None or record["id"] in ids):
+                    yield record
+
+    def to_frame(self, kind=None, ids=None):
+        """All matching records as one flat DataFrame (see ``flatten``)."""
+        import pandas as pd
+        return pd.DataFrame([flatten(record) for record in self.records(kind, ids)])
+
+    def export(self, path, kind=None, ids=None):
+        """Write matching records to ``path`` (.csv or .parquet); returns the row count."""
+        frame = self.to_frame(kind, ids)
+        if os.path.splitext(path)[1].lower() in (".parquet", ".pq"):
+            frame.to_parquet(path, index=False)
+        else:
+            frame.to_csv(path, index=False)
+        return len(frame)
+
+    def counts(self):
+        """``{kind: records}``."""
+        return dict(collections.Counter(record["kind"] for record in self.records()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m smartagri.saved",
+                                     description="Export or inspect saved results.")
+    parser.add_argument("--file", default=DEFAULT_SAVED_FILE, help="saved results file (.jsonl)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="write saved results to CSV or Parquet")
+    export.add_argument("output", help="output file (.csv or .parquet)")
+    export.add_argument("--kind", choices=KINDS, help="only this kind of result")
+    sub.add_parser("info", help="number of saved results by kind")
+    args = parser.parse_args(argv)
+
+    store = SavedStore(args.file)
+    if args.command == "export":
+        start = time.perf_counter()
+        try:
+            rows = store.export(args.output, args.kind)
+        except ImportError:
+            print("error: Parquet files need pyarrow (pip install pyarrow)", file=sys.stderr)
+            return 1
+        print(f"Exported {rows:,} saved results in {time.perf_counter() - start:.1f}s -> {args.output}")
+    else:
+        for kind, count in sorted(store.counts().items()):
+            print(f"{kind}: {count:,}")
+        print(f"{args.file}: {len(store):,} saved results")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
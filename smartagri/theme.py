@@ -0,0 +1,238 @@
+"""Light and dark theme stylesheets.
+
+The CSS for each theme is rendered once per process and written to a
+content-hashed file under Streamlit's static folder, so every rerun only has
+to send a short ``<link>`` tag instead of the whole stylesheet.
+"""
+import functools
+import hashlib
+import os
+
+PALETTES = {
+    "light": {
+        "bg": "#FFFFFF",
+        "text": "#262626",
+        "panel": "#E8F5E9",
+        "card_bg": "#F5F5F5",
+        "input_bg": "#FFFFFF",
+        "border_color": "#4B8B3B",
+    },
+    "dark": {
+        "bg": "#0E1117",
+        "text": "#FFFFFF",
+        "panel": "#262730",
+        "card_bg": "#1E1E1E",
+        "input_bg": "#262730",
+        "border_color": "#4B8B3B",
+    },
+}
+
+PLOTLY_TEMPLATES = {"light": "plotly_white", "dark": "plotly_dark"}
+
+# URL prefix Streamlit serves the ``static/`` folder under when
+# ``server.enableStaticServing`` is on.
+STATIC_URL = "app/static"
+
+_TEMPLATE = """
+/* Force all text to be visible */
+* {{
+    color: {text} !important;
+}}
+
+/* Main App */
+.stApp {{
+    background-color: {bg} !important;
+}}
+
+/* Override Streamlit defaults */
+.stMarkdown, .stMarkdown p, .stMarkdown span, .stMarkdown div,
+.stText, p, span, div, label, h1, h2, h3, h4, h5, h6,
+.css-10trblm, .css-16idsys {{
+    color: {text} !important;
+}}
+
+/* Metrics */
+[data-testid="stMetricValue"],
+[data-testid="stMetricLabel"],
+[data-testid="stMetricDelta"],
+.css-1wivap2, .css-50ug3q {{
+    color: {text} !important;
+}}
+
+/* Input Fields */
+.stTextInput input, .stTextInput textarea,
+.stNumberInput input,
+input, textarea {{
+    background-color: {input_bg} !important;
+    color: {text} !important;
+    border: 1px solid {border_color} !important;
+}}
+
+/* Selectbox - remove visible box */
+.stSelectbox > div > div {{
+    background-color: transparent !important;
+    border: none !important;
+}}
+.stSelectbox select {{
+    background-color: {input_bg} !important;
+    color: {text} !important;
+    border: 1px solid {border_color} !important;
+}}
+.stSelectbox label {{
+    color: {text} !important;
+}}
+
+/* Sliders */
+.stSlider label, .stSlider div, .stSlider span {{
+    color: {text} !important;
+}}
+
+/* Radio and Checkbox */
+.stRadio label, .stRadio div, .stRadio span,
+.stCheckbox label, .stCheckbox div, .stCheckbox span {{
+    color: {text} !important;
+}}
+
+/* Multiselect */
+.stMultiSelect label, .stMultiSelect div, .stMultiSelect span {{
+    color: {text} !important;
+}}
+
+/* Tabs */
+[data-baseweb="tab-list"] button,
+[data-baseweb="tab-list"] button div {{
+    color: {text} !important;
+}}
+[data-baseweb="tab-list"] button[aria-selected="true"] {{
+    color: #4B8B3B !important;
+    border-bottom: 2px solid #4B8B3B !important;
+}}
+
+/* Alert boxes - keep their own colors for text */
+.stAlert, .stAlert * {{
+    /* Let alerts use their default text colors */
+}}
+
+/* Expander */
+.streamlit-expanderHeader, .streamlit-expanderHeader * {{
+    color: {text} !important;
+}}
+
+/* Dataframes */
+.stDataFrame, .stDataFrame * {{
+    color: {text} !important;
+}}
+
+/* Feature Cards - white text always */
+.feature-card {{
+    background: linear-gradient(135deg, #4B8B3B 0%, #6BA54D 100%);
+    color: #FFFFFF !important;
+    padding: 20px;
+    border-radius: 15px;
+    margin: 10px 0;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.3);
+}}
+.feature-card * {{
+    color: #FFFFFF !important;
+}}
+
+/* Chat Messages */
+.chat-user {{
+    background-color: #4B8B3B;
+    color: #FFFFFF !important;
+    padding: 12px 18px;
+    border-radius: 18px;
+    margin: 8px 0;
+    text-align: right;
+}}
+.chat-user * {{
+    color: #FFFFFF !important;
+}}
+.chat-bot {{
+    background-color: {panel};
+    color: {text} !important;
+    padding: 12px 18px;
+    border-radius: 18px;
+    margin: 8px 0;
+}}
+.chat-bot * {{
+    color: {text} !important;
+}}
+
+/* Buttons */
+.stButton > button {{
+    background-color: #4B8B3B !important;
+    color: #FFFFFF !important;
+    border: none !important;
+    font-weight: 600 !important;
+}}
+.stButton > button * {{
+    color: #FFFFFF !important;
+}}
+
+/* Download Button */
+.stDownloadButton > button {{
+    background-color: #4B8B3B !important;
+    color: #FFFFFF !important;
+}}
+.stDownloadButton > button * {{
+    color: #FFFFFF !important;
+}}
+
+/* Sidebar */
+[data-testid="stSidebar"] {{
+    background-color: {panel} !important;
+}}
+[data-testid="stSidebar"] * {{
+    color: {text} !important;
+}}
+
+/* File Uploader */
+.stFileUploader label, .stFileUploader div {{
+    color: {text} !important;
+}}
+
+/* Markdown in containers */
+.element-container, .element-container * {{
+    color: {text} !important;
+}}
+
+/* Weather cards in dark theme */
+.weather-card {{
+    color: #FFFFFF !important;
+}}"""
+
+
+@functools.lru_cache(maxsize=None)
+def build_css(theme):
+    """Return the stylesheet for ``theme`` ("light" or "dark")."""
+    palette = PALETTES["dark" if theme == "dark" else "light"]
+    return _TEMPLATE.format(**palette)
+
+
+@functools.lru_cache(maxsize=None)
+def stylesheet_name(theme):
+    """Content-hashed file name of the stylesheet for ``theme``."""
+    digest = hashlib.sha256(build_css(theme).encode("utf-8")).hexdigest()[:12]
+    return f"theme-{theme}-{digest}.css"
+
+
+def stylesheet_markup(theme, static_dir):
+    """HTML that applies ``theme``.
+
+    Writes the stylesheet into ``static_dir`` (once; the name is content
+    hashed) and returns a ``<link>`` to it. Falls back to an inline
+    ``<style>`` block if the folder is not writable.
+    """
+    name = stylesheet_name(theme)
+    path = os.path.join(static_dir, name)
+    try:
+        if not os.path.exists(path):
+            os.makedirs(static_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(build_css(theme))
+            os.replace(tmp, path)
+    except OSError:
+        return f"<style>{build_css(theme)}</style>"
+    return f'<link rel="stylesheet" href="{STATIC_URL}/{name}">'
@@ -0,0 +1,63 @@
+"""Generated folders that are replaced atomically.
+
+A build writes a complete new version folder (``v-*``) inside the root
+folder and then publishes it by atomically replacing the ``CURRENT`` pointer
+file. Readers resolve the pointer once and open that version, so there is
+always a complete folder to read, and concurrent builds never share a
+temporary folder. The previous version is kept for readers that are still
+opening it; older ones are removed.
+
+Roots written before version folders (files directly in the root) are still
+read, and are cleaned up by the next build.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+POINTER_FILE = "CURRENT"
+
+# Version folders younger than this may still be written or read by another process
+STALE_SECONDS = 600
+
+
+def new_version(root):
+    """A new, empty and uniquely named version folder inside ``root``."""
+    os.makedirs(root, exist_ok=True)
+    return tempfile.mkdtemp(prefix="v-", dir=root)
+
+
+def current(root, marker):
+    """Folder of the published version of ``root``, or ``None``.
+
+    ``marker`` is a file every complete version has; it identifies a root in
+    the flat layout from before version folders.
+    """
+    try:
+        with open(os.path.join(root, POINTER_FILE), encoding="utf-8") as f:
+            return os.path.join(root, f.read().strip())
+    except OSError:
+        return root if os.path.exists(os.path.join(root, marker)) else None
+
+
+def publish(root, version_dir, marker):
+    """Make ``version_dir`` the current version of ``root`` and prune old ones."""
+    previous = current(root, marker)
+    fd, pointer = tempfile.mkstemp(prefix=f"{POINTER_FILE}.", dir=root)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(os.path.basename(version_dir))
+    os.replace(pointer, os.path.join(root, POINTER_FILE))
+
+    keep = {version_dir, previous, current(root, marker)}
+    cutoff = time.time() - STALE_SECONDS
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        # Another build may be pruning the same folder, so entries can vanish under us
+        try:
+            if name.startswith("v-") and path not in keep and os.stat(path).st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.isfile(path) and not name.startswith(POINTER_FILE) and previous != root:
+                # Files of the flat layout, once no reader can still be using them
+                os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,278 @@
+"""Weather forecasts and weather-based farming advisories.
+
+Forecasts come from a pluggable ``WeatherProvider``. ``FileWeatherProvider``
+is a local stand-in that derives daily forecasts from the per-state monthly
+climate normals in ``data/weather/normals.csv``. Wrap any provider in
+``CachedWeatherProvider`` to share a TTL cache across sessions and refresh
+every location concurrently in the background, so page views read from the
+cache instead of waiting on a fetch.
+"""
+import asyncio
+import csv
+import datetime
+import logging
+import os
+import threading
+import time
+import zlib
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NORMALS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "data", "weather", "normals.csv")
+
+# Mean daily rainfall (mm) above which drainage warnings are issued.
+HEAVY_RAIN_MM = 20
+
+FORECAST_DAYS = 7
+DEFAULT_TTL = 30 * 60
+
+
+def weather_advisory(rainfall):
+    """Return ``(level, message)`` for a sequence of daily rainfall values."""
+    if sum(rainfall) / len(rainfall) > HEAVY_RAIN_MM:
+        return "warning", "⚠️ Heavy rainfall expected - ensure proper drainage"
+    return "success", "✅ Good weather for farming activities"
+
+
+class DailyForecast:
+    """Daily weather for one location; every field except ``location`` and
+    ``fetched_at`` is an array with one value per day."""
+
+    __slots__ = ("location", "dates", "temp_max", "temp_min", "rainfall", "humidity",
+                 "wind_speed", "sunshine_hours", "fetched_at")
+
+    def __init__(self, location, dates, temp_max, temp_min, rainfall, humidity, wind_speed,
+                 sunshine_hours, fetched_at=None):
+        self.location = location
+        self.dates = dates
+        self.temp_max = temp_max
+        self.temp_min = temp_min
+        self.rainfall = rainfall
+        self.humidity = humidity
+        self.wind_speed = wind_speed
+        self.sunshine_hours = sunshine_hours
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+
+class WeatherProvider:
+    """Interface for weather backends."""
+
+    def fetch(self, location, days=FORECAST_DAYS, start=None):
+        """Return a ``DailyForecast`` for ``days`` days from ``start`` (default today)."""
+        raise NotImplementedError
+
+    async def fetch_async(self, location, days=FORECAST_DAYS, start=None):
+        """Async variant of ``fetch``; by default runs ``fetch`` in a worker thread."""
+        return await asyncio.to_thread(self.fetch, location, days, start)
+
+
+# ----------------------------
+# FILE-BASED STAND-IN
+# ----------------------------
+NORMAL_FIELDS = ("temp_max", "temp_min", "rainfall_mm", "humidity", "wind_speed", "sunshine_hours")
+
+
+def load_normals(path=DEFAULT_NORMALS_FILE):
+    """Return ``{state: array of shape (12, len(NORMAL_FIELDS))}``."""
+    normals = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            table = normals.setdefault(row["state"], np.zeros((12, len(NORMAL_FIELDS))))
+            table[int(row["month"]) - 1] = [float(row[field]) for field in NORMAL_FIELDS]
+    return normals
+
+
+def daily_normals(table, dates):
+    """Interpolate one state's monthly normals (``table`` from ``load_normals``)
+    to each of ``dates``; shape ``(len(dates), len(NORMAL_FIELDS))``.
+
+    Values are anchored at mid-month and wrap around the year. Rainfall stays
+    a monthly total.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    month = months.astype(int) % 12
+    day = (dates - months).astype(int)
+    position = month + (day - 14.5) / 30.4
+    ext = np.vstack([table[-1:], table, table[:1]])
+    return np.stack([np.interp(position, np.arange(-1, 13), ext[:, i])
+                     for i in range(ext.shape[1])], axis=1)
+
+
+class FileWeatherProvider(WeatherProvider):
+    """Deterministic daily weather synthesised from monthly climate normals.
+
+    Normals are interpolated between mid-month values and perturbed with
+    noise seeded by location and date, so the same day always gets the same
+    weather.
+    """
+
+    def __init__(self, path=DEFAULT_NORMALS_FILE):
+        self.normals = load_normals(path)
+
+    def locations(self):
+        return list(self.normals)
+
+    def fetch(self, location, days=FORECAST_DAYS, start=None):
+        if location not in self.normals:
+            raise KeyError(f"no weather normals for {location!r}")
+        start = np.datetime64(start or datetime.date.today(), "D")
+        dates = start + np.arange(days).astype("timedelta64[D]")
+        daily = daily_normals(self.normals[location], dates)
+
+        noise = np.array([np.random.default_rng(zlib.crc32(f"{location}|{d}".encode())).random(4)
+                          for d in dates.astype(str)])
+        rain_mean = daily[:, 2] / 30.4
+        wet_chance = np.clip(rain_mean / 8, 0.05, 0.9)
+        rainfall = np.where(noise[:, 0] < wet_chance, rain_mean / wet_chance * 2 * noise[:, 1], 0.0)
+        anomaly = (noise[:, 2] - 0.5) * 4
+
+        return DailyForecast(
+            location, dates,
+            temp_max=np.round(daily[:, 0] + anomaly, 1),
+            temp_min=np.round(daily[:, 1] + anomaly / 2, 1),
+            rainfall=np.round(rainfall, 1),
+            humidity=np.clip(np.round(daily[:, 3] + np.where(rainfall > 0, 5, -4)), 10, 98),
+            wind_speed=np.round(daily[:, 4] * (0.7 + 0.6 * noise[:, 3]), 1),
+            sunshine_hours=np.round(np.where(rainfall > 0, 0.6, 1.05) * daily[:, 5], 1),
+        )
+
+
+# ----------------------------
+# CACHING AND PREFETCH
+# ----------------------------
+class TTLCache:
+    """Thread-safe mapping whose entries go stale ``ttl`` seconds after being set.
+
+    Holds at most ``maxsize`` entries; the least recently set is dropped first.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return ``(value, fresh)``; ``(None, False)`` if ``key`` was never set."""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return None, False
+        value, expires = entry
+        return value, time.monotonic() < expires
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class CachedWeatherProvider(WeatherProvider):
+    """Serve forecasts from a shared TTL cache kept warm by a background prefetcher.
+
+    Stale entries are still returned and refreshed in a background thread;
+    only a forecast that has never been fetched is fetched inline.
+    """
+
+    def __init__(self, backend, ttl=DEFAULT_TTL, concurrency=8):
+        self.backend = backend
+        self.cache = TTLCache(ttl)
+        self.concurrency = concurrency
+        self._prefetcher = None
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        # Failed fetches over all prefetch rounds, and the errors of the latest round
+        self.prefetch_failures = 0
+        self.prefetch_errors = {}
+
+    def fetch(self, location, days=FORECAST_DAYS, start=None):
+        key = (location, days, start)
+        value, fresh = self.cache.get(key)
+        if value is None:
+            value = self.backend.fetch(location, days, start)
+            self.cache.set(key, value)
+        elif not fresh:
+            self._refresh_later(key)
+        return value
+
+    def _refresh_later(self, key):
+        # One background refetch per stale key at a time
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.cache.set(key, self.backend.fetch(*key))
+            except Exception as exc:
+                logger.warning("weather refresh failed for %s: %r", key[0], exc)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name="weather-refresh", daemon=True).start()
+
+    async def refresh(self, locations, days=FORECAST_DAYS):
+        """Fetch every location concurrently and update the cache.
+
+        Returns ``{location: exception}`` for the locations that failed.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(location):
+            async with semaphore:
+                self.cache.set((location, days, None),
+                               await self.backend.fetch_async(location, days))
+
+        results = await asyncio.gather(*(one(loc) for loc in locations), return_exceptions=True)
+        return {loc: r for loc, r in zip(locations, results) if isinstance(r, Exception)}
+
+    def start_prefetch(self, locations, days=FORECAST_DAYS, interval=None):
+        """Refresh ``locations`` now and then every ``interval`` seconds (default:
+        half the TTL) in a daemon thread. Calling it again is a no-op.
+
+        Failures are logged and counted in ``prefetch_failures`` /
+        ``prefetch_errors``; the thread keeps running, so a bad round only
+        leaves entries stale until the next one. It stops quietly when the
+        interpreter shuts down.
+        """
+        with self._lock:
+            if self._prefetcher is not None:
+                return self._prefetcher
+            interval = interval or self.cache.ttl / 2
+            locations = list(locations)
+
+            def loop():
+                while True:
+                    round_error = None
+                    try:
+                        errors = asyncio.run(self.refresh(locations, days))
+                    except Exception as exc:
+                        round_error = exc
+                        errors = dict.fromkeys(locations, exc)
+                    if not threading.main_thread().is_alive():
+                        # Shutting down: executors refuse new work, so every fetch fails
+                        return
+                    if round_error is not None:
+                        logger.error("weather prefetch round failed", exc_info=round_error)
+                    else:
+                        for location, exc in errors.items():
+                            logger.warning("weather prefetch failed for %s: %r", location, exc)
+                    self.prefetch_errors = errors
+                    self.prefetch_failures += len(errors)
+                    time.sleep(interval)
+
+            self._prefetcher = threading.Thread(target=loop, name="weather-prefetch", daemon=True)
+            self._prefetcher.start()
+            return self._prefetcher
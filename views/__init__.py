@@ -0,0 +1,29 @@
+"""Pages of the Streamlit app, one module per sidebar entry.
+
+Each module has a ``render()`` function and is imported the first time
+its page is opened, so a session only loads the code (and the smartagri
+modules behind it) for the pages it visits.
+"""
+import importlib
+
+# Sidebar label -> module in this package
+PAGES = {
+    "Home": "home",
+    "Crop Recommendation": "crop_recommendation",
+    "Market Forecast": "market",
+    "State Insights": "state_insights",
+    "Weather Insights": "weather",
+    "Disease Detection": "disease",
+    "Loan Calculator": "loans",
+    "Fertilizer Calculator": "fertilizer",
+    "Water Management": "water",
+    "Government Schemes": "schemes",
+    "Chatbot": "chatbot",
+    "My Profile": "profile",
+    "Settings": "settings",
+}
+
+
+def render(page):
+    """Import the module for sidebar entry ``page`` (once) and draw it."""
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
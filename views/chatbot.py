@@ -0,0 +1,38 @@
+"""Chatbot page."""
+import streamlit as st
+
+from smartagri.chatbot import get_chatbot_response
+from smartagri.lang import LANG
+
+
+def render():
+    st.header(f"💬 {LANG[st.session_state.language]['chatbot']}")
+    
+    st.markdown("Ask me anything about farming, crops, loans, or government schemes!")
+    
+    chat_container = st.container()
+    with chat_container:
+        for msg in st.session_state.chat_history.recent(10):
+            if msg.role == 'user':
+                st.markdown(f"<div class='chat-user'>{msg.content}</div>", 
+                           unsafe_allow_html=True)
+            else:
+                st.markdown(f"<div class='chat-bot'>{msg.content}</div>", 
+                           unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        user_msg = st.text_input("Your question:", key="chat_input", 
+                                placeholder="e.g., How to grow rice?")
+    with col2:
+        send_btn = st.button(LANG[st.session_state.language]["send"], type="primary")
+    
+    if send_btn and user_msg:
+        st.session_state.chat_history.append("user", user_msg)
+        response = get_chatbot_response(user_msg)
+        st.session_state.chat_history.append("bot", response)
+        st.rerun()
+    
+    if st.button("Clear Chat"):
+        st.session_state.chat_history.clear()
+        st.rerun()
@@ -0,0 +1,112 @@
+"""Session defaults, theme and services shared by the pages.
+
+This module is imported once per process, so the ``st.cache_resource``
+services are registered once instead of on every rerun.
+"""
+import os
+
+import streamlit as st
+
+from smartagri.chatlog import ChatLog
+from smartagri.perf import timed
+from smartagri.profilestore import ProfileStore
+from smartagri.regions import ALL_INDIAN_STATES
+from smartagri.saved import SavedStore
+from smartagri.theme import PLOTLY_TEMPLATES, stylesheet_markup
+from smartagri.weather import CachedWeatherProvider, FileWeatherProvider
+
+# Served by Streamlit at app/static/ (see .streamlit/config.toml)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+# Page state that starts out empty
+SESSION_KEYS = ["crop_list", "crop_scores", "crop_inputs", "show_graph", "show_advisory", "state_crops",
+                "show_state_graph", "market_data", "soil", "weather_data", "disease_prediction",
+                "fertilizer_calc", "loan_calc", "water_calc"]
+
+
+# ----------------------------
+# SESSION STATE INIT
+# ----------------------------
+def init_session():
+    # Runs the defaults once per session; later reruns only check the flag
+    if st.session_state.get("session_ready"):
+        return
+    defaults = {
+        "theme": "light",
+        "language": "English",
+        "farmer_profile": {},
+        "farmer_token": None,
+        "saved_recommendations": [],
+        "profile_complete": False,
+        "profile_loaded": False,
+    }
+    defaults.update(dict.fromkeys(SESSION_KEYS))
+    for key, value in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = ChatLog()
+    st.session_state.session_ready = True
+
+
+# ----------------------------
+# THEME STYLING
+# ----------------------------
+@st.cache_resource
+def theme_markup(theme):
+    return stylesheet_markup(theme, STATIC_DIR)
+
+
+@timed("theme.set_theme")
+def set_theme(theme):
+    st.session_state.plotly_template = PLOTLY_TEMPLATES.get(theme, "plotly_white")
+    st.markdown(theme_markup(theme), unsafe_allow_html=True)
+
+
+# ----------------------------
+# SHARED SERVICES
+# ----------------------------
+@st.cache_resource
+def weather_service():
+    # One cache for all sessions, refreshed for every state in the background
+    service = CachedWeatherProvider(FileWeatherProvider())
+    service.start_prefetch(ALL_INDIAN_STATES)
+    return service
+
+
+@st.cache_resource
+def profile_store():
+    # One SQLite connection pool for all sessions
+    return ProfileStore()
+
+
+@st.cache_resource
+def saved_store():
+    # One append-only file of saved results for all sessions
+    return SavedStore()
+
+
+def save_result(kind, inputs, result):
+    # Store a page result for the current farmer; saving the same inputs again is a no-op
+    rid, created = saved_store().save(kind, inputs, result,
+                                      farmer=st.session_state.farmer_profile.get("phone"))
+    if rid not in st.session_state.saved_recommendations:
+        st.session_state.saved_recommendations.append(rid)
+    if created:
+        st.success("✅ Saved!")
+    else:
+        st.info("Already saved.")
+
+
+def load_saved_profile():
+    # Lazy-load the profile linked in the URL (?farmer=<access token>) on first access.
+    # Holding the token is what makes the session the profile's owner.
+    if st.session_state.profile_loaded:
+        return
+    st.session_state.profile_loaded = True
+    token = st.query_params.get("farmer")
+    profile = profile_store().get_by_token(token)
+    if profile:
+        st.session_state.farmer_profile = profile
+        st.session_state.farmer_token = token
+        st.session_state.profile_complete = True
@@ -0,0 +1,130 @@
+"""Crop Recommendation page."""
+import streamlit as st
+
+from smartagri.charts import crop_comparison_chart
+from smartagri.crops import CROP_CALENDAR, SEASON_LABELS, SOILS, crop_insights, recommend_crops
+from smartagri.lang import LANG
+from smartagri.memo import memoize
+from smartagri.perf import timed
+from smartagri.regions import ALL_INDIAN_STATES
+from views.common import save_result
+
+# Page results keyed on their exact inputs, shared by all sessions
+cached_recommendations = memoize(maxsize=512, ttl=3600)(recommend_crops)
+cached_insights = memoize(maxsize=512, ttl=3600)(crop_insights)
+
+
+def render():
+    st.header(f"🌱 {LANG[st.session_state.language]['recommend_crops']}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        state = st.selectbox("Select State", ALL_INDIAN_STATES)
+        soil = st.selectbox("Soil Type", SOILS)
+        rainfall = st.slider("Rainfall (mm)", 100, 3000, 800)
+    
+    with col2:
+        temp = st.slider("Temperature (°C)", 10, 45, 28)
+        humidity = st.slider("Humidity (%)", 20, 100, 60)
+        ph = st.slider("Soil pH", 4.0, 9.0, 6.5, 0.1)
+
+    season = st.radio("Season", SEASON_LABELS)
+    
+    if st.button("🌾 Get Recommendations", type="primary"):
+        inputs = (rainfall, temp, humidity, ph, soil, season, state)
+        results = cached_recommendations(*inputs)
+        st.session_state.crop_scores = {r["crop"]: r for r in results}
+        st.session_state.crop_list = [r["crop"] for r in results]
+        st.session_state.crop_inputs = inputs
+        st.success(f"✅ Top {len(st.session_state.crop_list)} Recommended Crops: {', '.join(st.session_state.crop_list)}")
+
+    if st.session_state.crop_list:
+        # Same inputs -> same cached figures on every rerun and tab
+        insights = cached_insights(st.session_state.crop_list, *st.session_state.crop_inputs)
+        if st.button("💾 Save Recommendations"):
+            save_result("crop",
+                        dict(zip(("rainfall", "temperature", "humidity", "ph", "soil", "season", "state"),
+                                 st.session_state.crop_inputs)),
+                        {"crops": st.session_state.crop_list,
+                         "scores": [round(st.session_state.crop_scores[c]["score"], 3)
+                                    for c in st.session_state.crop_list]})
+        # pandas is imported only on the pages that use it
+        import pandas as pd
+        tabs = st.tabs(["Recommended Crops", "Performance Graph", "Farming Advisory", "Crop Calendar"])
+        
+        with tabs[0]:
+            st.subheader("🌾 Detailed Crop Information")
+            for i, crop in enumerate(st.session_state.crop_list, 1):
+                info = insights[crop]
+                yield_val, profit, duration = info["expected_yield"], info["profit"], info["duration"]
+                water_req = info["water"]
+                match = (st.session_state.crop_scores or {}).get(crop, {}).get("score", 0)
+                
+                st.markdown(f"""
+                <div class='feature-card'>
+                <h4>{i}. {crop}</h4>
+                <p><strong>Expected Yield:</strong> {yield_val}% | <strong>Profit:</strong> ₹{profit:,}/acre | <strong>Duration:</strong> {duration} days</p>
+                <p><strong>Water Requirement:</strong> {water_req} | <strong>Season:</strong> {season.split()[0]} | <strong>Suitability:</strong> {match:.0%}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with tabs[1]:
+            st.subheader("📊 Crop Performance Analysis")
+            crop_list = st.session_state.crop_list
+            
+            with timed("chart.crop_comparison"):
+                fig = crop_comparison_chart(
+                    crop_list,
+                    [insights[c]["yield_index"] for c in crop_list],
+                    [insights[c]["profit_potential"] for c in crop_list],
+                    [insights[c]["risk"] for c in crop_list],
+                    st.session_state.plotly_template
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+        with tabs[2]:
+            st.subheader("🌾 Comprehensive Farming Advisory")
+            
+            st.markdown("#### 💧 Irrigation Management")
+            st.info("• Drip irrigation saves 40-60% water and increases yield by 20-50%")
+            st.info("• Irrigate early morning (6-8 AM) or evening (5-7 PM) to reduce evaporation")
+            st.info("• Monitor soil moisture regularly using feel method or tensiometers")
+            
+            st.markdown("#### 🌿 Soil & Nutrient Management")
+            st.info("• Conduct soil testing annually for accurate NPK recommendations")
+            st.info("• Apply 5-10 tons of FYM/compost per acre to improve soil health")
+            st.info("• Follow crop rotation: Cereal → Legume → Oilseed cycle")
+            
+            st.markdown("#### 🦗 Pest & Disease Control")
+            st.info("• Follow Integrated Pest Management (IPM) practices")
+            st.info("• Scout fields weekly for early pest detection")
+            st.info("• Use neem-based pesticides as first line of defense")
+            
+            st.markdown("#### 🌾 Best Practices")
+            st.info("• Use certified quality seeds from authorized dealers")
+            st.info("• Maintain proper plant spacing for air circulation")
+            st.info("• Keep field borders clean to reduce pest breeding")
+            st.info("• Record all farming activities for better planning")
+        
+        with tabs[3]:
+            st.subheader("📅 Seasonal Crop Calendar")
+            calendar_data = []
+            season_key = season.split()[0]
+            for crop in st.session_state.crop_list:
+                calendar_data.append({
+                    "Crop": crop,
+                    "Sowing Period": CROP_CALENDAR[season_key]["sowing"],
+                    "Harvest Period": CROP_CALENDAR[season_key]["harvest"],
+                    "Duration": f"{insights[crop]['duration']} days",
+                    "Season": season_key
+                })
+            
+            cal_df = pd.DataFrame(calendar_data)
+            st.dataframe(cal_df, use_container_width=True)
+            
+            st.markdown("#### 📋 Important Milestones")
+            st.write("**Week 1-2:** Land preparation, seed treatment")
+            st.write("**Week 3-4:** Sowing/transplanting, first irrigation")
+            st.write("**Week 5-8:** Vegetative growth, fertilizer application")
+            st.write("**Week 9-12:** Flowering/fruiting, pest monitoring")
+            st.write("**Final Weeks:** Maturity, harvest preparation")
@@ -0,0 +1,77 @@
+"""Disease Detection page."""
+import streamlit as st
+
+from smartagri.disease import (DISEASES, PREVENTION, TREATMENT, classify_async, diagnose,
+                               load_model, parse_label)
+from smartagri.imaging import ImageCache, ImageTooLarge, decode_image
+
+
+def uploaded_photo(uploaded):
+    # Decode each upload once; the session keeps only the thumbnail and model tensor.
+    if "images" not in st.session_state:
+        st.session_state.images = ImageCache()
+    photo = st.session_state.images.get(uploaded.file_id)
+    if photo is None:
+        model = load_model()
+        try:
+            photo = decode_image(uploaded.getvalue(), model.input_size if model else None)
+        except ImageTooLarge as exc:
+            st.error(f"⚠️ {exc}. Please upload a smaller photo.")
+            return None
+        except OSError:
+            st.error("⚠️ Could not read this image.")
+            return None
+        st.session_state.images.put(uploaded.file_id, photo)
+    return photo
+
+
+def render():
+    st.header("🦠 Crop Disease Detection")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        crop = st.selectbox("Select Crop", list(DISEASES))
+        symptoms = st.multiselect("Symptoms", 
+                                  ["Yellow Leaves","Brown Spots","Wilting","Holes"])
+        severity = st.select_slider("Severity", ["Mild","Moderate","Severe"])
+    
+    with col2:
+        uploaded = st.file_uploader("Upload Image (Optional)", type=['jpg','png'])
+        pending = None
+        photo = uploaded_photo(uploaded) if uploaded else None
+        if photo is not None:
+            st.image(photo.thumbnail, caption="Analyzing...", width=250)
+            # Start inference now so it overlaps with filling in the form.
+            pending = classify_async(photo)
+    
+    if st.button("Diagnose Disease", type="primary"):
+        predictions = None
+        if pending is not None:
+            with st.spinner("Analyzing leaf photo..."):
+                try:
+                    predictions = pending.result(timeout=60)
+                except Exception:
+                    st.warning("⚠️ Could not analyze this photo - showing the crop-based diagnosis.")
+        
+        if predictions:
+            label, confidence = predictions[0]
+            photo_crop, disease = parse_label(label)
+            st.success(f"🔍 Detected: **{disease}**" + (f" ({photo_crop})" if photo_crop else ""))
+            st.info(f"**Treatment:** {TREATMENT}")
+            st.info(f"**Prevention:** {PREVENTION}")
+            st.metric("AI Confidence", f"{confidence:.0%}")
+            if photo_crop and photo_crop != crop:
+                st.warning(f"The photo looks like {photo_crop}, not {crop}.")
+            if len(predictions) > 1:
+                st.caption("Other possibilities: " + ", ".join(
+                    f"{parse_label(l)[1]} ({p:.0%})" for l, p in predictions[1:]))
+        else:
+            disease = diagnose(crop)
+            st.success(f"🔍 Most likely: **{disease}**")
+            st.info(f"**Treatment:** {TREATMENT}")
+            st.info(f"**Prevention:** {PREVENTION}")
+            if load_model() is None:
+                st.caption("Based on the most common disease for this crop.")
+            else:
+                st.caption("Based on the most common disease for this crop. "
+                           "Upload a leaf photo for an image-based diagnosis.")
@@ -0,0 +1,95 @@
+"""Fertilizer Calculator page."""
+import numpy as np
+import streamlit as st
+
+from smartagri.fertilizer import (FERTILIZER_CROPS, fertilizer_plan, fertilizer_quantities,
+                                  load_catalog, nutrient_needs, plan_plots)
+from smartagri.lang import LANG
+from views.common import save_result
+
+
+def render():
+    st.header("🧪 NPK Fertilizer Calculator")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        crop = st.selectbox("Crop", FERTILIZER_CROPS)
+        area = st.number_input("Area (acres)", 0.5, 100.0, 5.0, 0.5)
+        yield_target = st.number_input("Target Yield (q/acre)", 10, 100, 50)
+    
+    with col2:
+        soil_n = st.number_input("Soil Nitrogen (kg/acre)", 0, 500, 180)
+        soil_p = st.number_input("Soil Phosphorus (kg/acre)", 0, 100, 25)
+        soil_k = st.number_input("Soil Potassium (kg/acre)", 0, 500, 150)
+    
+    if st.button(LANG[st.session_state.language]["calculate"], type="primary"):
+        st.session_state.fertilizer_calc = (crop, area, yield_target, soil_n, soil_p, soil_k)
+    
+    if st.session_state.fertilizer_calc:
+        inputs = st.session_state.fertilizer_calc
+        needs = nutrient_needs(*inputs)
+        
+        labels = {"N": "Nitrogen (N)", "P": "Phosphorus (P)", "K": "Potassium (K)"}
+        for col, nutrient in zip(st.columns(3), ("N", "P", "K")):
+            with col:
+                st.metric(labels[nutrient], f"{needs[nutrient]:.1f} kg")
+        
+        st.subheader("🛒 Least-Cost Fertilizer Mix")
+        catalog = load_catalog()
+        plan = fertilizer_plan(needs, catalog)
+        if plan is None:
+            st.warning("The fertilizer catalog cannot supply these nutrients.")
+        elif not plan[0]:
+            st.success("✅ Soil nutrients already meet the target - no fertilizer needed.")
+        else:
+            items, total_cost = plan
+            import pandas as pd
+            st.dataframe(pd.DataFrame(items, columns=["Product", "Quantity (kg)", "Cost (₹)"]).round(1),
+                         use_container_width=True, hide_index=True)
+            prices = dict(zip(catalog.products, catalog.price))
+            straight = sum(kg * prices.get(product, np.nan)
+                           for product, kg in fertilizer_quantities(needs).values())
+            st.metric("Total Cost", f"₹{total_cost:,.0f}",
+                      delta=f"₹{straight - total_cost:,.0f} saved vs Urea/DAP/MOP"
+                      if straight > total_cost else None)
+        
+        if st.button("💾 Save Plan"):
+            items, total_cost = plan if plan else ([], None)
+            save_result("fertilizer",
+                        dict(zip(("crop", "area", "yield_target", "soil_n", "soil_p", "soil_k"), inputs)),
+                        {**{n: round(float(needs[n]), 2) for n in ("N", "P", "K")},
+                         "mix": {product: round(float(kg), 2) for product, kg, _ in items},
+                         "cost": None if total_cost is None else round(float(total_cost), 2)})
+    
+    st.markdown("---")
+    with st.expander("👥 Cooperative Purchase Order"):
+        st.markdown("Upload a CSV of plots with columns `crop`, `area` (acres), `yield_target` "
+                    "(q/acre), `soil_n`, `soil_p` and `soil_k` (kg/acre).")
+        plots_file = st.file_uploader("Member plots", type=["csv"])
+        if plots_file is not None:
+            import pandas as pd
+            try:
+                plots = plan_plots(pd.read_csv(plots_file))
+            except ValueError as exc:
+                st.error(f"Could not read plots: {exc}")
+            else:
+                catalog = load_catalog()
+                order = plots[catalog.products].sum()
+                order = pd.DataFrame({"Product": order.index, "Quantity (kg)": order.to_numpy(),
+                                      "Cost (₹)": order.to_numpy() * catalog.price})
+                order = order[order["Quantity (kg)"] > 0].round(1)
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Plots", f"{len(plots):,}")
+                with col2:
+                    st.metric("Total Cost", f"₹{plots['cost'].sum():,.0f}")
+                if plots["cost"].isna().any():
+                    st.warning(f"{plots['cost'].isna().sum()} plots could not be met by the catalog.")
+                st.dataframe(order, use_container_width=True, hide_index=True)
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.download_button("⬇️ Purchase Order (CSV)", order.to_csv(index=False),
+                                       file_name="purchase_order.csv", mime="text/csv")
+                with col2:
+                    st.download_button("⬇️ Per-plot Mix (CSV)", plots.round(2).to_csv(index=False),
+                                       file_name="plot_fertilizer_mix.csv", mime="text/csv")
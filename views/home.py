@@ -0,0 +1,71 @@
+"""Home page: headline metrics and feature overview."""
+import streamlit as st
+
+from smartagri.lang import LANG
+
+
+def render():
+    st.markdown(f"<h1 style='text-align:center;color:#4B8B3B;'>{LANG[st.session_state.language]['welcome']}</h1>", 
+                unsafe_allow_html=True)
+    st.markdown("<h3 style='text-align:center;'>Your Complete Digital Farming Companion 🚜</h3>", 
+                unsafe_allow_html=True)
+    
+    # Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Active Farmers", "25,000+", "+18%")
+    with col2:
+        st.metric("Crops Database", "100+")
+    with col3:
+        st.metric("States Covered", "37")
+    with col4:
+        st.metric("Success Rate", "96%")
+    
+    st.markdown("---")
+    
+    # Features
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div class='feature-card'>
+        <h3>🌱 Crop Recommendation</h3>
+        <p>AI-powered crop suggestions based on soil, climate, and location</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class='feature-card'>
+        <h3>🦠 Disease Detection</h3>
+        <p>Identify crop diseases and get treatment plans</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class='feature-card'>
+        <h3>📈 Market Forecast</h3>
+        <p>Price predictions powered by ML algorithms</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class='feature-card'>
+        <h3>💰 Loan Calculator</h3>
+        <p>Calculate EMI for agricultural loans</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class='feature-card'>
+        <h3>🌤️ Weather Insights</h3>
+        <p>7-day forecast with farming advisories</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class='feature-card'>
+        <h3>🏛️ Government Schemes</h3>
+        <p>Complete information on subsidies and support</p>
+        </div>
+        """, unsafe_allow_html=True)
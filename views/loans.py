@@ -0,0 +1,97 @@
+"""Loan Calculator page."""
+import streamlit as st
+
+from smartagri.charts import loan_breakdown_chart, portfolio_chart
+from smartagri.lang import LANG
+from smartagri.loans import (LOAN_TYPES, amortization_schedule, apply_subsidy, compute_emi,
+                             portfolio_cashflows, price_portfolio)
+from smartagri.perf import timed
+from views.common import save_result
+
+
+def render():
+    st.header("💰 Agricultural Loan Calculator")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        loan_type = st.selectbox("Loan Type", LOAN_TYPES)
+        amount = st.number_input("Loan Amount (₹)", 10000, 10000000, 200000, 10000)
+        rate = st.slider("Interest Rate (%)", 4.0, 15.0, 7.0, 0.5)
+    
+    with col2:
+        tenure = st.slider("Tenure (months)", 6, 240, 36)
+        subsidy = st.checkbox("Interest Subsidy (3% on the first ₹3 lakh)")
+        effective_rate = apply_subsidy(rate, subsidy, amount)
+        st.success(f"Effective Rate: {effective_rate}%")
+    
+    if st.button(LANG[st.session_state.language]["calculate"], type="primary"):
+        st.session_state.loan_calc = (loan_type, amount, rate, subsidy, effective_rate, tenure)
+    
+    if st.session_state.loan_calc:
+        loan_type, amount, rate, subsidy, effective_rate, tenure = st.session_state.loan_calc
+        emi, total, interest = compute_emi(amount, effective_rate, tenure)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Monthly EMI", f"₹{emi:,.0f}")
+        with col2:
+            st.metric("Total Interest", f"₹{interest:,.0f}")
+        with col3:
+            st.metric("Total Payment", f"₹{total:,.0f}")
+        
+        st.markdown("---")
+        st.subheader("📊 Payment Breakdown")
+        import pandas as pd
+        
+        with timed("chart.loan_breakdown"):
+            fig = loan_breakdown_chart(amount, interest, st.session_state.plotly_template)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.subheader("📅 Repayment Schedule")
+        schedule = pd.DataFrame(amortization_schedule(amount, effective_rate, tenure)).round(2)
+        st.dataframe(schedule, use_container_width=True, hide_index=True, height=300)
+        st.download_button("⬇️ Download Schedule (CSV)", schedule.to_csv(index=False),
+                           file_name=f"loan_schedule_{amount}_{tenure}m.csv", mime="text/csv")
+        
+        if st.button("💾 Save Loan"):
+            save_result("loan", {"loan_type": loan_type, "amount": amount, "rate": rate,
+                                 "subsidy": subsidy, "tenure": tenure},
+                        {"effective_rate": effective_rate, "emi": round(emi, 2),
+                         "total_interest": round(interest, 2), "total_payment": round(total, 2)})
+    
+    st.markdown("---")
+    with st.expander("📁 Portfolio Calculator"):
+        st.markdown("Upload a CSV of loans with columns `amount`, `rate` (% per year), "
+                    "`tenure` (months) and optionally `subsidy` (percentage points, e.g. 3).")
+        portfolio_file = st.file_uploader("Loan portfolio", type=["csv"])
+        if portfolio_file is not None:
+            import pandas as pd
+            try:
+                loans = price_portfolio(pd.read_csv(portfolio_file))
+            except ValueError as exc:
+                st.error(f"Could not read portfolio: {exc}")
+            else:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Loans", f"{len(loans):,}")
+                with col2:
+                    st.metric("Monthly EMI", f"₹{loans['emi'].sum():,.0f}")
+                with col3:
+                    st.metric("Total Interest", f"₹{loans['total_interest'].sum():,.0f}")
+                
+                cashflows = pd.DataFrame(portfolio_cashflows(
+                    loans["amount"], loans["effective_rate"], loans["tenure"])).round(2)
+                with timed("chart.portfolio_cashflows"):
+                    fig = portfolio_chart(cashflows["month"].to_numpy(),
+                                          cashflows["principal"].to_numpy(),
+                                          cashflows["interest"].to_numpy(),
+                                          st.session_state.plotly_template)
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.download_button("⬇️ Per-loan EMI (CSV)", loans.round(2).to_csv(index=False),
+                                       file_name="portfolio_emi.csv", mime="text/csv")
+                with col2:
+                    st.download_button("⬇️ Monthly Cash Flows (CSV)", cashflows.to_csv(index=False),
+                                       file_name="portfolio_cashflows.csv", mime="text/csv")
@@ -0,0 +1,56 @@
+"""Market Forecast page."""
+import streamlit as st
+
+from smartagri.charts import price_forecast_chart
+from smartagri.forecast import DEFAULT_PRICE_DIR, available_crops, forecast, history
+from smartagri.perf import timed
+from views.common import save_result
+
+
+def render():
+    st.header("📈 Market Price Forecast")
+    
+    crops = available_crops()
+    if not crops:
+        st.warning(f"No price history found. Add mandi price CSV/Parquet files to {DEFAULT_PRICE_DIR}")
+    else:
+        col1, col2 = st.columns(2)
+        with col1:
+            crop = st.selectbox("Select Crop", crops)
+        with col2:
+            days = st.slider("Forecast Days", 7, 60, 30)
+        history_days = st.select_slider("Price History", options=[90, 365, 730, 0], value=90,
+                                        format_func=lambda d: f"{d} days" if d else "All")
+    
+        if st.button("Show Forecast", type="primary"):
+            st.session_state.market_data = (crop, days, history_days)
+        
+        if st.session_state.market_data and st.session_state.market_data[0] in crops:
+            crop, days, history_days = st.session_state.market_data
+            model, dates, prices, lower, upper = forecast(crop, days)
+            hist_dates, hist_prices = history(crop, days=history_days)
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Current Price", f"₹{int(model.last_price)}/q")
+            with col2:
+                st.metric("Expected Price", f"₹{int(prices[-1])}/q", 
+                         f"{((prices[-1]-model.last_price)/model.last_price*100):+.1f}%")
+            with col3:
+                st.metric("Peak Price", f"₹{int(max(prices))}/q")
+        
+            with timed("chart.price_forecast"):
+                fig = price_forecast_chart(crop, hist_dates, hist_prices, dates, prices, lower, upper,
+                                           st.session_state.plotly_template)
+                st.plotly_chart(fig, use_container_width=True)
+            st.caption(f"Based on mandi prices up to {model.last_date}. "
+                       f"Model: weekly seasonality + damped trend (α={model.alpha:.2f}, β={model.beta:.2f}, φ={model.phi:.2f}).")
+            
+            if st.button("💾 Save Forecast"):
+                # The data date is part of the inputs, so new prices give a new record
+                save_result("market", {"crop": crop, "days": days, "as_of": str(model.last_date)},
+                            {"current_price": round(float(model.last_price), 2),
+                             "expected_price": round(float(prices[-1]), 2),
+                             "peak_price": round(float(max(prices)), 2),
+                             "peak_date": str(dates[int(prices.argmax())])[:10],
+                             "low": round(float(lower[-1]), 2), "high": round(float(upper[-1]), 2)})
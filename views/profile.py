@@ -0,0 +1,171 @@
+"""My Profile page."""
+import json
+from datetime import datetime
+
+import streamlit as st
+
+from smartagri.crops import SOILS
+from smartagri.profile import (FARMING_GOALS, FARMING_TYPES, IRRIGATION_METHODS, PROFILE_CROPS,
+                               farmer_badge)
+from smartagri.profilestore import normalize_phone
+from smartagri.regions import ALL_INDIAN_STATES
+from views.common import load_saved_profile, profile_store
+
+
+def render():
+    st.header("👨‍🌾 My Farmer Profile")
+    load_saved_profile()
+    
+    if not st.session_state.profile_complete:
+        st.info("📝 Please complete your profile to get personalized farming recommendations!")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("📋 Personal Information")
+        name = st.text_input("Full Name *", 
+                            value=st.session_state.farmer_profile.get('name', ''),
+                            placeholder="Enter your full name")
+        
+        col_a, col_b = st.columns(2)
+        with col_a:
+            age = st.number_input("Age", 18, 100, 
+                                 value=st.session_state.farmer_profile.get('age', 35))
+        with col_b:
+            phone = st.text_input("Mobile Number *", 
+                                 value=st.session_state.farmer_profile.get('phone', ''),
+                                 placeholder="+91 XXXXXXXXXX")
+        
+        state = st.selectbox("State *", ALL_INDIAN_STATES,
+                            index=ALL_INDIAN_STATES.index(st.session_state.farmer_profile.get('state', 'Tamil Nadu')) 
+                            if st.session_state.farmer_profile.get('state') in ALL_INDIAN_STATES else 0)
+        
+        district = st.text_input("District", 
+                                value=st.session_state.farmer_profile.get('district', ''),
+                                placeholder="Enter your district")
+        
+        st.markdown("---")
+        st.subheader("🌾 Farm Details")
+        
+        col_a, col_b = st.columns(2)
+        with col_a:
+            land_size = st.number_input("Total Land (acres) *", 0.1, 10000.0,
+                                       value=float(st.session_state.farmer_profile.get('land', 2.0)), 
+                                       step=0.5)
+        with col_b:
+            soil_type = st.selectbox("Primary Soil Type *", 
+                                    SOILS,
+                                    index=SOILS.index(
+                                        st.session_state.farmer_profile.get('soil', 'Loamy')
+                                    ) if st.session_state.farmer_profile.get('soil') in SOILS else 0)
+        
+        irrigation_type = st.multiselect("Irrigation Methods Available", 
+                                        IRRIGATION_METHODS,
+                                        default=st.session_state.farmer_profile.get('irrigation', []))
+        
+        current_crops = st.multiselect("Current/Previous Crops Grown", 
+                                      PROFILE_CROPS,
+                                      default=st.session_state.farmer_profile.get('crops', []))
+        
+        farming_exp = st.slider("Years of Farming Experience", 0, 50, 
+                               st.session_state.farmer_profile.get('experience', 5))
+        
+        st.markdown("---")
+        st.subheader("🎯 Preferences & Goals")
+        
+        farming_type = st.radio("Farming Type", 
+                               FARMING_TYPES,
+                               index=FARMING_TYPES.index(
+                                   st.session_state.farmer_profile.get('farming_type', 'Traditional')
+                               ) if st.session_state.farmer_profile.get('farming_type') in FARMING_TYPES else 0)
+        
+        goals = st.multiselect("Primary Farming Goals",
+                              FARMING_GOALS,
+                              default=st.session_state.farmer_profile.get('goals', []))
+        
+        if st.button("💾 Save Profile", type="primary", use_container_width=True):
+            token = st.session_state.farmer_token
+            owner = profile_store().token_for(phone) if normalize_phone(phone) else None
+            if owner and owner != token:
+                st.error("❌ This mobile number already has a profile. Open your profile link to edit it.")
+            elif name and normalize_phone(phone) and land_size > 0:
+                profile = {
+                    'name': name,
+                    'age': age,
+                    'phone': phone,
+                    'state': state,
+                    'district': district,
+                    'land': land_size,
+                    'soil': soil_type,
+                    'irrigation': irrigation_type,
+                    'crops': current_crops,
+                    'experience': farming_exp,
+                    'farming_type': farming_type,
+                    'goals': goals,
+                    'created_date': datetime.now().strftime("%Y-%m-%d")
+                }
+                # The session's own profile is updated in place, even if the number changed
+                if not (token and profile_store().update_by_token(token, profile)):
+                    profile_store().upsert(profile)
+                    token = profile_store().token_for(phone)
+                st.session_state.farmer_profile = profile_store().get_by_token(token)
+                st.session_state.farmer_token = token
+                st.session_state.profile_complete = True
+                # Bookmark this link to come back to the profile; it is the only way to open it
+                st.query_params["farmer"] = st.session_state.farmer_token
+                st.success("✅ Profile saved successfully!")
+                st.balloons()
+                st.rerun()
+            else:
+                st.error("❌ Please fill all required fields marked with *")
+    
+    with col2:
+        st.subheader("📊 Profile Summary")
+        
+        if st.session_state.profile_complete:
+            profile_completeness = 100
+            st.metric("Profile Completion", f"{profile_completeness}%")
+            st.progress(profile_completeness / 100)
+            
+            st.markdown("---")
+            st.metric("Total Queries", len(st.session_state.chat_history))
+            st.metric("Saved Recommendations", len(st.session_state.saved_recommendations))
+            
+            st.markdown("---")
+            st.subheader("🎖️ Farmer Badge")
+            level, badge = farmer_badge(farming_exp)
+            getattr(st, level)(badge)
+        else:
+            st.metric("Profile Completion", "0%")
+            st.progress(0)
+            st.warning("Complete your profile to unlock personalized features!")
+        
+        st.markdown("---")
+        st.subheader("🔗 Quick Links")
+        st.markdown("📞 [Kisan Call Centre](tel:18001801551)")
+        st.markdown("🌐 [PM-KISAN Portal](https://pmkisan.gov.in)")
+        st.markdown("📱 [eNAM Market](https://enam.gov.in)")
+        st.markdown("🏛️ [KVK Directory](https://kvk.icar.gov.in)")
+        
+        st.markdown("---")
+        if st.session_state.profile_complete:
+            st.subheader("⚙️ Profile Actions")
+            if st.button("🗑️ Clear Profile", use_container_width=True):
+                # Only the session holding the profile's token may delete the stored record
+                if st.session_state.farmer_token:
+                    profile_store().delete_by_token(st.session_state.farmer_token)
+                st.query_params.pop("farmer", None)
+                st.session_state.farmer_profile = {}
+                st.session_state.farmer_token = None
+                st.session_state.profile_complete = False
+                st.warning("Profile cleared!")
+                st.rerun()
+            
+            profile_json = json.dumps(st.session_state.farmer_profile, indent=2)
+            st.download_button(
+                label="📥 Download Profile",
+                data=profile_json,
+                file_name="farmer_profile.json",
+                mime="application/json",
+                use_container_width=True
+            )
@@ -0,0 +1,30 @@
+"""Government Schemes page."""
+import streamlit as st
+
+
+def render():
+    st.header("🏛️ Government Schemes for Farmers")
+    
+    tabs = st.tabs(["Income Support", "Insurance", "Subsidies"])
+    
+    with tabs[0]:
+        st.subheader("💰 PM-KISAN")
+        st.info("**Benefit:** ₹6,000/year (₹2,000 every 4 months)")
+        st.info("**Eligibility:** All landholding farmers")
+        st.info("**Apply:** pmkisan.gov.in")
+        
+        if st.button("Check PM-KISAN Status"):
+            st.success("Visit: pmkisan.gov.in → Beneficiary Status")
+    
+    with tabs[1]:
+        st.subheader("🛡️ PM Fasal Bima Yojana")
+        st.info("**Premium:** 2% for Kharif, 1.5% for Rabi")
+        st.info("**Coverage:** Natural calamities, pests, diseases")
+        st.info("**Apply:** pmfby.gov.in or through banks")
+    
+    with tabs[2]:
+        st.subheader("🚜 Available Subsidies")
+        st.info("• Drip/Sprinkler: 50-90% subsidy")
+        st.info("• Farm Machinery: 40-80% subsidy")
+        st.info("• Solar Pump: 60-90% subsidy")
+        st.info("Contact: District Agriculture Office")
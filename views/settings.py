@@ -0,0 +1,158 @@
+"""Settings page: theme, language, usage statistics and timings."""
+from datetime import datetime
+
+import streamlit as st
+
+from smartagri.lang import LANGUAGES
+from smartagri.perf import ENABLED as PERF_ENABLED
+from smartagri.perf import export_json, reset as reset_perf, snapshot
+from views.common import load_saved_profile, saved_store, set_theme
+
+
+def render():
+    st.header("⚙️ Settings & Preferences")
+    load_saved_profile()
+    
+    tabs = st.tabs(["🎨 Appearance", "🌐 Language", "📊 Statistics", "⚡ Performance", "ℹ️ About"])
+    
+    with tabs[0]:
+        st.subheader("🎨 Theme Settings")
+        col1, col2 = st.columns(2)
+        with col1:
+            theme = st.radio("Select Theme", ["Light", "Dark"], 
+                            index=0 if st.session_state.theme == "light" else 1)
+        with col2:
+            st.markdown("#### Preview")
+            if theme == "Dark":
+                st.markdown("🌙 Dark mode selected")
+                st.info("Comfortable for night use")
+            else:
+                st.markdown("☀️ Light mode selected")
+                st.info("Better for daytime use")
+        
+        if st.button("Apply Theme", type="primary"):
+            st.session_state.theme = theme.lower()
+            set_theme(st.session_state.theme)
+            st.success(f"✅ Theme changed to {theme}!")
+            st.rerun()
+    
+    with tabs[1]:
+        st.subheader("🌐 Language Settings")
+        col1, col2 = st.columns(2)
+        with col1:
+            lang = st.selectbox("Select Language", LANGUAGES,
+                               index=LANGUAGES.index(st.session_state.language))
+        with col2:
+            st.markdown("#### Language Support")
+            st.info("✅ English - Full Support")
+            st.info("✅ Hindi - Full Support")
+            st.info("✅ Tamil - Full Support")
+        
+        if st.button("Apply Language", type="primary"):
+            st.session_state.language = lang
+            st.success(f"✅ Language changed to {lang}!")
+            st.rerun()
+    
+    with tabs[2]:
+        st.subheader("📊 Your Usage Statistics")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Chat Queries", len(st.session_state.chat_history))
+        with col2:
+            st.metric("Saved Items", len(st.session_state.saved_recommendations))
+        with col3:
+            days_active = (datetime.now() - datetime.strptime(
+                st.session_state.farmer_profile.get('created_date', datetime.now().strftime("%Y-%m-%d")), 
+                "%Y-%m-%d")).days if st.session_state.farmer_profile else 0
+            st.metric("Days Active", days_active)
+        
+        st.markdown("---")
+        st.subheader("🗂️ Data Management")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🗑️ Clear Chat History", use_container_width=True):
+                st.session_state.chat_history.clear()
+                st.success("Chat history cleared!")
+                st.rerun()
+        
+        with col2:
+            if st.button("🗑️ Clear Saved Items (this session)", use_container_width=True,
+                         help="Empties this session's list; results already saved are kept."):
+                st.session_state.saved_recommendations = []
+                st.success("Saved items cleared from this session!")
+                st.rerun()
+        
+        if st.session_state.saved_recommendations:
+            saved = saved_store().to_frame(ids=st.session_state.saved_recommendations)
+            st.download_button("⬇️ Export Saved Items (CSV)", saved.to_csv(index=False),
+                               file_name="saved_items.csv", mime="text/csv", use_container_width=True)
+    
+    with tabs[3]:
+        st.subheader("⚡ Performance")
+        if not PERF_ENABLED:
+            st.info("Timing is disabled (SMARTAGRI_PERF=0).")
+        else:
+            st.caption("Wall time per page, chart and theme update since the server started "
+                       "(all sessions). Percentiles are estimated from log-scale buckets.")
+            metrics = snapshot()
+            if metrics:
+                import pandas as pd
+                st.dataframe(pd.DataFrame(metrics).round(2), use_container_width=True, hide_index=True)
+            else:
+                st.write("No timings recorded yet.")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button("📥 Export JSON", export_json(), file_name="smartagri_perf.json",
+                                   mime="application/json", use_container_width=True)
+            with col2:
+                if st.button("🔄 Reset Timings", use_container_width=True):
+                    reset_perf()
+                    st.rerun()
+    
+    with tabs[4]:
+        st.subheader("ℹ️ About SmartAgri AI")
+        
+        st.markdown("""
+        **SmartAgri AI** is a comprehensive digital farming companion designed to empower 
+        Indian farmers with technology-driven insights and recommendations.
+        
+        ### 🌟 Key Features:
+        - 🌱 **AI-Powered Crop Recommendations**
+        - 📈 **Market Price Forecasting**
+        - 🌤️ **Weather-Based Advisories**
+        - 🦠 **Disease Detection & Treatment**
+        - 💰 **Loan & Fertilizer Calculators**
+        - 🏛️ **Government Schemes Information**
+        - 💬 **24/7 AI Chatbot Assistance**
+        
+        ### 📞 Support:
+        - **Kisan Call Centre:** 1800-180-1551 (Toll-Free)
+        - **Email:** support@smartagri.ai
+        - **Website:** www.smartagri.ai
+        
+        ### 🔒 Privacy:
+        Your data is stored locally and never shared with third parties.
+        
+        ---
+        **Version:** 2.0.0  
+        **Last Updated:** October 2024  
+        **Made with ❤️ for Indian Farmers**
+        """)
+        
+        st.markdown("---")
+        st.subheader("📋 Terms & Privacy")
+        if st.checkbox("View Terms of Service"):
+            st.info("""
+            By using SmartAgri AI, you agree to use the recommendations as guidelines only. 
+            Always consult with local agricultural experts for final decisions. 
+            We are not liable for crop failures or financial losses.
+            """)
+        
+        if st.checkbox("View Privacy Policy"):
+            st.info("""
+            We respect your privacy. All personal information is stored in this app's local database. 
+            We do not collect, store, or share your personal data with any third parties.
+            """)
@@ -0,0 +1,61 @@
+"""State Insights page."""
+import streamlit as st
+
+from smartagri.charts import crop_trend_chart, state_crops_chart
+from smartagri.insights import DEFAULT_PRODUCTION_FILE, load_production
+from smartagri.lang import LANG
+from smartagri.perf import timed
+from smartagri.regions import ALL_INDIAN_STATES
+
+
+def render():
+    st.header(f"🗺️ {LANG[st.session_state.language]['state_insights']}")
+
+    cube = load_production()
+    if cube is None:
+        st.warning(f"No crop production data found. Add a district-level CSV at {DEFAULT_PRODUCTION_FILE}")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        states = [s for s in ALL_INDIAN_STATES if s in cube]
+        state = st.selectbox("Select State", states)
+    with col2:
+        year = st.selectbox("Year", cube.years[::-1].tolist())
+
+    crops = cube.state_crops(state, year)
+    area, production = cube.state_totals(state, year)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Crop Area", f"{area / 1000:,.0f}k ha")
+    with col2:
+        st.metric("Production", f"{production / 1000:,.0f}k t")
+    with col3:
+        st.metric("Crops Grown", len(crops))
+
+    if st.button(f"📊 {LANG[st.session_state.language]['show_graph']}", type="primary"):
+        st.session_state.show_state_graph = True
+
+    if st.session_state.show_state_graph and crops:
+        st.session_state.state_crops = [row[0] for row in crops]
+        with timed("chart.state_crops"):
+            fig = state_crops_chart([row[0] for row in crops], [row[2] for row in crops],
+                                    f"Crop Production in {state}, {year}",
+                                    st.session_state.plotly_template)
+            st.plotly_chart(fig, use_container_width=True)
+
+    if crops:
+        st.markdown("---")
+        st.subheader("🔍 Crop Drill-down")
+        crop = st.selectbox("Crop", [row[0] for row in crops])
+        years, crop_area, _, yields = cube.trend(state, crop)
+        with timed("chart.crop_trend"):
+            fig = crop_trend_chart(years, crop_area, yields, f"{crop} in {state}",
+                                   st.session_state.plotly_template)
+            st.plotly_chart(fig, use_container_width=True)
+
+        st.markdown(f"#### 🏘️ Districts, {year}")
+        st.dataframe([{"District": district, "Area (ha)": round(a), "Production (t)": round(p),
+                       "Yield (t/ha)": round(y, 2)}
+                      for district, a, p, y in cube.district_breakdown(state, crop, year)],
+                     use_container_width=True, hide_index=True)
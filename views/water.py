@@ -0,0 +1,101 @@
+"""Water Management page."""
+from datetime import date
+
+import streamlit as st
+
+from smartagri.charts import water_balance_chart
+from smartagri.crops import SOILS
+from smartagri.irrigation import (APPLICATION_EFFICIENCY, PLOT_COLUMNS, WATER_CROPS, crop_stage,
+                                  schedule_field, schedule_plots)
+from smartagri.lang import LANG
+from smartagri.perf import timed
+from smartagri.regions import ALL_INDIAN_STATES
+
+
+def render():
+    st.header(f"💧 {LANG[st.session_state.language]['water_management']}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        state = st.selectbox("State", ALL_INDIAN_STATES)
+        crop = st.selectbox("Crop", WATER_CROPS)
+        sowing_date = st.date_input("Sowing Date", date.today())
+
+    with col2:
+        soil = st.selectbox("Soil Type", SOILS)
+        method = st.selectbox("Irrigation Method", list(APPLICATION_EFFICIENCY))
+        area = st.number_input("Area (acres)", 0.5, 100.0, 5.0, 0.5)
+
+    if st.button(LANG[st.session_state.language]["calculate"], type="primary"):
+        st.session_state.water_calc = (state, crop, soil, method, sowing_date, area)
+
+    if st.session_state.water_calc:
+        state, crop, soil, method, sowing_date, area = st.session_state.water_calc
+        with timed("irrigation.schedule_field"):
+            dates, balance = schedule_field(state, crop, soil, method, sowing_date)
+        etc, irrigation, gross = balance["etc"][0], balance["irrigation"][0], balance["gross"][0]
+        events = irrigation.nonzero()[0]
+
+        st.subheader(f"🌱 {crop} in {state}, sown {sowing_date:%d %b %Y}")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Crop Water Use", f"{etc.sum():,.0f} mm")
+        with col2:
+            st.metric("Net Irrigation", f"{irrigation.sum():,.0f} mm")
+        with col3:
+            # 1 mm over 1 acre is 4.047 m3
+            st.metric("Water to Apply", f"{gross.sum() * area * 4.047:,.0f} m³",
+                      delta=f"{method}, {APPLICATION_EFFICIENCY[method]:.0%} efficient",
+                      delta_color="off")
+        with col4:
+            st.metric("Irrigations", len(events))
+
+        with timed("chart.water_balance"):
+            fig = water_balance_chart(dates, etc, balance["rain"], irrigation, balance["depletion"][0],
+                                      float(balance["raw"][0]), f"Season Water Balance: {crop}",
+                                      st.session_state.plotly_template)
+            st.plotly_chart(fig, use_container_width=True)
+
+        st.subheader("📅 Irrigation Schedule")
+        if len(events) == 0:
+            st.success("✅ Expected rainfall covers this crop - no irrigation planned in an average year.")
+        else:
+            import pandas as pd
+            schedule = pd.DataFrame({
+                "Date": dates[events].astype("datetime64[D]").astype(str),
+                "Day": events + 1,
+                "Stage": [crop_stage(crop, day) for day in events],
+                "Net (mm)": irrigation[events],
+                "Gross (mm)": gross[events],
+                "Water (m³)": gross[events] * area * 4.047,
+            }).round(1)
+            st.dataframe(schedule, use_container_width=True, hide_index=True)
+            st.download_button("⬇️ Download Schedule (CSV)", schedule.to_csv(index=False),
+                               file_name=f"irrigation_{crop.lower()}_{sowing_date}.csv", mime="text/csv")
+        st.caption("Planned from state climate normals with FAO-56 Penman-Monteith ET0; "
+                   "adjust for actual rain.")
+
+    st.markdown("---")
+    with st.expander("📁 Plot Schedules"):
+        st.markdown(f"Upload a CSV of plots with columns {', '.join(f'`{c}`' for c in PLOT_COLUMNS)} "
+                    "(sowing date as YYYY-MM-DD, area in acres).")
+        plots_file = st.file_uploader("Plots", type=["csv"])
+        if plots_file is not None:
+            import pandas as pd
+            try:
+                with timed("irrigation.schedule_plots"):
+                    plots = schedule_plots(pd.read_csv(plots_file, parse_dates=["sowing_date"]))
+            except ValueError as exc:
+                st.error(f"Could not read plots: {exc}")
+            else:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Plots", f"{len(plots):,}")
+                with col2:
+                    st.metric("Irrigations", f"{plots['irrigations'].sum():,}")
+                with col3:
+                    st.metric("Water to Apply", f"{plots['water_m3'].sum():,.0f} m³")
+                summary = plots.groupby("crop")[["area", "water_m3"]].sum().round(1)
+                st.dataframe(summary, use_container_width=True)
+                st.download_button("⬇️ Per-plot Schedule (CSV)", plots.round(1).to_csv(index=False),
+                                   file_name="plot_irrigation.csv", mime="text/csv")
@@ -0,0 +1,48 @@
+"""Weather Insights page."""
+from datetime import datetime
+
+import streamlit as st
+
+from smartagri.regions import ALL_INDIAN_STATES
+from smartagri.weather import weather_advisory
+from views.common import weather_service
+
+
+def render():
+    st.header("🌤️ Weather Forecast")
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        location = st.selectbox("Select Location", ALL_INDIAN_STATES)
+    with col2:
+        st.markdown("")
+        if st.button("Get 7-Day Forecast", type="primary", use_container_width=True):
+            st.session_state.weather_data = True
+    
+    if st.session_state.weather_data:
+        forecast_7d = weather_service().fetch(location)
+        days = [d.astype(datetime).strftime("%a") for d in forecast_7d.dates]
+        temps_max = forecast_7d.temp_max
+        temps_min = forecast_7d.temp_min
+        rainfall = forecast_7d.rainfall
+        
+        cols = st.columns(7)
+        for i, day in enumerate(days):
+            with cols[i]:
+                icon = "☀️" if rainfall[i] < 5 else "🌧️"
+                st.markdown(f"""
+                <div style='background:#4B8B3B; color:white; padding:15px; 
+                           border-radius:10px; text-align:center;'>
+                <h4>{day}</h4>
+                <p style='font-size:28px;'>{icon}</p>
+                <p><b>{temps_max[i]:.0f}°C</b></p>
+                <p>{temps_min[i]:.0f}°C</p>
+                <p>💧{rainfall[i]:.0f}mm</p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.caption(f"Updated {datetime.fromtimestamp(forecast_7d.fetched_at).strftime('%d %b %H:%M')}")
+        st.markdown("---")
+        st.subheader("🌾 Farming Advisory")
+        level, advisory = weather_advisory(rainfall)
+        getattr(st, level)(advisory)